@@ -0,0 +1,108 @@
+"""
+Memory and access latency of Announcement records compared with the list and dict rows they replaced.
+
+Builds the same rows three ways from raw board columns and reports the tracemalloc size of
+each collection, the time to build it, and the time of the typical consumer operations
+(reading the title of every row, 30-day filter, sort by date).
+
+Usage (from the repository root):
+    python -m benchmarks.announcement_bench
+    python -m benchmarks.announcement_bench --rows 1000000
+"""
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+from src.boards.announcement import HEADERS, Announcement
+
+
+def _raw_rows(count: int) -> list[list[str]]:
+    start = date(2024, 3, 1)
+    return [
+        [str(number), f"{number}번 공지 장학 안내 & 신청", "학과사무실", f"{number * 3:,}",
+         (start - timedelta(days=(count - number) // 50)).isoformat()]
+        for number in range(count, 0, -1)
+    ]
+
+
+def _as_list(row: list[str]) -> list[str]:
+    # 예전 행 형식: 조회수 쉼표만 정리한 문자열 목록
+    return [row[0], row[1], row[2], row[3].replace(",", ""), row[4]]
+
+
+def _as_dict(row: list[str]) -> dict:
+    return dict(zip(HEADERS, _as_list(row)))
+
+
+def _measure(build, raw: list[list[str]]):
+    # 추적 중에는 생성이 몇 배 느려지므로 시간은 추적 없이 따로 잼
+    start = time.perf_counter()
+    rows = [build(row) for row in raw]
+    elapsed = time.perf_counter() - start
+    del rows
+    gc.collect()
+    tracemalloc.start()
+    rows = [build(row) for row in raw]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return rows, elapsed, size
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run(count: int) -> list[dict]:
+    raw = _raw_rows(count)
+    cutoff = (datetime(2024, 3, 1) - timedelta(days=30)).date()
+    cutoff_text = cutoff.isoformat()
+    kinds = {
+        # 행 형식 -> (생성, 제목 읽기, 최근 30일 필터, 정렬 키)
+        "list": (_as_list, lambda r: r[1], lambda r: r[4] >= cutoff_text, lambda r: r[4]),
+        "dict": (_as_dict, lambda r: r["제목"], lambda r: r["등록일"] >= cutoff_text, lambda r: r["등록일"]),
+        "Announcement": (
+            Announcement.from_row, lambda a: a.title,
+            lambda a: a.date is not None and a.date >= cutoff, lambda a: (a.date is not None, a.date or date.min),
+        ),
+    }
+
+    results = []
+    for name, (build, title, recent, sort_key) in kinds.items():
+        rows, build_seconds, size = _measure(build, raw)
+        results.append({
+            "kind": name,
+            "rows": count,
+            "mib": round(size / 2 ** 20, 1),
+            "bytes_per_row": round(size / count),
+            "build_ms": round(build_seconds * 1000, 1),
+            "title_access_ms": round(_timed(lambda: [title(r) for r in rows]) * 1000, 1),
+            "filter_30_days_ms": round(_timed(lambda: [r for r in rows if recent(r)]) * 1000, 1),
+            "sort_by_date_ms": round(_timed(lambda: sorted(rows, key=sort_key, reverse=True)) * 1000, 1),
+        })
+        del rows
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Memory/latency benchmark of Announcement records.")
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    results = run(args.rows)
+    for result in results:
+        print(f"{result['kind']:>12}: {result['mib']:>6.1f} MiB ({result['bytes_per_row']} B/row), "
+              f"build {result['build_ms']} ms, title {result['title_access_ms']} ms, "
+              f"filter {result['filter_30_days_ms']} ms, "
+              f"sort {result['sort_by_date_ms']} ms")
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Full-crawl wall time and request count against the local replay stub.
+
+Compares sequential page fetching (max_workers=1) with the concurrent sliding window
+for boards of 1, 10 and 50 pages, with a simulated per-response server latency.
+
+Usage (from the repository root):
+    python -m benchmarks.crawl_bench
+    python -m benchmarks.crawl_bench --pages 1,10,50,200 --workers 1,4,8 --server-latency 0.05
+"""
+import argparse
+import json
+import logging
+import sys
+import time
+
+from benchmarks.replay import ReplayServer
+
+
+def crawl(server: ReplayServer, board_id: str, workers: int) -> dict:
+    from src.boards.board_source import BoardSource
+
+    board = BoardSource(server.base_url.format(board_id=board_id), max_workers=workers)
+    requests_before = server.requests
+    start = time.perf_counter()
+    announcements = board.fetch_announcements()
+    elapsed = time.perf_counter() - start
+    return {
+        "pages": server.pages,
+        "workers": workers,
+        "seconds": round(elapsed, 3),
+        "requests": server.requests - requests_before,
+        "rows": len(announcements),
+        "complete": announcements.complete,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Crawl benchmark against the local replay stub.")
+    parser.add_argument("--pages", default="1,10,50", help="Comma-separated board sizes in pages.")
+    parser.add_argument("--workers", default="1,4", help="Comma-separated max_workers values.")
+    parser.add_argument("--server-latency", type=float, default=0.05, help="Seconds added to every response.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    from src.boards.host_limiter import host_limiter
+
+    # 레지스트리의 요청 간격은 실제 서버용이므로 로컬 스텁에서는 동시 연결 수만 제한
+    host_limiter.configure(max_per_host=16, min_interval=0.0)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    results = []
+    for pages in (int(p) for p in args.pages.split(",")):
+        server = ReplayServer(pages, args.server_latency)
+        try:
+            for workers in (int(w) for w in args.workers.split(",")):
+                # 게시판마다 새 BoardSource와 다른 board_id를 써서 페이지 캐시를 재사용하지 않음
+                result = crawl(server, f"BENCH_{pages}_{workers}", workers)
+                results.append(result)
+                print(f"{pages:>4} pages, {workers:>2} worker(s): {result['seconds']:>7.3f}s, "
+                      f"{result['requests']} requests, {result['rows']} rows", flush=True)
+        finally:
+            server.stop()
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+Peak memory and time of the streaming report writers at growing row counts.
+
+Every (format, size) pair runs in a fresh subprocess, so ru_maxrss is that export's own peak.
+Rows are generated lazily in the shape the store yields them, so the numbers show what the
+writer itself holds on to.
+
+Usage (from the repository root):
+    python -m benchmarks.export_bench
+    python -m benchmarks.export_bench --sizes 10000,100000 --formats csv,pdf
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+
+def _rows(count: int):
+    from src.boards.announcement import Announcement
+
+    start = date(2024, 3, 1)
+    for number in range(count, 0, -1):
+        yield "computer", Announcement(
+            number, f"{number}번 공지 장학 안내 & 신청", "학과사무실", number * 3,
+            start - timedelta(days=(count - number) // 50), f"https://www.hanbat.ac.kr/view.do?nttId={number}",
+        )
+
+
+def run_one(format: str, size: int) -> dict:
+    """
+    Export size rows in the given format in this process.
+    :return: Elapsed seconds, peak RSS before and after the export (MiB) and the output size.
+    """
+    from src.exports.stream_reports import StreamingReportFactory
+
+    writer = StreamingReportFactory().create_report(format)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        path = writer.generate(_rows(size), os.path.join(directory, f"bench.{writer.extension}"))
+        elapsed = time.perf_counter() - start
+        output_bytes = os.path.getsize(path)
+    return {
+        "format": format,
+        "rows": size,
+        "seconds": round(elapsed, 2),
+        "rows_per_second": round(size / elapsed),
+        "peak_rss_mib": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "baseline_rss_mib": round(rss_before, 1),
+        "output_mib": round(output_bytes / 2 ** 20, 1),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Peak-RSS benchmark of the streaming report writers.")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Comma-separated row counts.")
+    parser.add_argument("--formats", default="csv,jsonl,excel,pdf", help="Comma-separated formats.")
+    parser.add_argument("--child", nargs=2, metavar=("FORMAT", "SIZE"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_one(args.child[0], int(args.child[1]))))
+        return 0
+
+    results = []
+    for format in args.formats.split(","):
+        for size in (int(size) for size in args.sizes.split(",")):
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.export_bench", "--child", format, str(size)],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            results.append(result)
+            print(f"{format:>6} {size:>9} rows: {result['seconds']:>8.2f}s {result['rows_per_second']:>8}/s "
+                  f"peak RSS {result['peak_rss_mib']:>7.1f} MiB (baseline {result['baseline_rss_mib']:.1f}), "
+                  f"output {result['output_mib']:.1f} MiB", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Delivery throughput of the notification fan-out against a fake Bot API sender.
+
+The sender sleeps for a simulated API latency and answers a share of calls with 429
+(RetryAfter), so the figure includes the cost of requeued retries.
+
+Usage (from the repository root):
+    python -m benchmarks.notifier_bench
+    python -m benchmarks.notifier_bench --chats 1000 --global-rate 30 --rate-limited 0.05
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import logging
+from datetime import date, timedelta
+
+
+async def run(chats: int, global_rate: float, latency: float, rate_limited: float, retry_after: float, seed: int) -> dict:
+    from telegram.error import RetryAfter
+    from src.boards.announcement import Announcement
+    from src.bot.notifier import Notifier
+
+    rng = random.Random(seed)
+    limited = {"count": 0}
+
+    async def send(chat_id, text):
+        await asyncio.sleep(latency)
+        if rng.random() < rate_limited:
+            limited["count"] += 1
+            raise RetryAfter(timedelta(seconds=retry_after))
+
+    notifier = Notifier(send, global_rate=global_rate)
+    announcements = [Announcement(n, f"{n}번 장학금 신청 안내", "학과사무실", 0, date(2024, 3, 1)) for n in range(5, 0, -1)]
+    notifier.start()
+    start = time.perf_counter()
+    notifier.notify(list(range(1, chats + 1)), "computer", announcements)
+    await notifier.join()
+    elapsed = time.perf_counter() - start
+    await notifier.stop()
+    return {
+        "chats": chats,
+        "global_rate": global_rate,
+        "seconds": round(elapsed, 2),
+        "deliveries_per_second": round(notifier.stats["delivered"] / elapsed, 2),
+        "delivered": notifier.stats["delivered"],
+        "retried": notifier.stats["retried"],
+        "failed": notifier.stats["failed"],
+        "rate_limited": limited["count"],
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Throughput benchmark of the notification fan-out.")
+    parser.add_argument("--chats", type=int, default=250, help="Subscribed chats, one message each.")
+    parser.add_argument("--global-rate", type=float, default=25.0, help="Notifier's messages-per-second limit.")
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated Bot API latency in seconds.")
+    parser.add_argument("--rate-limited", type=float, default=0.02, help="Share of sends answered with 429.")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Seconds requested by each 429.")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    # 재시도마다 남는 경고 로그는 측정 결과만 보이도록 숨김
+    logging.basicConfig(level=logging.ERROR)
+    result = asyncio.run(run(args.chats, args.global_rate, args.latency, args.rate_limited, args.retry_after, args.seed))
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
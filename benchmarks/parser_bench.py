@@ -0,0 +1,90 @@
+"""
+Throughput and peak memory of the list page parser backends.
+
+Parses the recorded pages from benchmarks/fixtures/ when present, synthetic pages in the same
+markup otherwise. Peak memory is the tracemalloc peak of parsing one page, measured separately
+from the timed loop because tracing slows the parsers down.
+
+Usage (from the repository root):
+    python -m benchmarks.parser_bench
+    python -m benchmarks.parser_bench --iterations 500 --rows 50
+"""
+import argparse
+import glob
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+from benchmarks.replay import FIXTURES_DIR, synthetic_page
+
+TABLE_CLASS = "board_list table table-default"
+PAGINATION_CLASS = "pagination"
+
+
+def _pages(rows: int) -> list[str]:
+    paths = sorted(glob.glob(os.path.join(FIXTURES_DIR, "*", "page_*.html")))
+    if paths:
+        pages = []
+        for path in paths:
+            with open(path, encoding="utf-8") as file:
+                pages.append(file.read())
+        return pages
+    return [synthetic_page(page, 20, per_page=rows) for page in range(1, 21)]
+
+
+def bench(name: str, pages: list[str], iterations: int) -> dict:
+    from src.boards.page_parsers import PageParserFactory
+
+    parser = PageParserFactory().create_parser(name)
+    for html in pages:
+        parser.parse(html, TABLE_CLASS, PAGINATION_CLASS, 1)
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        parser.parse(pages[i % len(pages)], TABLE_CLASS, PAGINATION_CLASS, 1)
+    elapsed = time.perf_counter() - start
+
+    peaks = []
+    for html in pages[:5]:
+        tracemalloc.start()
+        parser.parse(html, TABLE_CLASS, PAGINATION_CLASS, 1)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return {
+        "parser": name,
+        "pages_per_second": round(iterations / elapsed, 1),
+        "ms_per_page": round(elapsed / iterations * 1000, 3),
+        "peak_kib_per_page": round(max(peaks) / 1024, 1),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmark of the list page parser backends.")
+    parser.add_argument("--iterations", type=int, default=200, help="Pages parsed per backend.")
+    parser.add_argument("--rows", type=int, default=10, help="Rows per synthetic page (ignored with fixtures).")
+    parser.add_argument("--parsers", default="html.parser,lxml,stream", help="Comma-separated backends.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR)
+    pages = _pages(args.rows)
+    page_kib = sum(len(html.encode("utf-8")) for html in pages) / len(pages) / 1024
+    print(f"{len(pages)} distinct pages, {page_kib:.1f} KiB on average")
+    results = []
+    for name in args.parsers.split(","):
+        try:
+            result = bench(name, pages, args.iterations)
+        except ValueError as e:
+            print(f"{name}: skipped ({e})")
+            continue
+        results.append(result)
+        print(f"{name:>12}: {result['pages_per_second']:>8.1f} pages/s, {result['ms_per_page']:>7.3f} ms/page, "
+              f"peak {result['peak_kib_per_page']:.1f} KiB/page")
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
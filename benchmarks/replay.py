@@ -0,0 +1,497 @@
+"""
+Offline replay benchmark for the whole bot pipeline.
+
+Board list pages are served from a local HTTP stub (recorded Hanbat pages from
+benchmarks/fixtures/ when present, synthetic pages in the same markup otherwise),
+and synthetic /board, /report and /view updates are fed into the registered handlers of a
+real TelegramBot whose Bot API calls go to an in-memory fake transport.
+
+Usage (from the repository root):
+    python -m benchmarks.replay                   # run and compare with benchmarks/baseline.json
+    python -m benchmarks.replay --update-baseline # run and store the results as the new baseline
+    python -m benchmarks.replay --record          # save the live board pages to benchmarks/fixtures/
+
+Exits with status 1 when p95 latency or throughput regresses past the baseline tolerance.
+Latencies are compared after scaling the baseline by a CPU calibration run (parsing the same
+synthetic pages on both machines), so a baseline recorded on a faster or slower machine still applies.
+"""
+import argparse
+import asyncio
+import datetime
+import itertools
+import json
+import os
+import random
+import re
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(BENCH_DIR, "fixtures")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+REGISTRY_PATH = os.path.join(BENCH_DIR, os.pardir, "src", "boards", "departments.json")
+
+MIN_DELTA_MS = 10.0  # 이보다 작은 p95 차이는 회귀로 보지 않음
+
+_LIST_PATH = re.compile(r"/prog/bbsArticle/([^/]+)/list\.do")
+_VIEW_PATH = re.compile(r"/prog/bbsArticle/([^/]+)/view\.do")
+
+
+def synthetic_page(page: int, pages: int, per_page: int = 10, dated_from: int = None) -> str:
+    """
+    Build a board list page in the markup of the Hanbat board (one pinned notice plus numbered posts).
+    Pages past the last one contain the 'nodata' row the real board returns.
+    Posts get a day every two numbers counting back from today at article number dated_from
+    (default: the newest one); newer posts are dated today, so adding pages never changes older rows.
+    """
+    total = pages * per_page
+    dated_from = total if dated_from is None else dated_from
+    if page > pages:
+        body = '<tr><td class="nodata" colspan="5">등록된 게시물이 없습니다.</td></tr>'
+    else:
+        rows = ['<tr class="notice"><td>공지</td><td class="subject"><a href="#">[필독] 학사 일정 안내</a></td>'
+                '<td>관리자</td><td>1,024</td><td>2024-03-02</td></tr>']
+        today = datetime.date.today()
+        for i in range(per_page):
+            number = total - (page - 1) * per_page - i
+            reg_date = today - datetime.timedelta(days=max(0, dated_from - number) // 2)
+            rows.append(
+                f'<tr><td>{number}</td><td class="subject"><a href="view.do?nttId={number}">{number}번 공지 장학 안내 &amp; 신청</a></td>'
+                f'<td>학과사무실</td><td>{number * 3}</td><td>{reg_date.isoformat()}</td></tr>'
+            )
+        body = "".join(rows)
+
+    first = (page - 1) // 10 * 10 + 1
+    links = "".join(f'<a href="?pageIndex={i}">{i}</a>' for i in range(first, min(first + 9, pages) + 1))
+    if page >= pages:
+        links += '<a aria-label="Next" class="disabled" href="#">다음</a>'
+    else:
+        links += f'<a aria-label="Next" href="?pageIndex={page + 1}">다음</a>'
+    return (
+        '<html><body><div class="board"><table class="board_list table table-default">'
+        '<thead><tr><th>번호</th><th>제목</th><th>작성자</th><th>조회수</th><th>등록일</th></tr></thead>'
+        f'<tbody>{body}</tbody></table><div class="pagination">{links}</div></div></body></html>'
+    )
+
+
+def synthetic_article(number: int) -> str:
+    """
+    Build an article page with a body and two attachments, using the registry's default classes.
+    """
+    paragraphs = "".join(f"<p>{number}번 공지의 {i}번째 문단입니다. 신청 기간과 제출 서류를 확인하세요.</p>" for i in range(1, 21))
+    return (
+        f'<html><body><div class="view_con">{paragraphs}</div>'
+        f'<ul class="view_file"><li><a href="/common/fileDown.do?fileId={number}-1">신청서_{number}.hwp</a></li>'
+        f'<li><a href="/common/fileDown.do?fileId={number}-2">안내문_{number}.pdf</a></li></ul></body></html>'
+    )
+
+
+class ReplayServer:
+    def __init__(self, pages: int, latency: float = 0.0):
+        """
+        Local HTTP stub serving /prog/bbsArticle/<board_id>/list.do?pageIndex=N and the article pages it links to.
+        :param pages: Number of synthetic pages per board (ignored for boards with recorded fixtures).
+        :param latency: Artificial delay in seconds added to every response.
+        """
+        self.pages = pages
+        self.dated_from = pages * 10  # 나중에 pages를 늘려도 기존 글의 날짜가 바뀌지 않도록 고정
+        self.latency = latency
+        self.requests = 0
+        # 장애 주입: 요청 경로(쿼리 포함)를 받아 응답할 HTTP 상태 코드나 지연 초(float)를 돌려주면
+        # 페이지 대신 그 상태로 응답하거나 그만큼 늦게 응답함. None이면 정상 응답.
+        self.fault = None
+        self._lock = threading.Lock()
+        self._fixtures = self._load_fixtures()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                fault = server.fault(self.path) if server.fault is not None else None
+                if isinstance(fault, int):
+                    self.send_error(fault)
+                    return
+                if isinstance(fault, float):
+                    time.sleep(fault)
+
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                if _LIST_PATH.fullmatch(url.path):
+                    page = int(query.get("pageIndex", ["1"])[0])
+                    body = server.page(_LIST_PATH.fullmatch(url.path).group(1), page)
+                elif _VIEW_PATH.fullmatch(url.path):
+                    body = synthetic_article(int(query.get("nttId", ["0"])[0]))
+                else:
+                    self.send_error(404)
+                    return
+                body = body.encode("utf-8")
+                if server.latency:
+                    time.sleep(server.latency)
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        class Server(ThreadingHTTPServer):
+            def handle_error(self, request, client_address):
+                # 클라이언트가 시간 초과로 먼저 끊은 연결은 무시
+                if not isinstance(sys.exc_info()[1], ConnectionError):
+                    super().handle_error(request, client_address)
+
+        self.server = Server(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    @staticmethod
+    def _load_fixtures() -> dict:
+        fixtures = {}
+        if not os.path.isdir(FIXTURES_DIR):
+            return fixtures
+        for board_id in os.listdir(FIXTURES_DIR):
+            board_dir = os.path.join(FIXTURES_DIR, board_id)
+            if not os.path.isdir(board_dir):
+                continue
+            for name in os.listdir(board_dir):
+                match = re.fullmatch(r"page_(\d+)\.html", name)
+                if match:
+                    with open(os.path.join(board_dir, name), encoding="utf-8") as file:
+                        fixtures[(board_id, int(match.group(1)))] = file.read()
+        return fixtures
+
+    def page(self, board_id: str, page: int) -> str:
+        if any(key[0] == board_id for key in self._fixtures):
+            return self._fixtures.get((board_id, page)) or synthetic_page(page, 0)
+        return synthetic_page(page, self.pages, dated_from=self.dated_from)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_port}/prog/bbsArticle/{{board_id}}/list.do"
+
+    def stop(self):
+        self.server.shutdown()
+
+
+def _build_fake_request():
+    from telegram.request import BaseRequest
+
+    class FakeRequest(BaseRequest):
+        """
+        In-memory Bot API transport: answers every call with a plausible result and never touches the network.
+        """
+
+        def __init__(self):
+            self.calls = 0
+            self.texts = []  # 보낸 메시지 본문 (sendMessage/editMessageText)
+            self._message_ids = itertools.count(1)
+
+        @property
+        def read_timeout(self):
+            return None
+
+        async def initialize(self):
+            pass
+
+        async def shutdown(self):
+            pass
+
+        async def do_request(self, url, method, request_data=None, read_timeout=None, write_timeout=None,
+                             connect_timeout=None, pool_timeout=None):
+            self.calls += 1
+            endpoint = url.rsplit("/", 1)[-1]
+            parameters = request_data.parameters if request_data is not None else {}
+            if endpoint == "getMe":
+                result = {"id": 1, "is_bot": True, "first_name": "Bench", "username": "bench_bot"}
+            elif endpoint in ("sendMessage", "editMessageText"):
+                self.texts.append(parameters.get("text", ""))
+                result = {
+                    "message_id": next(self._message_ids),
+                    "date": int(time.time()),
+                    "chat": {"id": parameters.get("chat_id", 0), "type": "private"},
+                    "text": parameters.get("text", ""),
+                }
+            else:
+                result = True
+            return 200, json.dumps({"ok": True, "result": result}).encode("utf-8")
+
+    return FakeRequest()
+
+
+def _command_update(bot, update_id: int, user_id: int, text: str):
+    from telegram import Update
+
+    command = text.split()[0]
+    return Update.de_json({
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": int(time.time()),
+            "chat": {"id": user_id, "type": "private"},
+            "from": {"id": user_id, "is_bot": False, "first_name": f"user{user_id}"},
+            "text": text,
+            "entities": [{"type": "bot_command", "offset": 0, "length": len(command)}],
+        },
+    }, bot)
+
+
+class BotUnderTest:
+    def __init__(self, server: ReplayServer, workdir: str, departments: list[dict] = None):
+        """
+        A TelegramBot wired to the replay server and the fake transport, with its database and
+        reports in a scratch directory so every instance starts with a cold cache.
+        :param departments: Registry department entries replacing the registered ones.
+        """
+        with open(REGISTRY_PATH, encoding="utf-8") as file:
+            registry = json.load(file)
+        registry["base_url"] = server.base_url
+        if departments is not None:
+            registry["departments"] = departments
+        registry_path = os.path.join(workdir, "departments.json")
+        with open(registry_path, "w", encoding="utf-8") as file:
+            json.dump(registry, file)
+
+        os.environ["BOARD_REGISTRY_PATH"] = registry_path
+        os.environ["ANNOUNCEMENT_DB_PATH"] = os.path.join(workdir, "announcements.db")
+        os.environ.setdefault("TELEGRAM_BOT_TOKEN", "123456:bench")
+
+        from src.bot.telegram_bot import TelegramBot
+
+        self.request = _build_fake_request()
+        self.bot = TelegramBot(request=self.request)
+        self.bot.report_handler.reports_dir = os.path.join(workdir, "reports")
+        self.departments = self.bot.board_handler.factory.departments()
+        self._update_ids = itertools.count(1)
+
+    async def start(self):
+        await self.bot.app.initialize()
+
+    async def send(self, user_id: int, text: str) -> float:
+        """
+        Feed one command through the application's handlers.
+        :return: The handling latency in seconds.
+        """
+        update = _command_update(self.bot.app.bot, next(self._update_ids), user_id, text)
+        start = time.perf_counter()
+        await self.bot.app.process_update(update)
+        return time.perf_counter() - start
+
+    async def warm(self):
+        await asyncio.gather(*(self.bot._refresh(department) for department in self.departments))
+        await asyncio.gather(*self.bot._prefetch_tasks.values())
+
+    async def stop(self):
+        await asyncio.gather(*self.bot._refresh_tasks.values(), return_exceptions=True)
+        await asyncio.gather(*self.bot._prefetch_tasks.values(), return_exceptions=True)
+        await self.bot.app.shutdown()
+        self.bot.crawl_scheduler.shutdown()
+        for executor in self.bot.report_handler._executors.values():
+            executor.shutdown()
+        self.bot.store.close()
+        self.bot.articles.close()
+
+
+def _commands(departments: list[str], report_format: str, newest: int, rng: random.Random):
+    while True:
+        department = rng.choice(departments)
+        choice = rng.random()
+        if choice < 0.7:
+            yield f"/board {department}"
+        elif choice < 0.9:
+            yield f"/report {report_format} {department}"
+        else:
+            # 첫 크롤링 때 본문을 미리 가져오는 최신 글 중 하나
+            yield f"/view {rng.randint(max(1, newest - 19), newest)} {department}"
+
+
+async def _run_users(target: BotUnderTest, users: int, requests_per_user: int, report_format: str, newest: int,
+                     seed: int):
+    rng = random.Random(seed)
+    commands = _commands(target.departments, report_format, newest, rng)
+    scripts = [[next(commands) for _ in range(requests_per_user)] for _ in range(users)]
+
+    async def user(user_id, script):
+        return [await target.send(user_id, text) for text in script]
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(user(user_id, script) for user_id, script in enumerate(scripts, start=1)))
+    return [latency for latencies in results for latency in latencies], time.perf_counter() - start
+
+
+def _summarize(latencies: list[float], elapsed: float) -> dict:
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p95_ms": round(cuts[94] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+    }
+
+
+async def run_benchmark(args) -> dict:
+    server = ReplayServer(args.pages, args.server_latency)
+    results = {}
+    try:
+        # 콜드 캐시: 라운드마다 빈 DB의 새 봇 인스턴스에 사용자들의 첫 요청을 동시에 보냄
+        latencies, elapsed = [], 0.0
+        for round_index in range(args.cold_rounds):
+            with tempfile.TemporaryDirectory() as workdir:
+                target = BotUnderTest(server, workdir)
+                await target.start()
+                try:
+                    round_latencies, round_elapsed = await _run_users(
+                        target, args.users, 1, args.report_format, args.pages * 10, args.seed + round_index
+                    )
+                finally:
+                    await target.stop()
+            latencies.extend(round_latencies)
+            elapsed += round_elapsed
+        results["cold"] = _summarize(latencies, elapsed)
+
+        # 웜 캐시: 스냅샷을 채운 뒤 같은 봇에 반복 요청
+        with tempfile.TemporaryDirectory() as workdir:
+            target = BotUnderTest(server, workdir)
+            await target.start()
+            try:
+                await target.warm()
+                latencies, elapsed = await _run_users(
+                    target, args.users, args.requests, args.report_format, args.pages * 10, args.seed
+                )
+            finally:
+                await target.stop()
+        results["warm"] = _summarize(latencies, elapsed)
+    finally:
+        server.stop()
+    results["board_requests"] = server.requests
+    return results
+
+
+def calibrate(rounds: int = 7) -> float:
+    """
+    Time a fixed CPU workload (parsing 20 synthetic list pages) to compare machine speed.
+    :return: The fastest round in milliseconds (the least disturbed by other load).
+    """
+    from src.boards.page_parsers import PageParserFactory
+
+    parser = PageParserFactory().create_parser("html.parser")
+    pages = [synthetic_page(page, 20, dated_from=200) for page in range(1, 21)]
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for html in pages:
+            parser.parse(html, "board_list table table-default", "pagination", 1)
+        timings.append(time.perf_counter() - start)
+    return round(min(timings) * 1000, 3)
+
+
+def compare(results: dict, baseline: dict, tolerance: float, calibration_ms: float = None) -> list[str]:
+    """
+    :param calibration_ms: This machine's calibrate() result. When the baseline has one too, expected
+                           latencies are scaled by the ratio (and throughput by its inverse).
+    :return: Descriptions of the metrics that regressed past the tolerance. A p95 within the baseline's
+             min_delta_ms of the expected value never counts, so sub-millisecond jitter of cached
+             requests is not reported as a regression.
+    """
+    min_delta_ms = baseline.get("min_delta_ms", 0.0)
+    scale = 1.0
+    if calibration_ms and baseline.get("calibration_ms"):
+        scale = calibration_ms / baseline["calibration_ms"]
+    regressions = []
+    for scenario, expected in baseline.get("scenarios", {}).items():
+        actual = results.get(scenario)
+        if actual is None:
+            continue
+        p95_ms = round(expected["p95_ms"] * scale, 3)
+        throughput_rps = round(expected["throughput_rps"] / scale, 1)
+        if actual["p95_ms"] > max(p95_ms * (1 + tolerance), p95_ms + min_delta_ms):
+            regressions.append(f"{scenario}: p95 {actual['p95_ms']}ms > baseline {p95_ms}ms (x{scale:.2f} machine speed)")
+        if actual["throughput_rps"] < throughput_rps * (1 - tolerance):
+            regressions.append(f"{scenario}: throughput {actual['throughput_rps']}/s < baseline {throughput_rps}/s "
+                               f"(x{scale:.2f} machine speed)")
+    return regressions
+
+
+def record(pages: int):
+    """
+    Save the first pages of every registered board from the live site as replay fixtures.
+    """
+    import requests
+
+    with open(REGISTRY_PATH, encoding="utf-8") as file:
+        registry = json.load(file)
+    for entry in registry["departments"]:
+        board_dir = os.path.join(FIXTURES_DIR, entry["board_id"])
+        url = entry.get("base_url") or registry["base_url"].format(board_id=entry["board_id"])
+        for page in range(1, pages + 1):
+            response = requests.get(url, params={"pageIndex": page}, timeout=10)
+            response.raise_for_status()
+            # 받아온 페이지가 있을 때만 폴더를 만들어, 실패한 기록이 빈 픽스처를 남기지 않게 함
+            os.makedirs(board_dir, exist_ok=True)
+            with open(os.path.join(board_dir, f"page_{page}.html"), "w", encoding="utf-8") as file:
+                file.write(response.text)
+            time.sleep(0.2)
+        logging.info(f"Recorded {pages} pages of '{entry['name']}' to {board_dir}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Replay benchmark for the Telegram bot pipeline.")
+    parser.add_argument("--users", type=int, default=20, help="Concurrent simulated users.")
+    parser.add_argument("--requests", type=int, default=25, help="Requests per user in the warm scenario.")
+    parser.add_argument("--cold-rounds", type=int, default=3, help="Fresh bot instances in the cold scenario.")
+    parser.add_argument("--pages", type=int, default=20, help="Synthetic pages per board.")
+    parser.add_argument("--server-latency", type=float, default=0.01, help="Seconds added to every board response.")
+    parser.add_argument("--report-format", default="csv", help="Format used by the /report requests.")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--tolerance", type=float, default=None, help="Allowed regression (default: baseline's).")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline.")
+    parser.add_argument("--record", action="store_true", help="Record live board pages as fixtures and exit.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    if args.record:
+        record(args.pages)
+        return 0
+
+    # 봇 모듈은 import 시 INFO 로깅을 켜므로, 측정 중에는 경고 이상만 출력
+    logging.getLogger().setLevel(logging.WARNING)
+    calibration_ms = calibrate()
+    results = asyncio.run(run_benchmark(args))
+    results["calibration_ms"] = calibration_ms
+    print(json.dumps(results, indent=2))
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump({
+                "tolerance": args.tolerance or 0.5,
+                "calibration_ms": calibration_ms,
+                "min_delta_ms": MIN_DELTA_MS,
+                "scenarios": {k: results[k] for k in ("cold", "warm")},
+            }, file, indent=2)
+            file.write("\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline found; run with --update-baseline to create one.")
+        return 0
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    tolerance = args.tolerance if args.tolerance is not None else baseline.get("tolerance", 0.5)
+    regressions = compare(results, baseline, tolerance, calibration_ms)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Wall time of the bot's scheduled refresh of 40 boards against the local replay stub.
+
+Runs TelegramBot._warm_cache, the job the bot repeats every cache_refresh_interval, which crawls
+every registered board through CrawlScheduler.refresh_all. All boards live on the same stub host
+and the registry's crawl settings (boards in parallel, connections per host, request spacing and
+refresh_budget_seconds) apply unchanged, as they do on the real site. The first refresh crawls
+every board from an empty database; the second is the incremental one of every later run.
+
+Exits with status 1 when any board misses the time budget.
+
+Usage (from the repository root):
+    python -m benchmarks.scheduler_bench
+    python -m benchmarks.scheduler_bench --boards 40 --pages 5 --budget 30
+"""
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import tempfile
+import time
+
+from benchmarks.replay import BotUnderTest, ReplayServer
+
+
+async def _timed_refresh(target: BotUnderTest, requests_before: int, server: ReplayServer) -> dict:
+    start = time.perf_counter()
+    results = await target.bot._warm_cache(None)
+    elapsed = time.perf_counter() - start
+    return {
+        "seconds": round(elapsed, 3),
+        "within_budget": len(results),
+        "requests": server.requests - requests_before,
+    }
+
+
+async def run(server: ReplayServer, args) -> dict:
+    departments = [{"name": f"board{i}", "board_id": f"SCHED_{i}"} for i in range(args.boards)]
+    with tempfile.TemporaryDirectory() as workdir:
+        target = BotUnderTest(server, workdir, departments)
+        settings = target.bot.board_handler.factory.crawl_settings
+        if args.budget is not None:
+            settings["refresh_budget_seconds"] = args.budget
+        # 목록 크롤링만 재도록 본문 미리 가져오기는 끔
+        target.bot.board_handler.article_batch_size = 0
+        await target.start()
+        try:
+            first = await _timed_refresh(target, server.requests, server)
+            second = await _timed_refresh(target, server.requests, server)
+        finally:
+            await target.stop()
+    return {
+        "boards": args.boards,
+        "pages_per_board": args.pages,
+        "crawl_settings": settings,
+        "first_refresh": first,
+        "incremental_refresh": second,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark of the bot's scheduled refresh over many boards.")
+    parser.add_argument("--boards", type=int, default=40)
+    parser.add_argument("--pages", type=int, default=5, help="Pages per board.")
+    parser.add_argument("--budget", type=float, default=None, help="Time budget in seconds (default: the registry's).")
+    parser.add_argument("--server-latency", type=float, default=0.05, help="Seconds added to every response.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    server = ReplayServer(args.pages, args.server_latency)
+    try:
+        # 봇 모듈은 import 시 INFO 로깅을 켜므로, 측정 중에는 경고 이상만 출력
+        result = asyncio.run(run(server, args))
+    finally:
+        server.stop()
+    logging.getLogger().setLevel(logging.WARNING)
+    print(json.dumps(result, indent=2))
+
+    budget = result["crawl_settings"].get("refresh_budget_seconds")
+    missed = False
+    for name in ("first_refresh", "incremental_refresh"):
+        refresh = result[name]
+        print(f"{name}: {refresh['seconds']}s, {refresh['within_budget']}/{args.boards} boards within "
+              f"the {budget}s budget, {refresh['requests']} requests")
+        missed = missed or refresh["within_budget"] < args.boards
+    return 1 if missed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
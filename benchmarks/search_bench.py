@@ -0,0 +1,119 @@
+"""
+Build time, memory and query latency of the title index at 10k and 100k announcements.
+
+Titles are generated from a vocabulary of common board words so the gram distribution is
+close to the real boards. Queries mix two-syllable words, phrases and single syllables.
+
+Usage (from the repository root):
+    python -m benchmarks.search_bench
+    python -m benchmarks.search_bench --sizes 10000,100000,500000 --departments 40
+"""
+import argparse
+import gc
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date
+
+from src.boards.announcement import Announcement
+from src.search.title_index import TitleIndex
+
+WORDS = ("장학금", "수강신청", "안내", "공지", "졸업", "논문", "제출", "기간", "변경", "학생회", "선거", "채용",
+         "설명회", "현장실습", "계절학기", "등록금", "납부", "휴학", "복학", "신청", "결과", "발표", "모집", "특강")
+QUERIES = ("장학", "수강신청", "졸업 논문", "현장실습 모집", "학", "금", "신청 안내", "없는단어")
+
+
+def _announcements(count: int, departments: int, rng: random.Random) -> dict[str, list[Announcement]]:
+    per_department = {f"dept{i}": [] for i in range(departments)}
+    names = list(per_department)
+    for number in range(count, 0, -1):
+        title = f"{number}번 " + " ".join(rng.sample(WORDS, rng.randint(2, 5)))
+        per_department[names[number % departments]].append(Announcement(number, title, "학과사무실", 0, date(2024, 3, 1)))
+    return per_department
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def run(count: int, departments: int, repeats: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    data = _announcements(count, departments, rng)
+
+    # 추적 중에는 색인 생성이 몇 배 느려지므로 메모리는 따로 한 번 더 만들어 잼
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    index = TitleIndex()
+    for department, announcements in data.items():
+        index.update(department, announcements)
+    index_bytes = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del index
+    gc.collect()
+
+    index = TitleIndex()
+    start = time.perf_counter()
+    for department, announcements in data.items():
+        index.update(department, announcements)
+    build_seconds = time.perf_counter() - start
+
+    # 한 학과에 새 글 10개가 추가된 증분 갱신
+    department = next(iter(data))
+    changed = [Announcement(count + i, f"새 글 {i} 장학금 안내", "학과사무실", 0, date(2024, 3, 2)) for i in range(1, 11)]
+    start = time.perf_counter()
+    index.update(department, changed + data[department])
+    update_ms = (time.perf_counter() - start) * 1000
+
+    # 첫 검색(한 글자 postings를 합치는 비용 포함)과 반복 검색을 나누어 기록
+    first = {}
+    for query in QUERIES:
+        start = time.perf_counter()
+        index.search(query)
+        first[query] = round((time.perf_counter() - start) * 1000, 2)
+
+    latencies = {query: [] for query in QUERIES}
+    for _ in range(repeats):
+        for query in QUERIES:
+            start = time.perf_counter()
+            index.search(query)
+            latencies[query].append((time.perf_counter() - start) * 1000)
+    all_latencies = [value for values in latencies.values() for value in values]
+    return {
+        "announcements": count,
+        "build_seconds": round(build_seconds, 2),
+        "index_mib": round(index_bytes / 2 ** 20, 1),
+        "update_10_new_ms": round(update_ms, 1),
+        "query_p50_ms": round(statistics.median(all_latencies), 2),
+        "query_p95_ms": round(_percentile(all_latencies, 0.95), 2),
+        "first_query_ms": first,
+        "per_query_median_ms": {query: round(statistics.median(values), 2) for query, values in latencies.items()},
+        "matches": {query: index.search(query)[1] for query in QUERIES},
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark of the title search index.")
+    parser.add_argument("--sizes", default="10000,100000", help="Comma-separated announcement counts.")
+    parser.add_argument("--departments", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=20, help="Runs of each query.")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    results = []
+    for size in (int(size) for size in args.sizes.split(",")):
+        result = run(size, args.departments, args.repeats, args.seed)
+        results.append(result)
+        print(f"{size:>7} titles: build {result['build_seconds']}s, {result['index_mib']} MiB, "
+              f"update {result['update_10_new_ms']} ms, query p50 {result['query_p50_ms']} ms / "
+              f"p95 {result['query_p95_ms']} ms", flush=True)
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
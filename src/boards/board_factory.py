@@ -1,16 +1,70 @@
-from src.boards.ce_board import CEBoard
-from src.boards.ee_board import EEBoard
+import json
+import os
+import threading
+from src.boards.board_source import BoardSource
+from src.boards.host_limiter import host_limiter
 import logging
 
+DEFAULT_REGISTRY_PATH = os.path.join(os.path.dirname(__file__), "departments.json")
+
+
 class BoardFactory:
-    def __init__(self):
+    def __init__(self, registry_path: str = None):
+        """
+        Load the department registry.
+        :param registry_path: Path of the registry JSON file. Defaults to $BOARD_REGISTRY_PATH or src/boards/departments.json.
+        """
         logging.basicConfig(level=logging.INFO)
+        self.registry_path = registry_path or os.getenv("BOARD_REGISTRY_PATH", DEFAULT_REGISTRY_PATH)
+        with open(self.registry_path, encoding="utf-8") as file:
+            registry = json.load(file)
+
+        base_url = registry["base_url"]
+        defaults = registry.get("defaults", {})
+        self.crawl_settings = registry.get("crawl", {})
+        host_limiter.configure(
+            self.crawl_settings.get("max_connections_per_host", 4),
+            self.crawl_settings.get("min_request_interval", 0.0),
+        )
+
+        # 이름 -> 게시판 설정, 별칭 -> 이름
+        self._configs = {}
+        self._aliases = {}
+        for entry in registry["departments"]:
+            name = entry["name"].strip().lower()
+            config = {**defaults, **entry}
+            config.setdefault("base_url", base_url.format(board_id=entry["board_id"]))
+            self._configs[name] = config
+            for alias in [name] + entry.get("aliases", []):
+                self._aliases[alias.strip().lower()] = name
+
+        # 게시판 인스턴스는 처음 요청될 때 만들고 재사용해야 증분 크롤링 상태가 유지됨
+        self._boards = {}
+        self._lock = threading.Lock()
+
+    def departments(self) -> list[str]:
+        """
+        Get the names of all registered departments.
+        :return: List of department names.
+        """
+        return list(self._configs)
+
+    def resolve(self, department: str) -> str:
+        """
+        Map a department name or alias to its registered name.
+        :param department: Department name or alias (e.g., "ce", "컴퓨터").
+        :return: The registered name, or the normalized input if it is not registered.
+        """
+        normalized_department = department.strip().lower()
+        return self._aliases.get(normalized_department, normalized_department)
 
     def get_board(self, department: str):
         """
         Get the appropriate board instance based on the department name.
-        :param department: Department name (e.g., "computer", "electrical").
-        :return: An instance of the board class for the specified department.
+        Board instances are created once per department and reused, so their
+        incremental crawl state survives between requests.
+        :param department: Department name or alias (e.g., "computer", "electrical").
+        :return: The BoardSource for the specified department.
         """
         try:
             # Validate department input
@@ -18,19 +72,27 @@ class BoardFactory:
                 logging.error("Department name must be a non-empty string.")
                 raise ValueError("Department name must be a non-empty string.")
 
-            # Normalize department name to lowercase
-            normalized_department = department.strip().lower()
-            logging.info(f"Getting board for department: '{normalized_department}'")
-
-            if normalized_department == "computer":
-                logging.info("Returning CEBoard instance.")
-                return CEBoard()
-            elif normalized_department == "electrical":
-                logging.info("Returning EEBoard instance.")
-                return EEBoard()
-            else:
-                logging.error(f"Unknown department: '{normalized_department}'")
-                raise ValueError(f"Unknown department: '{normalized_department}'")
+            name = self.resolve(department)
+            config = self._configs.get(name)
+            if config is None:
+                logging.error(f"Unknown department: '{name}'")
+                raise ValueError(f"Unknown department: '{name}'")
+
+            with self._lock:
+                board = self._boards.get(name)
+                if board is None:
+                    logging.info(f"Creating board for department: '{name}'")
+                    board = BoardSource(
+                        base_url=config["base_url"],
+                        table_class=config["table_class"],
+                        pagination_class=config["pagination_class"],
+                        parser=config.get("parser", "html.parser"),
+                        name=name,
+                        detail_body_class=config.get("detail_body_class", "view_con"),
+                        attachment_class=config.get("attachment_class", "view_file"),
+                    )
+                    self._boards[name] = board
+            return board
         except ValueError as ve:
             logging.error(f"ValueError: {ve}")
             raise
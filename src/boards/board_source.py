@@ -1,101 +1,426 @@
+import hashlib
+import random
+import threading
+import time
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import urljoin
+from src.boards.announcement import Announcement, ArticleDetail
+from src.boards.circuit_breaker import CircuitOpenError, article_circuit_breaker, circuit_breaker
+from src.boards.host_limiter import host_limiter
+from src.boards.page_parsers import PageParserFactory, parse_article
+from src.monitoring.metrics import metrics
 import logging
 
+# 모든 게시판이 공유하는 HTTP 세션 (페이지/게시판 간 연결 재사용)
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+
+class CrawlError(Exception):
+    """Raised when a page could not be fetched after all retries."""
+
+
+class CrawlResult(list):
+    """
+    List of announcements with an explicit crawl status.
+    complete is False when the crawl stopped early because of an error, so the rows may be truncated.
+    walked holds only the rows read from the board in this crawl (for a full crawl, all of them);
+    an incremental result also contains rows kept from the previous crawl.
+    stats holds the counters of this crawl only (see new_crawl_stats()).
+    """
+
+    def __init__(self, announcements=(), complete: bool = True, walked: list = None, stats: dict = None):
+        super().__init__(announcements)
+        self.complete = complete
+        self.walked = walked if walked is not None else self
+        self.stats = stats if stats is not None else new_crawl_stats()
+
+
+def new_crawl_stats() -> dict:
+    """
+    :return: Zeroed counters for one crawl: requests, bytes_downloaded, pages_parsed,
+             pages_skipped and not_modified (pages_skipped that the server answered with 304).
+    """
+    return {"requests": 0, "bytes_downloaded": 0, "pages_parsed": 0, "pages_skipped": 0, "not_modified": 0}
+
+
+def drop_repeated_pinned(rows: list[Announcement], seen: set) -> list[Announcement]:
+    """
+    Remove pinned notices (no article number) that were already seen on an earlier page;
+    the board repeats them at the top of every page.
+    :param rows: The rows of one page.
+    :param seen: (title, author, date) of the pinned notices seen so far; updated in place.
+    :return: The rows without repeated pinned notices.
+    """
+    kept = []
+    for row in rows:
+        if row.number is None:
+            key = (row.title, row.author, row.date)
+            if key in seen:
+                continue
+            seen.add(key)
+        kept.append(row)
+    return kept
+
+
+def older_than(cutoff: datetime):
+    """
+    Build a stop predicate for iter_announcements that is true for numbered posts registered before the cutoff.
+    Pinned notices (no article number) and rows with an unreadable date never stop the crawl.
+    :param cutoff: The oldest registration date to keep.
+    :return: A predicate taking an Announcement.
+    """
+    cutoff_date = cutoff.date()
+
+    def stop(announcement: Announcement) -> bool:
+        if announcement.number is None or announcement.date is None:
+            return False
+        return announcement.date < cutoff_date
+
+    return stop
+
+
 class BoardSource:
-    def __init__(self, base_url: str, table_class: str = "board_list table table-default", pagination_class: str = "pagination"):
+    def __init__(self, base_url: str, table_class: str = "board_list table table-default", pagination_class: str = "pagination",
+                 max_workers: int = 4, parser: str = "html.parser", max_retries: int = 3,
+                 backoff_base: float = 0.5, backoff_max: float = 8.0, name: str = None,
+                 detail_body_class: str = "view_con", attachment_class: str = "view_file", timeout: float = 10,
+                 cached_pages: int = 10):
         """
         Initialize with the base URL, table class, and pagination class.
         :param base_url: The base URL for fetching data.
         :param table_class: The class name of the table container.
         :param pagination_class: The class name of the pagination container.
+        :param max_workers: Maximum number of pages fetched concurrently.
+        :param parser: Name of the list page parser backend ("html.parser", "lxml" or "stream").
+        :param max_retries: Retries per page after a timeout, connection error or 5xx/429 response.
+        :param backoff_base: Base delay in seconds of the exponential backoff between retries.
+        :param backoff_max: Maximum delay in seconds between retries.
+        :param name: Board name used as the metrics label (defaults to the base URL).
+        :param detail_body_class: The class name of the body container on article pages.
+        :param attachment_class: The class name of the attachment list on article pages.
+        :param timeout: Seconds to wait for the server before a request counts as a timeout.
+        :param cached_pages: Number of leading pages whose validators and rows are kept for conditional GETs.
         """
         self.base_url = base_url
+        self.name = name or base_url
         self.table_class = table_class
         self.pagination_class = pagination_class
+        self.max_workers = max(1, max_workers)
+        self.session = _session
+        self.host_limiter = host_limiter
+        self.circuit_breaker = circuit_breaker
+        self.article_circuit_breaker = article_circuit_breaker
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.detail_body_class = detail_body_class
+        self.attachment_class = attachment_class
+        self.parser_name = parser
+        self.parser = PageParserFactory().create_parser(parser)
+
+        # 증분 크롤링 상태: 마지막으로 수집한 목록과 그중 가장 큰 게시글 번호
+        self.known_announcements = []
+        self.last_seen_number = None
 
-    def fetch_announcements(self) -> list[list[str]]:
+        # 페이지별 검증 정보(ETag/Last-Modified/본문 해시)와 추출 결과
+        # 증분 크롤링은 앞 페이지만 다시 읽으므로 앞쪽 cached_pages 페이지만 보관
+        self.cached_pages = cached_pages
+        self._page_cache = {}
+        # 크롤링마다 자기 카운터를 넘겨받으므로, 같은 게시판을 동시에 크롤링해도 통계가 섞이지 않음
+        self._stats_lock = threading.Lock()
+        self.last_refresh_stats = new_crawl_stats()  # 마지막으로 끝난 fetch_announcements의 통계
+
+    def _count(self, stats: dict, **counters):
+        with self._stats_lock:
+            for name, value in counters.items():
+                stats[name] += value
+
+    def _get(self, url: str, headers: dict = None, kind: str = "list") -> requests.Response:
         """
-        Fetch all announcements across all pages.
-        :return: A list of announcement data (list of lists).
+        Download a URL of the board with bounded retries.
+        :param url: The URL to fetch.
+        :param headers: Optional extra request headers (e.g. conditional GET validators).
+        :param kind: "list" or "article", used as the metrics label. Article pages have their own circuit breaker.
+        :return: The response.
+        :raises CrawlError: If the URL could not be fetched after all retries.
+        :raises CircuitOpenError: If the circuit for the host is open.
         """
-        announcements = []
-        page = 1
-
-        while True:
+        breaker = self.article_circuit_breaker if kind == "article" else self.circuit_breaker
+        for attempt in range(self.max_retries + 1):
+            breaker.before_request(url)
             try:
-                # Request data for the current page
-                url = f"{self.base_url}?pageIndex={page}"
-                logging.info(f"Fetching URL: {url}")
-                response = requests.get(url, timeout=10)
+                logging.debug(f"Fetching URL: {url}")
+                with self.host_limiter.acquire(url), metrics.timer("crawl_page_seconds", board=self.name, kind=kind):
+                    response = self.session.get(url, headers=headers, timeout=self.timeout)
+                metrics.inc("http_responses", board=self.name, status=response.status_code)
                 response.raise_for_status()
-                soup = BeautifulSoup(response.text, "html.parser")
+                breaker.record_success(url)
+                metrics.inc("http_bytes", len(response.content), board=self.name, kind=kind)
+                return response
+            except requests.RequestException as e:
+                status = e.response.status_code if e.response is not None else None
+                if status is None:
+                    metrics.inc("http_responses", board=self.name, status="error")
+                retryable = status is None or status >= 500 or status == 429
+                # 시간 초과/연결 오류/5xx/429만 호스트 장애로 셈 (404 등은 호스트가 정상 응답한 것)
+                if retryable:
+                    breaker.record_failure(url)
+                else:
+                    breaker.record_success(url)
+                if not retryable or attempt == self.max_retries:
+                    raise CrawlError(f"Failed to fetch {url} after {attempt + 1} attempt(s): {e}") from e
+                # 지수 백오프 + 지터
+                delay = min(self.backoff_max, self.backoff_base * 2 ** attempt) * random.uniform(0.5, 1.0)
+                logging.warning(f"Error fetching {url} ({e}). Retrying in {delay:.2f}s...")
+                time.sleep(delay)
 
-                # Find the table container using the dynamic class name
-                table = soup.find("table", class_=self.table_class)
-                if not table:
-                    logging.warning(f"No table found with class '{self.table_class}' on page {page}. Stopping fetch.")
-                    break
+    def _fetch_page(self, page: int, stats: dict, headers: dict = None) -> requests.Response:
+        """
+        Download a single list page.
+        :param page: The page index to fetch.
+        :param stats: The counters of the crawl the page belongs to.
+        :param headers: Optional extra request headers (e.g. conditional GET validators).
+        :return: The response.
+        :raises CrawlError: If the page could not be fetched after all retries.
+        :raises CircuitOpenError: If the circuit for the host is open.
+        """
+        response = self._get(f"{self.base_url}?pageIndex={page}", headers)
+        self._count(stats, requests=1, bytes_downloaded=len(response.content))
+        return response
 
-                tbody = table.find("tbody")
-                if not tbody:
-                    logging.warning(f"No <tbody> found in the table on page {page}. Stopping fetch.")
-                    break
+    def fetch_article(self, url: str) -> ArticleDetail:
+        """
+        Download an article page and extract its body text and attachments.
+        :param url: The article URL (Announcement.url).
+        :return: The article detail.
+        :raises CrawlError: If the page could not be fetched after all retries.
+        :raises CircuitOpenError: If the circuit for the host is open.
+        """
+        response = self._get(url, kind="article")
+        return parse_article(response.text, url, self.detail_body_class, self.attachment_class)
 
-                # Check for 'nodata' rows
-                nodata = tbody.find("td", class_="nodata")
-                if nodata:
-                    logging.info(f"Reached 'nodata' on page {page}. Ending fetch.")
-                    break
+    def _fetch_and_parse(self, page: int, stats: dict):
+        """
+        Fetch and parse a page, reusing the previous result when the page has not changed.
+        Sends If-None-Match / If-Modified-Since when the server gave validators last time;
+        otherwise compares a hash of the body with the previous crawl and skips parsing on a match.
+        :param page: The page index.
+        :param stats: The counters of the crawl the page belongs to.
+        :return: Tuple of (announcements, has_next, last_page). announcements is None when the page signals the end of the board.
+        """
+        cached = self._page_cache.get(page)
+        headers = {}
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
 
-                rows = tbody.find_all("tr")
-                if not rows:
-                    logging.info(f"No rows found on page {page}. Ending fetch.")
-                    break
+        response = self._fetch_page(page, stats, headers)
+        if response.status_code == 304 and cached:
+            self._count(stats, pages_skipped=1, not_modified=1)
+            return cached["result"]
+
+        digest = hashlib.sha1(response.content).hexdigest()
+        if cached and cached["digest"] == digest:
+            self._count(stats, pages_skipped=1)
+            result = cached["result"]
+        else:
+            with metrics.timer("parse_seconds", parser=self.parser_name):
+                rows, has_next, last_page = self.parser.parse(response.text, self.table_class, self.pagination_class, page)
+            if rows is not None:
+                rows = [Announcement.from_row(row, urljoin(response.url, row[5]) if row[5] else None) for row in rows]
+            result = rows, has_next, last_page
+            self._count(stats, pages_parsed=1)
 
-                # Extract data for each row
-                for row in rows:
-                    cols = row.find_all("td")
-                    if len(cols) < 5:  # Skip rows with insufficient columns
-                        logging.warning(f"Skipping malformed row on page {page}: {row}")
-                        continue
+        if page <= self.cached_pages:
+            self._page_cache[page] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "digest": digest,
+                "result": result,
+            }
+        return result
 
-                    # Extract text and clean HTML entities
-                    data = [col.get_text(strip=True) for col in cols[:5]]  # Keep only the first 5 columns
+    def _remember(self, announcements: list[Announcement], last_seen_number: int = None):
+        """
+        Store a crawl result as the baseline for the next incremental crawl.
+        :param announcements: The announcement rows of the crawl.
+        :param last_seen_number: The newest known article number, if it is not among the rows.
+        """
+        numbers = [a.number for a in announcements if a.number is not None]
+        if last_seen_number is not None:
+            numbers.append(last_seen_number)
+        self.known_announcements = announcements
+        self.last_seen_number = max(numbers) if numbers else None
 
-                    # Validate row data to ensure correct length
-                    if len(data) != 5:
-                        logging.warning(f"Skipping row with unexpected column count on page {page}: {data}")
-                        continue
+    def seed(self, announcements: list[Announcement], last_seen_number: int = None):
+        """
+        Restore the incremental crawl state from previously stored announcements (e.g. after a restart).
+        The rows may be only a recent window of the history; the next incremental crawl stops at
+        last_seen_number and merges the new rows into them.
+        :param announcements: The stored announcement rows, newest first.
+        :param last_seen_number: The newest stored article number (defaults to the newest of the rows).
+        """
+        self._remember(announcements, last_seen_number)
 
-                    logging.debug(f"Row data (page {page}): {data}")  # 디버깅 로그 추가
-                    announcements.append(data)
+    def release(self):
+        """
+        Forget the incremental crawl state and cached pages (e.g. when the department is evicted from
+        the announcement cache), so no rows of the board stay referenced. The next crawl starts over,
+        or from whatever seed() restores.
+        """
+        self.known_announcements = []
+        self.last_seen_number = None
+        self._page_cache.clear()
 
-                # Log the data for the current page
-                logging.info(f"Page {page}: Collected {len(announcements)} total rows so far.")
+    def fetch_announcements(self, incremental: bool = False) -> CrawlResult:
+        """
+        Fetch announcements for the board.
+        :param incremental: If True and a previous crawl is known, only fetch pages until an
+                            already-seen article number is reached and merge the new rows into the known list.
+        :return: A CrawlResult of Announcement records; its complete flag is False if the crawl was cut short,
+                 and its stats are the counters of this crawl.
+        """
+        stats = new_crawl_stats()
+        mode = "incremental" if incremental and self.last_seen_number is not None else "full"
+        with metrics.timer("crawl_seconds", board=self.name, mode=mode):
+            if mode == "incremental":
+                announcements = self._fetch_new_announcements(stats)
+            else:
+                announcements = self._fetch_all_announcements(stats)
+        if not announcements.complete:
+            metrics.inc("crawl_incomplete", board=self.name)
+        # 잘린 결과는 다음 증분 크롤링의 기준으로 삼지 않음
+        if announcements.complete:
+            self._remember(announcements)
 
-                # Check for pagination
-                pagination = soup.find("div", class_=self.pagination_class)
-                if not pagination:
-                    logging.info("No pagination found. Ending fetch.")
-                    break
+        self.last_refresh_stats = stats
+        logging.info(
+            f"Refresh stats for {self.base_url}: {stats['requests']} requests, "
+            f"{stats['bytes_downloaded']} bytes downloaded, {stats['pages_parsed']} pages parsed, "
+            f"{stats['pages_skipped']} pages skipped ({stats['not_modified']} not modified)."
+        )
+        return announcements
 
-                next_page = pagination.find("a", {"aria-label": "Next"})
-                if not next_page or "disabled" in next_page.get("class", []):
-                    logging.info("No more pages to fetch. Ending fetch.")
+    def _fetch_new_announcements(self, stats: dict) -> CrawlResult:
+        """
+        Walk pages from the first one until a known article number shows up, then merge.
+        Rows from the walked pages replace their previous versions (e.g. updated view counts);
+        older numbered rows are kept from the previous crawl in their original order.
+        :return: The merged announcement list, or the previous list marked incomplete if a page failed.
+        """
+        fresh = []
+        pinned = set()
+        page = 1
+        try:
+            while True:
+                rows, has_next, _ = self._fetch_and_parse(page, stats)
+                if rows is None:
                     break
+                fresh.extend(drop_repeated_pinned(rows, pinned))
+                numbers = [a.number for a in rows if a.number is not None]
+                if any(n <= self.last_seen_number for n in numbers) or not has_next:
+                    break
+                page += 1
+        except (CrawlError, CircuitOpenError) as e:
+            logging.error(f"Network error on page {page}: {e}")
+            return CrawlResult(self.known_announcements, complete=False, stats=stats)
+        except Exception as e:
+            logging.error(f"Unexpected error on page {page}: {e}")
+            return CrawlResult(self.known_announcements, complete=False, stats=stats)
 
-                page += 1  # Move to the next page
+        fresh_numbers = {a.number for a in fresh if a.number is not None}
+        kept = [
+            announcement for announcement in self.known_announcements
+            if announcement.number is not None and announcement.number not in fresh_numbers
+        ]
+        new_count = sum(1 for n in fresh_numbers if n > self.last_seen_number)
+        logging.info(f"Incremental fetch: {page} page(s) requested, {new_count} new announcements.")
+        return CrawlResult(fresh + kept, walked=fresh, stats=stats)
 
-            except requests.Timeout:
-                logging.error(f"Timeout error while fetching page {page}. Retrying...")
-                continue  # Retry fetching the same page
-            except requests.RequestException as e:
-                logging.error(f"Network error on page {page}: {e}")
-                break
-            except Exception as e:
-                logging.error(f"Unexpected error on page {page}: {e}")
-                break
+    def _iter_pages(self, stats: dict):
+        """
+        Yield (page, rows) for every page of the board, in page order.
+        The first page is fetched alone to learn the last page number from the
+        pagination links; the following pages are fetched concurrently with at
+        most max_workers requests in flight, so stopping early wastes little work.
+        :param stats: The counters of the crawl, updated as pages are fetched.
+        :raises CrawlError: If a page could not be fetched (CircuitOpenError if the host's circuit is open).
+        """
+        page = 1
+        rows, has_next, last_page = self._fetch_and_parse(page, stats)
+        if rows is None:
+            return
+        yield page, rows
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = deque()
+            next_page = page + 1
+            try:
+                while has_next:
+                    # 알려진 마지막 페이지까지 max_workers 개씩 미리 요청하고, 모르면 다음 페이지 하나만 요청
+                    while len(pending) < self.max_workers and (next_page <= (last_page or 0) or not pending):
+                        pending.append(executor.submit(self._fetch_and_parse, next_page, stats))
+                        next_page += 1
+
+                    # 페이지 순서대로 결과를 돌려주어 순차 크롤링과 같은 순서를 유지
+                    page += 1
+                    rows, has_next, page_last = pending.popleft().result()
+                    if rows is None:
+                        break
+                    last_page = max(last_page or 0, page_last or 0)
+                    yield page, rows
+            finally:
+                for future in pending:
+                    future.cancel()
+        logging.debug("No more pages to fetch. Ending fetch.")
+
+    def iter_announcements(self, stop=None, stats: dict = None):
+        """
+        Stream announcements page by page instead of building the whole list in memory.
+        :param stop: Optional predicate called with each row; iteration ends (without yielding
+                     that row) at the first row for which it returns True. See older_than().
+        :param stats: Optional counters (see new_crawl_stats()) updated with this crawl's requests and pages.
+        :return: Generator of Announcement records. Pinned notices repeated on later pages are yielded once.
+        :raises CrawlError: If a page could not be fetched; rows of earlier pages have already been yielded.
+        """
+        pages = self._iter_pages(stats if stats is not None else new_crawl_stats())
+        pinned = set()
+        try:
+            for page, rows in pages:
+                logging.debug(f"Page {page}: {len(rows)} rows.")
+                for row in drop_repeated_pinned(rows, pinned):
+                    if stop is not None and stop(row):
+                        logging.info(f"Stop condition reached on page {page}. Ending fetch.")
+                        return
+                    yield row
+        finally:
+            pages.close()
+
+    def _fetch_all_announcements(self, stats: dict) -> CrawlResult:
+        """
+        Fetch all announcements across all pages.
+        :param stats: The counters of the crawl.
+        :return: A CrawlResult of Announcement records, marked incomplete if a page failed.
+        """
+        announcements = CrawlResult(stats=stats)
+        try:
+            for announcement in self.iter_announcements(stats=stats):
+                announcements.append(announcement)
+        except (CrawlError, CircuitOpenError) as e:
+            logging.error(f"Crawl of {self.base_url} stopped early: {e}")
+            announcements.complete = False
+        except Exception as e:
+            logging.error(f"Unexpected error while crawling {self.base_url}: {e}")
+            announcements.complete = False
 
         # Ensure the returned announcements are consistent
         if not announcements:
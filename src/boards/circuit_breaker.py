@@ -0,0 +1,72 @@
+import threading
+import time
+from urllib.parse import urlparse
+import logging
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the circuit for a host is open."""
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        """
+        Per-host circuit breaker. After failure_threshold consecutive failed requests to a host,
+        requests to it fail immediately for reset_timeout seconds; then a single trial request
+        is let through, and its outcome closes or re-opens the circuit.
+        :param failure_threshold: Consecutive failures that open the circuit.
+        :param reset_timeout: Seconds the circuit stays open before a trial request.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = {}  # host -> consecutive failures
+        self._opened_at = {}  # host -> time the circuit opened
+        self._trial_running = set()
+
+    def before_request(self, url: str):
+        """
+        :param url: The URL about to be requested.
+        :raises CircuitOpenError: If the circuit for the host is open.
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            if opened_at is None:
+                return
+            if time.monotonic() - opened_at < self.reset_timeout or host in self._trial_running:
+                raise CircuitOpenError(f"Circuit open for host '{host}'")
+            # 반개방 상태: 시험 요청 하나만 통과
+            self._trial_running.add(host)
+
+    def record_success(self, url: str):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host in self._opened_at:
+                logging.info(f"Circuit closed for host '{host}'.")
+            self._failures.pop(host, None)
+            self._opened_at.pop(host, None)
+            self._trial_running.discard(host)
+
+    def record_failure(self, url: str):
+        host = urlparse(url).netloc
+        with self._lock:
+            self._failures[host] = self._failures.get(host, 0) + 1
+            if host in self._trial_running or self._failures[host] >= self.failure_threshold:
+                if host not in self._opened_at or host in self._trial_running:
+                    logging.warning(f"Circuit opened for host '{host}' after {self._failures[host]} failures.")
+                self._opened_at[host] = time.monotonic()
+                self._trial_running.discard(host)
+
+    def is_open(self, url: str) -> bool:
+        host = urlparse(url).netloc
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            return opened_at is not None and time.monotonic() - opened_at < self.reset_timeout
+
+
+# 모든 BoardSource가 공유하는 기본 차단기
+circuit_breaker = CircuitBreaker()
+
+# 게시글 본문 요청용 차단기: 백그라운드 본문 수집의 실패가 목록 크롤링을 막지 않도록 분리
+article_circuit_breaker = CircuitBreaker()
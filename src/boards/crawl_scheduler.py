@@ -0,0 +1,58 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+import logging
+
+
+class CrawlScheduler:
+    def __init__(self, max_concurrent_boards: int = 8):
+        """
+        Run board crawls on a shared worker pool with a global concurrency cap.
+        Per-host politeness limits are applied to every page request by the HostLimiter
+        used by BoardSource, so they hold across all boards on the same host.
+        :param max_concurrent_boards: Maximum number of boards crawled at the same time.
+        """
+        self.executor = ThreadPoolExecutor(max_workers=max(1, max_concurrent_boards), thread_name_prefix="crawl")
+        self._lock = threading.Lock()
+        self._in_flight = {}  # department -> Future
+
+    def submit(self, department: str, fn, *args) -> Future:
+        """
+        Schedule a crawl for a department, or return the one already queued or running.
+        :param department: The department name.
+        :param fn: The crawl function.
+        :return: A Future with the result of fn(*args).
+        """
+        with self._lock:
+            future = self._in_flight.get(department)
+            if future is not None and not future.done():
+                return future
+            future = self.executor.submit(fn, *args)
+            self._in_flight[department] = future
+            return future
+
+    def refresh_all(self, departments: list[str], fn, timeout: float = None) -> dict:
+        """
+        Crawl every department and wait for the results.
+        :param departments: The departments to crawl.
+        :param fn: Function called as fn(department) in a worker.
+        :param timeout: Optional time budget in seconds; crawls still running after it are left out of the result.
+        :return: Mapping of department to result (only departments that finished without error).
+        """
+        start = time.monotonic()
+        futures = {department: self.submit(department, fn, department) for department in departments}
+        wait(futures.values(), timeout=timeout)
+
+        results = {}
+        for department, future in futures.items():
+            if not future.done():
+                logging.warning(f"Crawl for department '{department}' did not finish within the time budget.")
+            elif future.exception() is not None:
+                logging.error(f"Crawl for department '{department}' failed: {future.exception()}")
+            else:
+                results[department] = future.result()
+        logging.info(f"Refreshed {len(results)}/{len(departments)} boards in {time.monotonic() - start:.2f}s.")
+        return results
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
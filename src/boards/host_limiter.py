@@ -0,0 +1,56 @@
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+
+class HostLimiter:
+    def __init__(self, max_per_host: int = 4, min_interval: float = 0.0):
+        """
+        Politeness limits shared by every board crawl: at most max_per_host requests in flight
+        per host, and at least min_interval seconds between request starts to the same host.
+        :param max_per_host: Maximum concurrent requests per host.
+        :param min_interval: Minimum delay in seconds between two requests to the same host.
+        """
+        self.max_per_host = max(1, max_per_host)
+        self.min_interval = min_interval
+        self._condition = threading.Condition()
+        self._in_flight = {}  # host -> number of requests holding a slot
+        self._next_start = {}  # host -> earliest time the next request may start
+
+    def configure(self, max_per_host: int, min_interval: float):
+        """
+        Change the limits. Requests already in flight keep their slots and count against the new cap.
+        """
+        with self._condition:
+            self.max_per_host = max(1, max_per_host)
+            self.min_interval = min_interval
+            self._condition.notify_all()
+
+    @contextmanager
+    def acquire(self, url: str):
+        """
+        Hold a request slot for the host of the URL for the duration of the block.
+        :param url: The URL about to be requested.
+        """
+        host = urlparse(url).netloc
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight.get(host, 0) < self.max_per_host)
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.min_interval
+        try:
+            if start > now:
+                time.sleep(start - now)
+            yield
+        finally:
+            with self._condition:
+                self._in_flight[host] -= 1
+                if not self._in_flight[host]:
+                    del self._in_flight[host]
+                self._condition.notify_all()
+
+
+# 모든 BoardSource가 공유하는 기본 제한
+host_limiter = HostLimiter()
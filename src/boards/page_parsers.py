@@ -0,0 +1,327 @@
+import re
+import logging
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup
+from src.boards.announcement import ArticleDetail, Attachment
+
+_PAGE_NUMBER_PATTERN = re.compile(r"pageIndex=(\d+)|\((\d+)\)")
+_DOWNLOAD_LINK_PATTERN = re.compile(r"download|filedown", re.IGNORECASE)
+
+
+def _page_numbers(text: str, attrs: dict) -> list[int]:
+    """
+    Collect the page numbers a pagination link points to (link text, href and onclick).
+    """
+    numbers = [int(text)] if text.isdigit() else []
+    for attr in ("href", "onclick"):
+        for match in _PAGE_NUMBER_PATTERN.finditer(attrs.get(attr) or ""):
+            numbers.append(int(match.group(1) or match.group(2)))
+    return numbers
+
+
+def _article_link(href: str | None) -> str | None:
+    """
+    Keep a row's link only if it points to a page (not "#" or a javascript: handler).
+    """
+    href = (href or "").strip()
+    if not href or href.startswith("#") or href.lower().startswith("javascript:"):
+        return None
+    return href
+
+
+def _class_matches(value: str, wanted: str) -> bool:
+    """
+    Match a class attribute the way BeautifulSoup's class_ filter does:
+    either the whole attribute string or one of its classes.
+    """
+    return value == wanted or wanted in value.split()
+
+
+class SoupPageParser:
+    """
+    Board list parser built on a full BeautifulSoup tree (html.parser or lxml).
+    """
+
+    def __init__(self, features: str = "html.parser"):
+        self.features = features
+
+    def parse(self, html: str, table_class: str, pagination_class: str, page: int):
+        """
+        Extract announcement rows and pagination info from a list page.
+        :param html: The page HTML.
+        :param table_class: The class name of the table container.
+        :param pagination_class: The class name of the pagination container.
+        :param page: The page index (used for logging).
+        :return: Tuple of (rows, has_next, last_page). Each row is the 5 column texts followed by the
+                 article link of the title column (or None). rows is None when the page signals the end of the board.
+        """
+        soup = BeautifulSoup(html, self.features)
+
+        # Find the table container using the dynamic class name
+        table = soup.find("table", class_=table_class)
+        if not table:
+            logging.warning(f"No table found with class '{table_class}' on page {page}. Stopping fetch.")
+            return None, False, None
+
+        tbody = table.find("tbody")
+        if not tbody:
+            logging.warning(f"No <tbody> found in the table on page {page}. Stopping fetch.")
+            return None, False, None
+
+        # Check for 'nodata' rows
+        nodata = tbody.find("td", class_="nodata")
+        if nodata:
+            logging.info(f"Reached 'nodata' on page {page}. Ending fetch.")
+            return None, False, None
+
+        rows = tbody.find_all("tr")
+        if not rows:
+            logging.info(f"No rows found on page {page}. Ending fetch.")
+            return None, False, None
+
+        # Extract data for each row
+        data_rows = []
+        for row in rows:
+            cols = row.find_all("td")
+            if len(cols) < 5:  # Skip rows with insufficient columns
+                logging.warning(f"Skipping malformed row on page {page}: {row}")
+                continue
+
+            # Extract text and clean HTML entities
+            data = [col.get_text(strip=True) for col in cols[:5]]  # Keep only the first 5 columns
+            links = (_article_link(link.get("href")) for link in cols[1].find_all("a"))
+            data.append(next((link for link in links if link), None))
+            logging.debug(f"Row data (page {page}): {data}")  # 디버깅 로그 추가
+            data_rows.append(data)
+
+        # Check for pagination
+        pagination = soup.find("div", class_=pagination_class)
+        if not pagination:
+            logging.info("No pagination found. Ending fetch.")
+            return data_rows, False, None
+
+        next_page = pagination.find("a", {"aria-label": "Next"})
+        has_next = bool(next_page) and "disabled" not in next_page.get("class", [])
+
+        numbers = []
+        for link in pagination.find_all("a"):
+            attrs = {attr: link.get(attr) for attr in ("href", "onclick")}
+            numbers.extend(_page_numbers(link.get_text(strip=True), attrs))
+        return data_rows, has_next, max(numbers) if numbers else None
+
+
+class _BoardListTokenizer(HTMLParser):
+    """
+    Single-pass tokenizer that only keeps the board table cells and pagination links.
+    """
+
+    def __init__(self, table_class: str, pagination_class: str):
+        super().__init__(convert_charrefs=True)
+        self.table_class = table_class
+        self.pagination_class = pagination_class
+
+        self.table_found = False
+        self.tbody_found = False
+        self.nodata = False
+        self.rows = []  # (cells, article link)
+        self.pagination_found = False
+        self.links = []  # (text, attrs)
+
+        self._table_depth = 0  # 대상 table 안에서의 중첩 깊이 (0이면 대상 table 밖)
+        self._in_tbody = False
+        self._row = None
+        self._row_link = None
+        self._cell = None
+        self._div_depth = 0  # 대상 pagination div 안에서의 div 깊이
+        self._pagination_done = False
+        self._link = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "table":
+            if self._table_depth:
+                self._table_depth += 1
+            elif not self.table_found and _class_matches(attrs.get("class") or "", self.table_class):
+                self.table_found = True
+                self._table_depth = 1
+        elif self._table_depth == 1:
+            if tag == "tbody" and not self.tbody_found:
+                self.tbody_found = True
+                self._in_tbody = True
+            elif self._in_tbody and tag == "tr":
+                self._close_row()
+                self._row = []
+                self._row_link = None
+            elif self._in_tbody and tag == "td" and self._row is not None:
+                self._close_cell()
+                self._cell = []
+                if _class_matches(attrs.get("class") or "", "nodata"):
+                    self.nodata = True
+            elif tag == "a" and self._cell is not None and len(self._row) == 1 and self._row_link is None:
+                # 두 번째 칸(제목)의 첫 유효한 링크가 게시글 주소
+                self._row_link = _article_link(attrs.get("href"))
+
+        if tag == "div":
+            if self._div_depth:
+                self._div_depth += 1
+            elif not self._pagination_done and _class_matches(attrs.get("class") or "", self.pagination_class):
+                self.pagination_found = True
+                self._div_depth = 1
+        elif tag == "a" and self._div_depth:
+            self._link = ([], attrs)
+
+    def handle_endtag(self, tag):
+        if tag == "table" and self._table_depth:
+            self._table_depth -= 1
+            if not self._table_depth:
+                self._close_tbody()
+        elif self._table_depth == 1:
+            if tag == "tbody":
+                self._close_tbody()
+            elif tag == "tr":
+                self._close_row()
+            elif tag == "td":
+                self._close_cell()
+
+        if tag == "div" and self._div_depth:
+            self._div_depth -= 1
+            if not self._div_depth:
+                self._pagination_done = True
+        elif tag == "a" and self._link is not None:
+            text, attrs = self._link
+            self.links.append(("".join(text), attrs))
+            self._link = None
+
+    def handle_data(self, data):
+        text = data.strip()
+        if not text:
+            return
+        if self._cell is not None:
+            self._cell.append(text)
+        if self._link is not None:
+            self._link[0].append(text)
+
+    def _close_cell(self):
+        if self._cell is not None:
+            self._row.append("".join(self._cell))
+            self._cell = None
+
+    def _close_row(self):
+        self._close_cell()
+        if self._row is not None:
+            self.rows.append((self._row, self._row_link))
+            self._row = None
+
+    def _close_tbody(self):
+        if self._in_tbody:
+            self._close_row()
+            self._in_tbody = False
+
+
+class StreamPageParser:
+    """
+    Board list parser that tokenizes the page once with the standard library HTMLParser
+    and never builds a document tree.
+    """
+
+    def parse(self, html: str, table_class: str, pagination_class: str, page: int):
+        """
+        Extract announcement rows and pagination info from a list page.
+        Same contract as SoupPageParser.parse.
+        """
+        tokenizer = _BoardListTokenizer(table_class, pagination_class)
+        tokenizer.feed(html)
+        tokenizer.close()
+
+        if not tokenizer.table_found:
+            logging.warning(f"No table found with class '{table_class}' on page {page}. Stopping fetch.")
+            return None, False, None
+        if not tokenizer.tbody_found:
+            logging.warning(f"No <tbody> found in the table on page {page}. Stopping fetch.")
+            return None, False, None
+        if tokenizer.nodata:
+            logging.info(f"Reached 'nodata' on page {page}. Ending fetch.")
+            return None, False, None
+        if not tokenizer.rows:
+            logging.info(f"No rows found on page {page}. Ending fetch.")
+            return None, False, None
+
+        data_rows = []
+        for row, link in tokenizer.rows:
+            if len(row) < 5:  # Skip rows with insufficient columns
+                logging.warning(f"Skipping malformed row on page {page}: {row}")
+                continue
+            data_rows.append(row[:5] + [link])
+
+        if not tokenizer.pagination_found:
+            logging.info("No pagination found. Ending fetch.")
+            return data_rows, False, None
+
+        has_next = False
+        numbers = []
+        next_seen = False
+        for text, attrs in tokenizer.links:
+            if not next_seen and attrs.get("aria-label") == "Next":
+                next_seen = True
+                has_next = "disabled" not in (attrs.get("class") or "").split()
+            numbers.extend(_page_numbers(text, attrs))
+        return data_rows, has_next, max(numbers) if numbers else None
+
+
+def parse_article(html: str, page_url: str, body_class: str, attachment_class: str) -> ArticleDetail:
+    """
+    Extract the body text and attachment links of an article page.
+    :param html: The page HTML.
+    :param page_url: The URL the page was fetched from (relative links are resolved against it).
+    :param body_class: The class name of the body container.
+    :param attachment_class: The class name of the attachment list container. Without one,
+                             links that look like file downloads anywhere on the page are used.
+    :return: The article detail.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    container = soup.find(class_=body_class)
+    if container is None:
+        logging.warning(f"No body found with class '{body_class}' on {page_url}.")
+        body = ""
+    else:
+        lines = (line.strip() for line in container.get_text("\n").splitlines())
+        body = "\n".join(line for line in lines if line)
+
+    files = soup.find(class_=attachment_class)
+    if files is not None:
+        links = files.find_all("a", href=True)
+    else:
+        links = soup.find_all("a", href=_DOWNLOAD_LINK_PATTERN)
+    attachments = []
+    for link in links:
+        href = _article_link(link["href"])
+        if href is None:
+            continue
+        name = link.get_text(strip=True) or link.get("title") or href.rsplit("/", 1)[-1]
+        attachments.append(Attachment(name, urljoin(page_url, href)))
+    return ArticleDetail(page_url, body, tuple(attachments))
+
+
+class PageParserFactory:
+    PARSERS = ("html.parser", "lxml", "stream")
+
+    def create_parser(self, name: str = "html.parser"):
+        """
+        Create the board list parser backend with the given name.
+        :param name: "html.parser" (default), "lxml" (requires the lxml package) or "stream".
+        :return: A parser instance with a parse(html, table_class, pagination_class, page) method.
+        """
+        if name == "html.parser":
+            return SoupPageParser("html.parser")
+        elif name == "lxml":
+            try:
+                import lxml  # noqa: F401
+            except ImportError:
+                raise ValueError("Parser 'lxml' requires the lxml package to be installed.")
+            return SoupPageParser("lxml")
+        elif name == "stream":
+            return StreamPageParser()
+        else:
+            raise ValueError(f"Unknown parser: '{name}'")
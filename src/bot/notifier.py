@@ -0,0 +1,161 @@
+import asyncio
+import random
+import time
+import logging
+from telegram.error import Forbidden, RetryAfter, TelegramError
+
+MAX_MESSAGE_LENGTH = 4096
+
+
+class _RateLimiter:
+    def __init__(self, rate: float):
+        """
+        Spaces out calls so that at most `rate` of them start per second.
+        """
+        self.interval = 1.0 / rate
+        self._next_start = 0.0
+
+    def reserve(self, earliest: float = 0.0) -> float:
+        """
+        Reserve the next start slot that is not before `earliest` (a time.monotonic() value).
+        :return: Seconds to wait before the slot starts.
+        """
+        now = time.monotonic()
+        start = max(now, earliest, self._next_start)
+        self._next_start = start + self.interval
+        return start - now
+
+
+class Notifier:
+    def __init__(self, send, global_rate: float = 25.0, per_chat_interval: float = 1.0, workers: int = 8,
+                 max_attempts: int = 5, on_blocked=None):
+        """
+        Fan out new-announcement messages to subscribed chats in the background.
+        Messages are queued without blocking the caller and sent under Telegram's rate limits:
+        a global messages-per-second limit and a minimum interval per chat. 429 responses are
+        retried after the requested delay; other errors are retried with exponential backoff.
+        :param send: Coroutine function send(chat_id, text), e.g. Bot.send_message.
+        :param global_rate: Maximum messages per second across all chats (Telegram allows about 30).
+        :param per_chat_interval: Minimum seconds between two messages to the same chat.
+        :param workers: Number of concurrent senders.
+        :param max_attempts: Attempts per message before it is dropped.
+        :param on_blocked: Optional callback(chat_id) for chats that blocked the bot.
+        """
+        self.send = send
+        self.per_chat_interval = per_chat_interval
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.on_blocked = on_blocked
+        self._global = _RateLimiter(global_rate)
+        self._chat_next = {}  # chat_id -> earliest time the next message may be sent
+        self._queue = asyncio.Queue()
+        self._retries_scheduled = 0  # 지연 후 다시 큐에 들어갈 재시도 수
+        self._tasks = []
+        self.stats = {"delivered": 0, "failed": 0, "retried": 0, "started": None}
+
+    def start(self):
+        if not self._tasks:
+            self.stats["started"] = time.monotonic()
+            self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def join(self):
+        """
+        Wait until every queued message was delivered or dropped, including scheduled retries.
+        """
+        while True:
+            await self._queue.join()
+            if not self._retries_scheduled:
+                return
+            await asyncio.sleep(0.01)
+
+    def notify(self, chat_ids: list[int], department: str, announcements: list):
+        """
+        Queue one batched message (split only if it exceeds Telegram's limit) per chat.
+        :param chat_ids: The subscribed chats.
+        :param department: The department the announcements belong to.
+        :param announcements: The new announcements.
+        """
+        if not chat_ids or not announcements:
+            return
+        messages = self._batch_messages(department, announcements)
+        for chat_id in chat_ids:
+            for text in messages:
+                self._queue.put_nowait((chat_id, text, 1))
+        logging.info(f"Queued {len(messages) * len(chat_ids)} notification(s) for department '{department}'.")
+
+    @staticmethod
+    def _batch_messages(department: str, announcements: list) -> list[str]:
+        header = f"[{department}] 새 공지사항 {len(announcements)}건"
+        messages, current = [], header
+        for announcement in announcements:
+            line = f"\n- {announcement.title} ({announcement.date_text})"
+            if len(current) + len(line) > MAX_MESSAGE_LENGTH:
+                messages.append(current)
+                current = header
+            current += line
+        messages.append(current)
+        return messages
+
+    def deliveries_per_second(self) -> float:
+        if self.stats["started"] is None:
+            return 0.0
+        elapsed = time.monotonic() - self.stats["started"]
+        return self.stats["delivered"] / elapsed if elapsed > 0 else 0.0
+
+    async def _worker(self):
+        while True:
+            chat_id, text, attempt = await self._queue.get()
+            try:
+                await self._deliver(chat_id, text, attempt)
+            except Exception as e:
+                logging.error(f"Unexpected error delivering notification to chat {chat_id}: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _deliver(self, chat_id: int, text: str, attempt: int):
+        # 채팅별 간격과 전역 전송률을 모두 지킨 뒤 전송
+        # (전역 슬롯은 채팅 간격이 끝난 뒤의 시각으로 잡아야 다른 채팅의 전송과 겹치지 않음)
+        now = time.monotonic()
+        chat_start = max(now, self._chat_next.get(chat_id, now))
+        delay = self._global.reserve(chat_start)
+        self._chat_next[chat_id] = now + delay + self.per_chat_interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        try:
+            await self.send(chat_id, text)
+            self.stats["delivered"] += 1
+            return
+        except RetryAfter as e:
+            retry_after = e.retry_after.total_seconds() if hasattr(e.retry_after, "total_seconds") else e.retry_after
+            backoff = float(retry_after)
+            logging.warning(f"Rate limited sending to chat {chat_id}; retrying in {backoff}s.")
+        except Forbidden:
+            logging.info(f"Chat {chat_id} blocked the bot. Dropping notification.")
+            self.stats["failed"] += 1
+            if self.on_blocked is not None:
+                self.on_blocked(chat_id)
+            return
+        except TelegramError as e:
+            backoff = min(60.0, 2 ** attempt) * random.uniform(0.5, 1.0)
+            logging.warning(f"Error sending to chat {chat_id} (attempt {attempt}): {e}; retrying in {backoff:.1f}s.")
+
+        if attempt >= self.max_attempts:
+            logging.error(f"Giving up on notification to chat {chat_id} after {attempt} attempts.")
+            self.stats["failed"] += 1
+            return
+        self.stats["retried"] += 1
+        # 재시도는 지연 후 다시 큐에 넣어서 작업자를 붙잡지 않음
+        self._chat_next[chat_id] = max(self._chat_next.get(chat_id, 0), time.monotonic() + backoff)
+        self._retries_scheduled += 1
+        asyncio.get_running_loop().call_later(backoff, self._requeue, (chat_id, text, attempt + 1))
+
+    def _requeue(self, item):
+        self._retries_scheduled -= 1
+        self._queue.put_nowait(item)
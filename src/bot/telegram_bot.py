@@ -1,10 +1,20 @@
 import os
+import asyncio
 from dotenv import load_dotenv
-from telegram.ext import ApplicationBuilder, CommandHandler, CallbackContext
-from telegram import Update
-from datetime import datetime, timedelta
+from telegram.ext import ApplicationBuilder, CommandHandler, CallbackQueryHandler, CallbackContext
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
+from telegram.request import BaseRequest
+from datetime import date, datetime, timedelta
 from src.handlers.board_handler import BoardHandler
 from src.handlers.report_handler import ReportHandler
+from src.storage.announcement_cache import AnnouncementCache
+from src.storage.announcement_store import AnnouncementStore
+from src.storage.article_store import ArticleStore
+from src.search.title_index import TitleIndex
+from src.boards.crawl_scheduler import CrawlScheduler
+from src.storage.subscription_store import SubscriptionStore
+from src.bot.notifier import MAX_MESSAGE_LENGTH, Notifier
+from src.monitoring.metrics import MetricsServer, metrics, profiler
 import logging
 import time
 
@@ -16,95 +26,357 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(
 
 
 class TelegramBot:
-    def __init__(self):
+    def __init__(self, request: BaseRequest = None):
+        """
+        :param request: Optional Telegram transport used for all Bot API calls (e.g. a fake one for benchmarks).
+        """
         self.token = os.getenv("TELEGRAM_BOT_TOKEN")
         if not self.token:
             raise ValueError("TELEGRAM_BOT_TOKEN is not set in the environment.")
-        self.app = ApplicationBuilder().token(self.token).build()
-        self.board_handler = BoardHandler()
-        
-        # 캐시 설정
-        self.cache = {}
-        self.cache_last_updated = {}
-        self.cache_ttl = 1800  # 캐시 유효 시간 (초) - 30분
+        builder = ApplicationBuilder().token(self.token).post_init(self._post_init).post_shutdown(self._post_shutdown)
+        if request is not None:
+            builder = builder.request(request).get_updates_request(request)
+        self.app = builder.build()
+        # 캐시 설정: 모든 핸들러가 공유하는 하나의 캐시 (유효 시간 30분)
+        self.cache = AnnouncementCache(ttl=1800)
+        self.cache_refresh_interval = 1500  # 백그라운드 갱신 주기 (초) - TTL 만료 전에 갱신
+
+        self.store = AnnouncementStore()
+        self.articles = ArticleStore(self.store.db_path)  # /view 용 게시글 본문/첨부파일 (새 글만 미리 수집)
+        self._prefetch_queue = {}  # 학과별로 본문을 가져올 공지사항
+        self._prefetch_tasks = {}
+        self.board_handler = BoardHandler(shared_cache=self.cache, store=self.store, articles=self.articles)
+        self.crawl_scheduler = CrawlScheduler(
+            self.board_handler.factory.crawl_settings.get("max_concurrent_boards", 8)
+        )
+        self._refresh_tasks = {}  # 학과별 진행 중인 갱신 작업 (중복 크롤링 방지)
+        self._recent_tasks = {}  # 스냅샷이 없을 때의 최근 30일 크롤링 (전체 갱신이 끝날 때까지 공유)
         
+        # 학과별로 미리 나눠 둔 /board 메시지 페이지: department -> ((데이터 버전, 날짜), pages)
+        self._board_pages = {}
+
+        # 제목 검색용 역색인 (캐시가 갱신될 때마다 증분 갱신)
+        self.search_index = TitleIndex()
+        self.search_page_size = 10
+
+        # 새 공지 구독 (재시작 후에도 유지) 및 알림 발송
+        self.subscriptions = SubscriptionStore(self.store.db_path)
+        self.notifier = Notifier(self._send_notification, on_blocked=self.subscriptions.remove)
+        # 학과별로 구독자에게 알린(또는 첫 크롤링에서 본) 가장 큰 게시글 번호. 캐시에서 스냅샷이
+        # 밀려나도 새 글을 빠뜨리지 않도록 스냅샷과 별도로 두고, 재시작 후에는 저장소에서 이어받음
+        self._high_water = {}
+
         # ReportHandler 초기화 시 캐시를 전달
-        self.report_handler = ReportHandler(cached_data=self.cache)
+        self.report_handler = ReportHandler(cache=self.cache, store=self.store)
+
+        # /stats 명령을 쓸 수 있는 관리자 채팅 ID와 선택적인 로컬 Prometheus 엔드포인트
+        self.admin_ids = {int(user_id) for user_id in os.getenv("ADMIN_USER_IDS", "").split(",") if user_id.strip()}
+        metrics_port = os.getenv("METRICS_PORT")
+        self.metrics_server = MetricsServer(metrics, int(metrics_port)) if metrics_port else None
 
+        self._load_snapshot()
         self._register_handlers()
+        self._schedule_cache_warmer()
+
+    def _load_snapshot(self):
+        # BoardHandler가 저장소에서 캐시로 읽어 온 스냅샷을 검색 색인에 반영
+        for department in self.cache.departments():
+            self.search_index.update(department, self.cache.get(department))
+        for department in self.board_handler.factory.departments():
+            number = self.store.max_number(department)
+            if number is not None:
+                self._high_water[department] = number
+        self.cache.on_evict(self._forget_department)
+
+    def _forget_department(self, department):
+        # 캐시에서 밀려난 학과의 행을 참조하는 파생 데이터도 함께 버림
+        self.search_index.remove(department)
+        self._board_pages.pop(department, None)
+
+    async def _post_init(self, application):
+        self.notifier.start()
+        if self.metrics_server is not None:
+            self.metrics_server.start()
+
+    async def _post_shutdown(self, application):
+        await self.notifier.stop()
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+        self.crawl_scheduler.shutdown()
+
+    async def _send_notification(self, chat_id, text):
+        await self.app.bot.send_message(chat_id=chat_id, text=text)
+
+    def _schedule_cache_warmer(self):
+        if self.app.job_queue is None:
+            logging.warning("JobQueue is not available (install python-telegram-bot[job-queue]). Cache will refresh on demand only.")
+            return
+        self.app.job_queue.run_repeating(self._warm_cache, interval=self.cache_refresh_interval, first=1)
 
     def _register_handlers(self):
-        self.app.add_handler(CommandHandler("start", self._start))
-        self.app.add_handler(CommandHandler("board", self._board))
-        self.app.add_handler(CommandHandler("report", self._report))
+        self.app.add_handler(CommandHandler("start", self._timed("start", self._start)))
+        self.app.add_handler(CommandHandler("board", self._timed("board", self._board)))
+        self.app.add_handler(CommandHandler("report", self._timed("report", self._report)))
+        self.app.add_handler(CommandHandler("search", self._timed("search", self._search)))
+        self.app.add_handler(CommandHandler("subscribe", self._timed("subscribe", self._subscribe)))
+        self.app.add_handler(CommandHandler("unsubscribe", self._timed("unsubscribe", self._unsubscribe)))
+        self.app.add_handler(CommandHandler("view", self._timed("view", self._view)))
+        self.app.add_handler(CommandHandler("stats", self._stats))
+        self.app.add_handler(CallbackQueryHandler(self._timed("board_page", self._board_page), pattern=r"^board:"))
+
+    def _timed(self, command, callback):
+        """
+        Wrap a handler to record its latency and, when sampling is enabled, profile it.
+        """
+        async def handler(update: Update, context: CallbackContext):
+            with metrics.timer("command_seconds", command=command), profiler.profile(command):
+                return await callback(update, context)
+        return handler
 
     def _filter_recent_announcements(self, announcements):
-        filtered = []
-        one_month_ago = datetime.now() - timedelta(days=30)
-        for announcement in announcements:
-            try:
-                date_str = announcement[4]
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                if date_obj >= one_month_ago:
-                    filtered.append(announcement)
-            except ValueError:
-                logging.warning(f"Skipping malformed date: {announcement[4]}")
-        return filtered
+        one_month_ago = (datetime.now() - timedelta(days=30)).date()
+        return [a for a in announcements if a.date is not None and a.date >= one_month_ago]
+
+    def _format_announcement(self, announcement):
+        return (
+            f"번호: {announcement.number_text}\n"
+            f"제목: {announcement.title}\n"
+            f"작성자: {announcement.author}\n"
+            f"조회수: {announcement.views}\n"
+            f"등록일: {announcement.date_text}\n{'-' * 30}"
+        )
 
     def _format_announcements(self, announcements):
-        formatted = []
-        for announcement in announcements:
-            formatted.append(
-                f"번호: {announcement[0]}\n"
-                f"제목: {announcement[1]}\n"
-                f"작성자: {announcement[2]}\n"
-                f"조회수: {announcement[3]}\n"
-                f"등록일: {announcement[4]}\n{'-' * 30}"
+        return "\n".join(self._format_announcement(announcement) for announcement in announcements)
+
+    def _paginate(self, entries, title):
+        """
+        Pack formatted entries into message pages that fit Telegram's message limit.
+        :return: List of page texts, each starting with a "title (page/total)" header.
+        """
+        limit = MAX_MESSAGE_LENGTH - len(title) - 20  # 머리말 "(page/total)" 자리
+        pages, current = [], ""
+        for entry in entries:
+            entry = entry[:limit]
+            if current and len(current) + 1 + len(entry) > limit:
+                pages.append(current)
+                current = ""
+            current = f"{current}\n{entry}" if current else entry
+        if current:
+            pages.append(current)
+        return [f"{title} ({index}/{len(pages)})\n\n{page}" for index, page in enumerate(pages, start=1)]
+
+    def _get_board_pages(self, department, announcements, cacheable=True):
+        """
+        Return the pre-rendered /board pages of a department, rendering them only when the
+        data version or the day (for the 30-day window) changed.
+        """
+        key = (self.cache.version(department), date.today()) if cacheable else None
+        rendered = self._board_pages.get(department)
+        if rendered is not None and key is not None and rendered[0] == key:
+            return rendered[1]
+
+        recent_announcements = self._filter_recent_announcements(announcements) if cacheable else announcements
+        entries = [self._format_announcement(announcement) for announcement in recent_announcements]
+        pages = self._paginate(entries, f"[{department}] 최근 한 달 공지사항") if entries else []
+        self._board_pages[department] = (key, pages)
+        return pages
+
+    def _board_keyboard(self, department, page, total):
+        if total <= 1:
+            return None
+        buttons = []
+        if page > 0:
+            buttons.append(InlineKeyboardButton("◀ 이전", callback_data=f"board:{department}:{page - 1}"))
+        if page < total - 1:
+            buttons.append(InlineKeyboardButton("다음 ▶", callback_data=f"board:{department}:{page + 1}"))
+        return InlineKeyboardMarkup([buttons])
+
+    async def _apply_refresh(self, department, previous):
+        """
+        Sync the search index, notify subscribers and prefetch article details if a refresh changed the cached data.
+        New posts are those numbered above the department's high-water mark, so a snapshot that was
+        evicted or invalidated before the refresh does not hide them.
+        :param previous: The cache snapshot from before the refresh, or None.
+        """
+        snapshot = self.cache.snapshot(department)
+        if snapshot is None or (previous is not None and snapshot.version == previous.version):
+            return
+        # 색인 갱신은 행 수에 비례하므로 이벤트 루프 밖에서 실행
+        await asyncio.to_thread(self.search_index.update, department, snapshot.announcements)
+        numbers = [a.number for a in snapshot.announcements if a.number is not None]
+        high_water = self._high_water.get(department)
+        if numbers:
+            self._high_water[department] = max(numbers + [high_water or 0])
+        if high_water is None:
+            # 처음 본 학과는 알림 없이 최신 글 한 배치의 본문만 미리 수집 (나머지는 /view 때 가져옴)
+            newest = sorted((a for a in snapshot.announcements if a.number is not None),
+                            key=lambda a: a.number, reverse=True)
+            self._prefetch_articles(department, newest[:self.board_handler.article_batch_size])
+            return
+
+        # 마지막으로 알린 번호보다 큰 게시글만 구독자에게 알리고 본문을 미리 수집
+        new_announcements = [a for a in snapshot.announcements if a.number is not None and a.number > high_water]
+        if new_announcements:
+            self.notifier.notify(self.subscriptions.subscribers(department), department, new_announcements)
+            self._prefetch_articles(department, new_announcements)
+
+    def _prefetch_articles(self, department, announcements):
+        """
+        Queue announcements for a background detail prefetch; one batch runs per department at a time.
+        Only new posts, the newest batch of a department's first load and /view misses are queued,
+        so re-queueing what a batch deferred never grows into a crawl of the whole history.
+        """
+        self._prefetch_queue.setdefault(department, []).extend(announcements)
+        task = self._prefetch_tasks.get(department)
+        if task is None or task.done():
+            self._prefetch_tasks[department] = asyncio.create_task(self._run_prefetch(department))
+
+    async def _run_prefetch(self, department):
+        while self._prefetch_queue.get(department):
+            announcements = self._prefetch_queue.pop(department)
+            try:
+                stats = await asyncio.to_thread(self.board_handler.prefetch_articles, department, announcements)
+            except Exception as e:
+                logging.error(f"Error prefetching articles for department {department}: {e}")
+                return
+            if stats["deferred"]:
+                # 배치에 들지 못한 글은 다시 대기열에 넣고, 차단기가 열려 하나도 못 가져왔으면 다음 갱신 때 재시도
+                self._prefetch_queue.setdefault(department, []).extend(stats["deferred"])
+                if not stats["fetched"] and not stats["failed"]:
+                    return
+
+    def _refresh(self, department):
+        """
+        Start a background refresh for the department, or return the one already running.
+        The crawl runs on the crawl scheduler's worker pool so the event loop keeps serving other chats.
+        """
+        task = self._refresh_tasks.get(department)
+        if task is None or task.done():
+            task = asyncio.create_task(self._refresh_department(department))
+            self._refresh_tasks[department] = task
+        return task
+
+    async def _refresh_department(self, department):
+        try:
+            # 크롤링 결과는 BoardHandler가 공유 캐시에 저장하므로 여기서는 변경분만 반영
+            previous = self.cache.snapshot(department)
+            data = await asyncio.wrap_future(
+                self.crawl_scheduler.submit(department, self.board_handler.handle_request, department, True)
             )
-        return "\n".join(formatted)
+            if data:
+                await self._apply_refresh(department, previous)
+            else:
+                logging.warning(f"Refresh for department {department} returned no data. Keeping last snapshot.")
+        except Exception as e:
+            logging.error(f"Error refreshing department {department}: {e}")
+        finally:
+            self._recent_tasks.pop(department, None)
 
-    def _is_cache_valid(self, department):
-        if department not in self.cache_last_updated:
-            return False
-        is_valid = (time.time() - self.cache_last_updated[department]) < self.cache_ttl
-        return is_valid and department in self.cache
+    def _fetch_recent(self, department):
+        """
+        Start the 30-day crawl used to answer /board before the first full refresh, or return the one
+        already started. Its result is shared by every request until the full refresh finishes.
+        """
+        task = self._recent_tasks.get(department)
+        refresh = self._refresh_tasks.get(department)
+        if task is None or (task.done() and (refresh is None or refresh.done())):
+            task = asyncio.create_task(asyncio.to_thread(self.board_handler.fetch_recent, department, 30))
+            self._recent_tasks[department] = task
+        return task
+
+    async def _warm_cache(self, context: CallbackContext):
+        """
+        Refresh every registered board through the crawl scheduler within the registry's time budget
+        (crawl.refresh_budget_seconds), then apply the changes. Boards that miss the budget keep
+        crawling and are applied when they finish.
+        """
+        departments = self.board_handler.factory.departments()
+        budget = self.board_handler.factory.crawl_settings.get("refresh_budget_seconds")
+        logging.info(f"Warming cache for departments: {departments}")
+        previous = {department: self.cache.snapshot(department) for department in departments}
+        results = await asyncio.to_thread(
+            self.crawl_scheduler.refresh_all, departments,
+            lambda department: self.board_handler.handle_request(department, True), budget,
+        )
+        for department, data in results.items():
+            self._recent_tasks.pop(department, None)
+            if data:
+                await self._apply_refresh(department, previous[department])
+
+        late = [department for department in departments if department not in results]
+        if late:
+            logging.warning(f"{len(late)} board(s) missed the refresh budget of {budget}s: {late}")
+            await asyncio.gather(*(self._finish_refresh(department, previous[department]) for department in late))
+        return results
 
-    def _update_cache(self, department, data):
+    async def _finish_refresh(self, department, previous):
+        # 예산을 넘긴 크롤링은 스케줄러에서 진행 중인 작업을 그대로 기다림 (실패한 학과는 다시 시도)
         try:
-            if not isinstance(data, list) or not all(isinstance(row, list) and len(row) == 5 for row in data):
-                raise ValueError(f"Invalid data format for cache: {data}")
-            self.cache[department] = data
-            self.cache_last_updated[department] = time.time()
-            # ReportHandler의 캐시를 동기화
-            self.report_handler.update_cache(department, data)
-            logging.info(f"Cache updated for department: {department}, total items: {len(data)}")
+            data = await asyncio.wrap_future(
+                self.crawl_scheduler.submit(department, self.board_handler.handle_request, department, True)
+            )
+            if data:
+                await self._apply_refresh(department, previous)
         except Exception as e:
-            logging.error(f"Error updating cache for department {department}: {e}")
-            raise
+            logging.error(f"Error refreshing department {department}: {e}")
+        finally:
+            self._recent_tasks.pop(department, None)
+
+    async def _get_announcements(self, department):
+        """
+        Return the last good snapshot right away, even if stale, and refresh it in the background.
+        Only waits for a crawl when there is no snapshot at all.
+        """
+        snapshot = self.cache.snapshot(department)
+        if snapshot is not None:
+            if snapshot.age() < self.cache.ttl:
+                metrics.inc("cache_requests", result="hit")
+            else:
+                metrics.inc("cache_requests", result="stale")
+                self._refresh(department)
+            return snapshot.announcements
+        metrics.inc("cache_requests", result="miss")
+        await self._refresh(department)
+        return self.cache.get(department) or []
 
     async def _start(self, update: Update, context: CallbackContext):
         logging.info("Start command received")
         await update.message.reply_text("Hanbat University Bot에 오신 것을 환영합니다!")
 
+    async def _reject_unknown_department(self, update: Update, department: str, name: str) -> bool:
+        """
+        Reply with an error if the department is not registered, before anything is crawled or cached for it.
+        :return: True if the department is unknown.
+        """
+        if department in self.board_handler.factory.departments():
+            return False
+        await update.message.reply_text(f"알 수 없는 학과입니다: {name}")
+        return True
+
     async def _board(self, update: Update, context: CallbackContext):
-        logging.info(f"Board command received with args: {context.args}")
+        logging.debug(f"Board command received with args: {context.args}")
         if len(context.args) > 0:
-            department = context.args[0].lower()
+            department = self.board_handler.factory.resolve(context.args[0])
+            if await self._reject_unknown_department(update, department, context.args[0]):
+                return
             try:
-                if self._is_cache_valid(department):
-                    announcements = self.cache[department]
-                else:
-                    announcements = self.board_handler.handle_request(department)
-                    if announcements:
-                        self._update_cache(department, announcements)
-                    else:
+                if department in self.cache:
+                    announcements = await self._get_announcements(department)
+                    if not announcements:
                         await update.message.reply_text("해당 학과에 대한 공지사항이 없습니다.")
                         return
+                    pages = self._get_board_pages(department, announcements)
+                else:
+                    # 스냅샷이 없으면 최근 30일치만 읽어 바로 응답하고, 전체 크롤링은 백그라운드에서 진행
+                    # (동시에 들어온 요청은 같은 크롤링 결과를 기다림)
+                    metrics.inc("cache_requests", result="miss")
+                    self._refresh(department)
+                    recent_announcements = await asyncio.shield(self._fetch_recent(department))
+                    pages = self._get_board_pages(department, recent_announcements, cacheable=False)
 
-                recent_announcements = self._filter_recent_announcements(announcements)
-                if recent_announcements:
-                    formatted_announcements = self._format_announcements(recent_announcements)
-                    await update.message.reply_text(formatted_announcements)
+                if pages:
+                    await update.message.reply_text(pages[0], reply_markup=self._board_keyboard(department, 0, len(pages)))
                 else:
                     await update.message.reply_text("최근 한 달간 등록된 공지사항이 없습니다.")
             except Exception as e:
@@ -113,26 +385,174 @@ class TelegramBot:
         else:
             await update.message.reply_text("사용법: /board [학과명] (예: /board computer)")
 
+    async def _board_page(self, update: Update, context: CallbackContext):
+        # 미리 렌더링된 페이지만 읽으므로 다시 포맷하거나 크롤링하지 않음
+        query = update.callback_query
+        _, department, page = query.data.split(":")
+        rendered = self._board_pages.get(department)
+        pages = rendered[1] if rendered else []
+        page = int(page)
+        if not 0 <= page < len(pages):
+            await query.answer("목록이 갱신되었습니다. /board 명령을 다시 입력해 주세요.")
+            return
+        await query.answer()
+        await query.edit_message_text(pages[page], reply_markup=self._board_keyboard(department, page, len(pages)))
+
     async def _report(self, update: Update, context: CallbackContext):
-        logging.info(f"Report command received with args: {context.args}")
+        logging.debug(f"Report command received with args: {context.args}")
         if len(context.args) >= 2:
             format = context.args[0].lower()
-            department = context.args[1].lower()
+            department = self.board_handler.factory.resolve(context.args[1])
+            if department != "all" and await self._reject_unknown_department(update, department, context.args[1]):
+                return
             try:
-                if not self._is_cache_valid(department):
-                    raw_data = self.board_handler.handle_request(department)
-                    if not raw_data:
-                        await update.message.reply_text("해당 학과에 대한 데이터가 없습니다.")
-                        return
-                    self._update_cache(department, raw_data)
+                if department == "all":
+                    departments = self.board_handler.factory.departments()
+                    raw_data = all(await asyncio.gather(*(self._get_announcements(d) for d in departments)))
+                else:
+                    raw_data = await self._get_announcements(department)
+                if not raw_data:
+                    await update.message.reply_text("해당 학과에 대한 데이터가 없습니다.")
+                    return
 
-                result = self.report_handler.generate_report(format, department)
+                result = await self.report_handler.generate_report_async(format, department)
                 await update.message.reply_text(result)
             except Exception as e:
                 logging.error(f"Error in _report: {e}")
                 await update.message.reply_text(f"오류 발생: {e}")
         else:
-            await update.message.reply_text("사용법: /report [형식] [학과명] (예: /report excel computer)")
+            await update.message.reply_text(
+                "사용법: /report [형식] [학과명] (예: /report excel computer)\n"
+                "형식: excel, pdf, csv, jsonl / 학과명 all: 모든 학과 전체 이력"
+            )
+
+    async def _search(self, update: Update, context: CallbackContext):
+        logging.debug(f"Search command received with args: {context.args}")
+        args = list(context.args)
+        page = 1
+        if len(args) > 1 and args[-1].isdigit():
+            page = int(args.pop())
+        department = None
+        if len(args) > 1 and self.board_handler.factory.resolve(args[-1]) in self.board_handler.factory.departments():
+            department = self.board_handler.factory.resolve(args.pop())
+        if not args:
+            await update.message.reply_text("사용법: /search [검색어] [학과명] [페이지] (예: /search 장학 computer)")
+            return
+
+        keyword = " ".join(args)
+        try:
+            results, total = await asyncio.to_thread(
+                self.search_index.search, keyword, department, page, self.search_page_size
+            )
+            if not total:
+                await update.message.reply_text(f"'{keyword}'에 대한 검색 결과가 없습니다.")
+                return
+
+            pages = (total + self.search_page_size - 1) // self.search_page_size
+            lines = [f"'{keyword}' 검색 결과: {total}건 ({min(page, pages)}/{pages} 페이지)"]
+            for dept, announcement in results:
+                lines.append(f"[{dept}] {announcement.number_text} | {announcement.title} | {announcement.date_text}")
+            if page < pages:
+                lines.append(f"다음 페이지: /search {keyword}{' ' + department if department else ''} {page + 1}")
+            await update.message.reply_text("\n".join(lines))
+        except Exception as e:
+            logging.error(f"Error in _search: {e}")
+            await update.message.reply_text(f"오류 발생: {e}")
+
+    async def _subscribe(self, update: Update, context: CallbackContext):
+        logging.debug(f"Subscribe command received with args: {context.args}")
+        if len(context.args) > 0:
+            department = self.board_handler.factory.resolve(context.args[0])
+            if await self._reject_unknown_department(update, department, context.args[0]):
+                return
+            if self.subscriptions.add(update.effective_chat.id, department):
+                await update.message.reply_text(f"{department} 학과의 새 공지사항 알림을 구독했습니다.")
+            else:
+                await update.message.reply_text(f"이미 {department} 학과를 구독 중입니다.")
+        else:
+            await update.message.reply_text("사용법: /subscribe [학과명] (예: /subscribe computer)")
+
+    async def _unsubscribe(self, update: Update, context: CallbackContext):
+        logging.debug(f"Unsubscribe command received with args: {context.args}")
+        department = self.board_handler.factory.resolve(context.args[0]) if context.args else None
+        removed = self.subscriptions.remove(update.effective_chat.id, department)
+        if removed:
+            await update.message.reply_text(f"{department or '모든'} 학과 알림 구독을 해지했습니다.")
+        else:
+            await update.message.reply_text("구독 중인 학과가 없습니다.")
+
+    def _format_article(self, announcement, detail):
+        header = f"[{announcement.number_text}] {announcement.title}\n{announcement.author} | {announcement.date_text}\n\n"
+        footer = ""
+        if detail.attachments:
+            footer += "\n\n첨부파일:\n" + "\n".join(f"- {a.name}: {a.url}" for a in detail.attachments)
+        footer += f"\n\n원문: {announcement.url}"
+        body = detail.body or "(본문 없음)"
+        room = MAX_MESSAGE_LENGTH - len(header) - len(footer)
+        if len(body) > room:
+            body = body[:max(0, room - 1)] + "…"
+        return (header + body + footer)[:MAX_MESSAGE_LENGTH]
+
+    async def _view(self, update: Update, context: CallbackContext):
+        logging.debug(f"View command received with args: {context.args}")
+        if not context.args or not context.args[0].isdigit():
+            await update.message.reply_text("사용법: /view [번호] [학과명] (예: /view 1234 computer)")
+            return
+
+        number = int(context.args[0])
+        if len(context.args) > 1:
+            departments = [self.board_handler.factory.resolve(context.args[1])]
+            if await self._reject_unknown_department(update, departments[0], context.args[1]):
+                return
+        else:
+            departments = self.cache.departments()
+        matches = [(d, a) for d in departments for a in (self.cache.get(d) or ()) if a.number == number]
+        if not matches:
+            await update.message.reply_text(f"{number}번 공지사항을 찾을 수 없습니다.")
+            return
+        if len(matches) > 1:
+            names = ", ".join(d for d, _ in matches)
+            await update.message.reply_text(f"여러 학과({names})에 {number}번 공지사항이 있습니다. 학과명을 함께 입력해 주세요.")
+            return
+
+        department, announcement = matches[0]
+        if announcement.url is None:
+            await update.message.reply_text("이 공지사항은 본문 링크가 없습니다.")
+            return
+        try:
+            detail = self.articles.get(announcement.url)
+            if detail is None:
+                # 아직 수집되지 않은 글은 백그라운드에서 가져오고 바로 응답
+                self._prefetch_articles(department, [announcement])
+                await update.message.reply_text("본문을 가져오는 중입니다. 잠시 후 다시 시도해 주세요.")
+                return
+            await update.message.reply_text(self._format_article(announcement, detail))
+        except Exception as e:
+            logging.error(f"Error in _view: {e}")
+            await update.message.reply_text(f"오류 발생: {e}")
+
+    async def _stats(self, update: Update, context: CallbackContext):
+        if update.effective_user is None or update.effective_user.id not in self.admin_ids:
+            await update.message.reply_text("관리자만 사용할 수 있는 명령입니다.")
+            return
+
+        if context.args and context.args[0] == "dump":
+            path = await asyncio.to_thread(profiler.dump, os.path.join("data", "profiles", f"slowest_{int(time.time())}.txt"))
+            await update.message.reply_text(f"프로파일 저장: {path}")
+            return
+
+        cache_requests = {result: metrics.counter_value("cache_requests", result=result) for result in ("hit", "stale", "miss")}
+        total = sum(cache_requests.values()) or 1
+        lines = [
+            "캐시: " + ", ".join(f"{result} {count:g} ({count / total:.0%})" for result, count in cache_requests.items()),
+            f"알림 전송: {self.notifier.stats['delivered']}건, {self.notifier.deliveries_per_second():.2f}건/초",
+        ]
+        slowest = profiler.slowest()
+        if slowest:
+            lines.append("가장 느린 요청: " + ", ".join(f"{name} {duration:.3f}s" for name, duration in slowest))
+        lines.extend(metrics.summary().splitlines())
+        for page in self._paginate(lines, "봇 통계"):
+            await update.message.reply_text(page)
 
     def run(self):
         logging.info("Telegram Bot is starting...")
@@ -0,0 +1,188 @@
+import csv
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+import logging
+from typing import Iterable
+
+import xlsxwriter
+from fpdf import FPDF
+
+from src.boards.announcement import Announcement, HEADERS
+
+COLUMNS = ("학과",) + HEADERS
+
+
+def _values(department: str, announcement: Announcement) -> list:
+    return [department, announcement.number_text, announcement.title, announcement.author,
+            announcement.views, announcement.date_text]
+
+
+class StreamingExcelReport:
+    extension = "xlsx"
+
+    def generate(self, rows: Iterable[tuple[str, Announcement]], file_path: str) -> str:
+        """
+        Write rows to an Excel file in xlsxwriter's constant_memory mode: each row is flushed
+        to disk as soon as the next one starts, so memory does not grow with the row count.
+        :param rows: Iterable of (department, Announcement).
+        :param file_path: Output file path.
+        :return: The file path.
+        """
+        workbook = xlsxwriter.Workbook(file_path, {"constant_memory": True})
+        try:
+            worksheet = workbook.add_worksheet("공지사항")
+            worksheet.write_row(0, 0, COLUMNS)
+            for index, (department, announcement) in enumerate(rows, start=1):
+                worksheet.write_row(index, 0, _values(department, announcement))
+        finally:
+            workbook.close()
+        return file_path
+
+
+class StreamingPDFReport:
+    extension = "pdf"
+    WIDTHS = (25, 15, 150, 35, 15, 25)
+
+    def __init__(self, font_path: str = None, rows_per_file: int = 5000):
+        """
+        :param font_path: TrueType font with Hangul glyphs. Defaults to $REPORT_FONT_PATH;
+                          without one, non-Latin characters are replaced.
+        :param rows_per_file: Rows written to one PDF document before it is flushed to disk.
+        """
+        self.font_path = font_path or os.getenv("REPORT_FONT_PATH")
+        self.rows_per_file = max(1, rows_per_file)
+
+    def _new_document(self) -> FPDF:
+        pdf = FPDF(orientation="L")
+        if self.font_path:
+            pdf.add_font("Report", "", self.font_path, uni=True)
+            pdf.set_font("Report", size=8)
+        else:
+            pdf.set_font("Arial", size=8)
+        pdf.set_auto_page_break(auto=True, margin=10)
+        pdf.add_page()
+        for width, column in zip(self.WIDTHS, COLUMNS):
+            pdf.cell(width, 6, self._encode(column), border=1)
+        pdf.ln()
+        return pdf
+
+    def _encode(self, text: str) -> str:
+        return text if self.font_path else text.encode("latin-1", "replace").decode("latin-1")
+
+    def generate(self, rows: Iterable[tuple[str, Announcement]], file_path: str) -> str:
+        """
+        Write rows to PDF documents of at most rows_per_file rows each.
+        fpdf keeps every page of a document in memory until it is written, so each part is
+        written out as soon as it is full; memory is bounded by one part, not by the row count.
+        A single part is saved as file_path; several parts are packed into a ZIP archive next to it.
+        :param rows: Iterable of (department, Announcement).
+        :param file_path: Output file path.
+        :return: The path of the PDF, or of the ZIP archive when the rows span several parts.
+        """
+        if not self.font_path:
+            logging.warning("REPORT_FONT_PATH is not set. Non-Latin characters will be replaced in the PDF report.")
+
+        # 부분 파일은 보고서 폴더의 정리 대상(report_*)이 되지 않도록 같은 위치의 임시 폴더에 쓰고,
+        # 완성된 PDF나 ZIP만 보고서 폴더로 옮김
+        base, _ = os.path.splitext(file_path)
+        name = os.path.basename(base)
+        parts_dir = tempfile.mkdtemp(prefix=".parts_", dir=os.path.dirname(file_path) or None)
+        try:
+            parts = []
+            pdf, count = None, 0
+            for department, announcement in rows:
+                if pdf is None:
+                    pdf, count = self._new_document(), 0
+                for width, value in zip(self.WIDTHS, _values(department, announcement)):
+                    pdf.cell(width, 5, self._encode(str(value))[:90], border=1)
+                pdf.ln()
+                count += 1
+                if count == self.rows_per_file:
+                    parts.append(os.path.join(parts_dir, f"{name}_part{len(parts) + 1}.pdf"))
+                    pdf.output(parts[-1], "F")
+                    pdf = None
+            if pdf is not None or not parts:
+                parts.append(os.path.join(parts_dir, f"{name}_part{len(parts) + 1}.pdf"))
+                (pdf or self._new_document()).output(parts[-1], "F")
+
+            if len(parts) == 1:
+                os.replace(parts[0], file_path)
+                return file_path
+
+            # 여러 부분으로 나뉘면 하나의 ZIP으로 묶어 전달
+            zip_path = f"{base}.zip"
+            staged = os.path.join(parts_dir, f"{name}.zip")
+            with zipfile.ZipFile(staged, "w", zipfile.ZIP_DEFLATED) as archive:
+                for part in parts:
+                    archive.write(part, os.path.basename(part))
+                    os.remove(part)
+            os.replace(staged, zip_path)
+            return zip_path
+        finally:
+            shutil.rmtree(parts_dir, ignore_errors=True)
+
+
+class CSVReport:
+    extension = "csv"
+
+    def generate(self, rows: Iterable[tuple[str, Announcement]], file_path: str) -> str:
+        """
+        Write rows to a UTF-8 CSV file (with BOM so Excel detects the encoding), one row at a time.
+        :param rows: Iterable of (department, Announcement).
+        :param file_path: Output file path.
+        :return: The file path.
+        """
+        with open(file_path, "w", newline="", encoding="utf-8-sig") as file:
+            writer = csv.writer(file)
+            writer.writerow(COLUMNS)
+            for department, announcement in rows:
+                writer.writerow(_values(department, announcement))
+        return file_path
+
+
+class JSONLReport:
+    extension = "jsonl"
+
+    def generate(self, rows: Iterable[tuple[str, Announcement]], file_path: str) -> str:
+        """
+        Write rows as JSON Lines, one announcement object per line, for bulk consumers.
+        :param rows: Iterable of (department, Announcement).
+        :param file_path: Output file path.
+        :return: The file path.
+        """
+        with open(file_path, "w", encoding="utf-8") as file:
+            for department, announcement in rows:
+                record = {
+                    "학과": department,
+                    "번호": announcement.number,
+                    "제목": announcement.title,
+                    "작성자": announcement.author,
+                    "조회수": announcement.views,
+                    "등록일": announcement.date_text or None,
+                }
+                file.write(json.dumps(record, ensure_ascii=False))
+                file.write("\n")
+        return file_path
+
+
+class StreamingReportFactory:
+    FORMATS = ("excel", "pdf", "csv", "jsonl")
+
+    def create_report(self, format: str):
+        """
+        Create a streaming report writer for the given format.
+        :param format: "excel", "pdf", "csv" or "jsonl".
+        :return: A writer with a generate(rows, file_path) method, or None if the format is not supported.
+        """
+        if format == "excel":
+            return StreamingExcelReport()
+        elif format == "pdf":
+            return StreamingPDFReport()
+        elif format == "csv":
+            return CSVReport()
+        elif format == "jsonl":
+            return JSONLReport()
+        return None
@@ -1,47 +1,105 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from src.boards.announcement import Announcement
 from src.boards.board_factory import BoardFactory
+from src.boards.board_source import CrawlError, older_than
+from src.boards.circuit_breaker import CircuitOpenError
+from src.storage.announcement_cache import AnnouncementCache
+from src.storage.announcement_store import AnnouncementStore
+from src.storage.article_store import ArticleStore
+from src.monitoring.metrics import metrics
 import logging
 
 class BoardHandler:
-    def __init__(self, shared_cache: dict = None):
+    def __init__(self, shared_cache: AnnouncementCache = None, store: AnnouncementStore = None,
+                 articles: ArticleStore = None, article_batch_size: int = 20, article_workers: int = 2,
+                 snapshot_days: int = 180):
         """
         Initialize the BoardHandler with optional shared cache.
-        :param shared_cache: Shared cache to synchronize with other handlers (e.g., ReportHandler).
+        :param shared_cache: Announcement cache shared with the other handlers (e.g., ReportHandler).
+        :param store: Optional persistent store. Snapshots are loaded from it at startup and written to it after crawls.
+        :param snapshot_days: Days of stored history loaded into the cache at startup; older rows stay in the store.
+        :param articles: Optional store of article details filled by prefetch_articles.
+        :param article_batch_size: Maximum number of article pages fetched per prefetch batch.
+        :param article_workers: Maximum number of article pages fetched concurrently.
         """
         self.factory = BoardFactory()
-        self.cached_data = shared_cache if shared_cache is not None else {}  # Shared or local cache
+        self.cache = shared_cache if shared_cache is not None else AnnouncementCache()
+        self.store = store
+        self.articles = articles
+        self.article_batch_size = article_batch_size
+        self.article_workers = max(1, article_workers)
+        self.snapshot_days = snapshot_days
+        self.cache.on_evict(self._release)
+        if self.store is not None:
+            self._load_snapshots()
 
-    def update_cache(self, department: str, data: list[list[str]]):
+    def _load_snapshots(self):
+        """
+        Load the recent stored announcements of every department into the cache and the board crawl state.
+        """
+        for department in self.factory.departments():
+            try:
+                self._seed(department)
+            except Exception as e:
+                logging.error(f"Error loading stored announcements for department '{department}': {e}")
+
+    def _seed(self, department: str) -> bool:
+        """
+        Cache the last snapshot_days of a department's stored announcements and resume its incremental
+        crawl from the newest stored article number, without reading the whole history.
+        :param department: The department name.
+        :return: True if anything was stored for the department.
+        """
+        last_seen_number = self.store.max_number(department)
+        if last_seen_number is None:
+            return False
+        since = (datetime.now() - timedelta(days=self.snapshot_days)).date().isoformat()
+        announcements = self.store.load(department, since)
+        # 마지막 크롤링 시각을 기준으로 TTL을 판단
+        self.cache.put(department, announcements, updated_at=self.store.last_crawled(department) or 0)
+        self.factory.get_board(department).seed(announcements, last_seen_number)
+        logging.info(f"Loaded {len(announcements)} stored announcements since {since} for department '{department}'")
+        return True
+
+    def _release(self, department: str):
+        # 캐시에서 밀려난 학과는 게시판 객체도 행을 놓아야 메모리가 실제로 해제됨
+        self.factory.get_board(department).release()
+
+    def update_cache(self, department: str, data: list[Announcement]):
         """
         Update the cached data for a specific department.
+        An incomplete crawl result never replaces an existing dataset.
         :param department: The department name (e.g., "computer", "electrical").
         :param data: The announcement data to cache.
+        :return: True if the cache was updated.
         """
         try:
-            if not isinstance(data, list) or not all(isinstance(row, list) and len(row) == 5 for row in data):
-                raise ValueError(f"Invalid data format for department '{department}': {data}")
-
-            # 캐시에 데이터 업데이트
-            self.cached_data[department] = data
-            logging.info(f"Cache updated for department '{department}', total items: {len(data)}")
+            return self.cache.put(department, data)
         except Exception as e:
             logging.error(f"Error updating cache for department '{department}': {e}")
             raise
 
-    def handle_request(self, department: str) -> list[list[str]]:
+    def handle_request(self, department: str, refresh: bool = False) -> list[Announcement]:
         """
         Handle request for fetching announcements for a department.
         Use cached data if available, otherwise fetch new data.
+        New data is fetched incrementally: only the pages up to the first
+        already-seen article are downloaded and merged into the known list.
         :param department: The department name (e.g., "computer", "electrical").
+        :param refresh: If True, ignore the cached data and fetch new announcements.
         :return: List of announcement data.
         """
         try:
-            logging.info(f"Handling request for department: '{department}'")
+            department = self.factory.resolve(department)
+            logging.debug(f"Handling request for department: '{department}'")
 
             # 캐시 데이터 확인
-            if department in self.cached_data:
-                cached_data = self.cached_data[department]
+            if not refresh and department in self.cache:
+                cached_data = self.cache.get(department)
                 if cached_data:
-                    logging.info(f"Returning cached data for department '{department}', total items: {len(cached_data)}")
+                    logging.debug(f"Returning cached data for department '{department}', total items: {len(cached_data)}")
                     return cached_data
                 else:
                     logging.warning(f"Cache exists for department '{department}', but it is empty.")
@@ -50,15 +108,23 @@ class BoardHandler:
             board = self.factory.get_board(department)
             if not board:
                 raise ValueError(f"Board not found for department '{department}'")
+            # 캐시에서 밀려났거나 무효화된 학과는 저장소의 최근 구간과 마지막 번호부터 다시 이어서 크롤링
+            if department not in self.cache and self.store is not None:
+                self._seed(department)
 
-            announcements = board.fetch_announcements()
+            announcements = board.fetch_announcements(incremental=True)
 
-            # 데이터 검증
-            if not isinstance(announcements, list) or not all(isinstance(row, list) and len(row) == 5 for row in announcements):
+            # 데이터 검증 (행은 크롤링 시점에 Announcement로 변환되어 있음)
+            if not isinstance(announcements, list):
                 raise ValueError(f"Invalid data fetched for department '{department}': {announcements}")
 
-            # 캐시 업데이트 및 데이터 반환
-            self.update_cache(department, announcements)
+            # 캐시 업데이트 및 데이터 반환 (크롤링이 중간에 끊겼으면 마지막 정상 스냅샷으로 대체)
+            if not self.update_cache(department, announcements):
+                return self.cache.get(department) or []
+            # 이번 크롤링에서 실제로 읽은 페이지의 행만 저장 (이전 목록에서 가져온 행은 이미 저장되어 있음)
+            walked = getattr(announcements, "walked", announcements)
+            if self.store is not None and walked:
+                self.store.save(department, walked)
             return announcements
 
         except ValueError as ve:
@@ -67,3 +133,88 @@ class BoardHandler:
         except Exception as e:
             logging.error(f"Unexpected error while handling request for department '{department}': {e}")
             return []
+
+    def fetch_recent(self, department: str, days: int = 30) -> list[Announcement]:
+        """
+        Fetch only the announcements of the last few days, stopping the crawl at the first older post.
+        The result is not cached since it is not the full board.
+        :param department: The department name (e.g., "computer", "electrical").
+        :param days: How many days back to fetch.
+        :return: List of recent announcement data.
+        """
+        recent = []
+        try:
+            board = self.factory.get_board(department)
+            cutoff = datetime.now() - timedelta(days=days)
+            for announcement in board.iter_announcements(stop=older_than(cutoff)):
+                recent.append(announcement)
+            return recent
+        except (CrawlError, CircuitOpenError) as e:
+            logging.error(f"Crawl error while fetching recent announcements for department '{department}': {e}")
+            return recent
+        except ValueError as ve:
+            logging.error(f"ValueError while fetching recent announcements for department '{department}': {ve}")
+            return []
+        except Exception as e:
+            logging.error(f"Unexpected error while fetching recent announcements for department '{department}': {e}")
+            return []
+
+    def prefetch_articles(self, department: str, announcements: list[Announcement]) -> dict:
+        """
+        Fetch and store the details of articles that were never fetched, newest first,
+        at most article_batch_size of them. Meant to run in the background after a refresh.
+        :param department: The department name (e.g., "computer", "electrical").
+        :param announcements: Candidate announcements (e.g. the new posts of a refresh).
+        :return: Prefetch stats (fetched, failed, cached, bytes, seconds) and under "deferred" the
+                 announcements left for a later batch: those past the batch size and those skipped
+                 while the circuit for the host was open.
+        """
+        stats = {"fetched": 0, "failed": 0, "cached": 0, "bytes": 0, "seconds": 0.0, "deferred": []}
+        if self.articles is None:
+            return stats
+
+        by_url = {}
+        for announcement in announcements:
+            if announcement.url:
+                by_url.setdefault(announcement.url, announcement)
+        missing = self.articles.missing(list(by_url))
+        stats["cached"] = len(by_url) - len(missing)
+        batch = missing[:self.article_batch_size]
+        deferred = missing[self.article_batch_size:]
+        if not batch:
+            return stats
+
+        board = self.factory.get_board(department)
+        bytes_before = metrics.counter_value("http_bytes", board=board.name, kind="article")
+        start = time.perf_counter()
+
+        def fetch(url):
+            try:
+                self.articles.save(board.fetch_article(url))
+                return "fetched"
+            except CircuitOpenError:
+                return "deferred"
+            except CrawlError as e:
+                logging.warning(f"Could not fetch article {url}: {e}")
+            except Exception as e:
+                logging.error(f"Unexpected error while fetching article {url}: {e}")
+            return "failed"
+
+        with ThreadPoolExecutor(max_workers=self.article_workers) as executor:
+            for url, outcome in zip(batch, executor.map(fetch, batch)):
+                if outcome == "deferred":
+                    deferred.append(url)
+                else:
+                    stats[outcome] += 1
+
+        stats["deferred"] = [by_url[url] for url in deferred]
+        stats["seconds"] = time.perf_counter() - start
+        stats["bytes"] = int(metrics.counter_value("http_bytes", board=board.name, kind="article") - bytes_before)
+        metrics.observe("prefetch_seconds", stats["seconds"], board=board.name)
+        metrics.inc("articles_fetched", stats["fetched"], board=board.name)
+        logging.info(
+            f"Prefetched {stats['fetched']} article(s) for department '{department}' in {stats['seconds']:.2f}s "
+            f"({stats['bytes']} bytes, {stats['failed']} failed, {stats['cached']} already cached, "
+            f"{len(deferred)} deferred)."
+        )
+        return stats
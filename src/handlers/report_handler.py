@@ -1,76 +1,139 @@
-from src.reports.report_factory import ReportFactory
+from src.boards.announcement import Announcement
+from src.exports.stream_reports import StreamingReportFactory
+from src.storage.announcement_cache import AnnouncementCache
+from src.storage.announcement_store import AnnouncementStore
+from src.monitoring.metrics import metrics
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import asyncio
+import glob
+import multiprocessing
+import os
+import time
+import uuid
 import logging
 
 
+def _render_export(format: str, departments: list[str], db_path: str, data: dict, file_path: str) -> str:
+    """
+    Stream announcements into a report file in a worker, reading them lazily from the store
+    (or from the given cached lists when there is no store), so memory does not grow with the row count.
+    :param format: The format of the report (e.g., "excel", "pdf", "csv", "jsonl").
+    :param departments: Departments to export, in order.
+    :param db_path: Path of the announcement store, or None.
+    :param data: Cached announcements per department, used when db_path is None.
+    :param file_path: Output file path.
+    :return: The file path of the generated report (a ZIP archive for a PDF split into several parts).
+    """
+    report = StreamingReportFactory().create_report(format)
+    if db_path is None:
+        return report.generate(((d, a) for d in departments for a in data[d]), file_path)
+
+    store = AnnouncementStore(db_path)
+    try:
+        return report.generate(((d, a) for d in departments for a in store.iter_announcements(d)), file_path)
+    finally:
+        store.close()
+
+
 class ReportHandler:
-    def __init__(self, cached_data: dict = None):
+    def __init__(self, cache: AnnouncementCache = None, reports_dir: str = "reports", max_reports: int = 50,
+                 max_report_age: int = 7 * 24 * 3600, store: AnnouncementStore = None, workers: int = 4):
         """
-        Initialize the ReportHandler with optional cached data.
-        :param cached_data: A dictionary containing cached announcement data per department.
+        Initialize the ReportHandler with an optional shared cache.
+        :param cache: Announcement cache shared with the other handlers; its per-department versions key the generated reports.
+        :param reports_dir: Directory the report writers save files to.
+        :param max_reports: Maximum number of report files kept in reports_dir.
+        :param max_report_age: Report files older than this many seconds are deleted.
+        :param store: Optional announcement store; reports stream the full history from it instead of the cache.
+        :param workers: Reports generated concurrently per pool (PDF processes, other formats threads).
         """
-        self.factory = ReportFactory()
-        self.cached_data = cached_data if cached_data is not None else {}
+        self.stream_factory = StreamingReportFactory()
+        self.store = store
+        self.cache = cache if cache is not None else AnnouncementCache()
+        self.reports_dir = reports_dir
+        self.max_reports = max_reports
+        self.max_report_age = max_report_age
+
+        # (형식, 학과, 캐시 버전)별 생성된 보고서 경로
+        self._report_cache = {}
+        self._pending = {}
+        self._in_progress = {}  # (형식, 학과, 캐시 버전) -> 생성 중인 보고서 파일 이름 (확장자 제외)
 
-    def update_cache(self, department: str, data: list[list[str]]):
+        # 큰 보고서 하나가 다른 보고서를 막지 않도록 여러 작업자를 둠 (파일 이름은 요청마다 고유)
+        # PDF는 CPU를 많이 쓰므로 별도 프로세스에서 생성하고, 봇의 스레드/이벤트 루프 상태를
+        # fork로 복제하지 않도록 spawn으로 시작
+        workers = max(1, workers)
+        self._executors = {
+            "pdf": ProcessPoolExecutor(max_workers=max(1, workers // 2), mp_context=multiprocessing.get_context("spawn")),
+            "default": ThreadPoolExecutor(max_workers=workers),
+        }
+
+    def update_cache(self, department: str, data: list[Announcement]):
         """
         Update the cached data for a specific department.
+        The records are shared as-is with the report writers.
         :param department: The department name (e.g., "computer", "electrical").
         :param data: The announcement data to cache.
         """
         try:
-            if not isinstance(data, list) or not all(isinstance(row, list) and len(row) == 5 for row in data):
-                raise ValueError(f"Invalid data format for department '{department}': {data}")
-
-            # Transform and update cache
-            transformed_data = self._transform_data(data)
-            self.cached_data[department] = transformed_data
-            logging.info(f"Cache updated for department '{department}', total items: {len(transformed_data)}")
+            self.cache.put(department, data)
         except Exception as e:
             logging.error(f"Error updating cache for department '{department}': {e}")
             raise
 
-    def _transform_data(self, raw_data: list[list[str]]) -> list[dict]:
-        """
-        Transform raw table data into a list of dictionaries.
-        :param raw_data: List of table rows as lists of strings.
-        :return: List of dictionaries with headers as keys.
-        """
-        headers = ["번호", "제목", "작성자", "조회수", "등록일"]
-        transformed = []
-        for row in raw_data:
-            if len(row) == len(headers):
-                transformed.append(dict(zip(headers, row)))
-            else:
-                logging.warning(f"Skipping malformed row: {row}")
-        return transformed
-
-    def generate_report(self, format: str, department: str) -> str:
+    async def generate_report_async(self, format: str, department: str) -> str:
         """
-        Generate a report based on the specified format and department.
+        Generate a report in a worker pool without blocking the event loop.
+        A report already generated for the same format, department and data version is
+        returned right away, and concurrent requests for it share one generation.
         :param format: The format of the report (e.g., "excel", "pdf").
         :param department: The department for which to generate the report.
-        :return: The file path of the generated report.
+        :return: A message with the file path of the report, or an error message.
         """
         try:
-            # 캐시 데이터 확인
             logging.info(f"Generating report for department '{department}' in format '{format}'")
-            if department not in self.cached_data:
-                logging.error(f"Department '{department}' not found in cached_data.")
+            # 생성 도중 캐시가 갱신되어도 같은 버전의 데이터를 쓰도록 스냅샷을 한 번만 읽음
+            departments = sorted(self.cache.departments()) if department == "all" else [department]
+            snapshots = {d: self.cache.snapshot(d) for d in departments}
+            if not departments or not all(s is not None and s.announcements for s in snapshots.values()):
+                logging.error(f"No cached data for department '{department}'.")
                 return f"Error: No data available for department '{department}'."
-            
-            cached_data = self.cached_data[department]
-            if not cached_data:
-                logging.error(f"Cached data for department '{department}' is empty.")
-                return f"Error: No data available for department '{department}'."
-            
-            logging.debug(f"Cached data for '{department}': {cached_data}")
 
-            # 보고서 생성
-            report = self.factory.create_report(format)
-            if not report:
+            writer = self.stream_factory.create_report(format)
+            if not writer:
                 raise ValueError(f"Report format '{format}' is not supported.")
 
-            file_path = report.generate(cached_data)
+            version = "-".join(str(snapshots[d].version) for d in departments)
+            key = (format, department, version)
+            file_path = self._report_cache.get(key)
+            if file_path and os.path.exists(file_path):
+                metrics.inc("report_cache", result="hit")
+                logging.info(f"Returning cached report: {file_path}")
+                return f"Report successfully generated: {file_path}"
+
+            metrics.inc("report_cache", result="miss")
+            future = self._pending.get(key)
+            if future is None:
+                name = f"report_{department}_v{version}_{uuid.uuid4().hex[:8]}"
+                executor = self._executors.get(format, self._executors["default"])
+                loop = asyncio.get_running_loop()
+                # 모든 보고서는 전체 이력을 저장소에서 행 단위로 읽어 스트리밍으로 작성
+                os.makedirs(self.reports_dir, exist_ok=True)
+                file_path = os.path.join(self.reports_dir, f"{name}.{writer.extension}")
+                db_path = self.store.db_path if self.store is not None else None
+                data = None if db_path else {d: snapshots[d].announcements for d in departments}
+                future = loop.run_in_executor(executor, _render_export, format, departments, db_path, data, file_path)
+                self._pending[key] = future
+                self._in_progress[key] = name
+            try:
+                with metrics.timer("report_seconds", format=format):
+                    file_path = await asyncio.shield(future)
+            finally:
+                self._pending.pop(key, None)
+                self._in_progress.pop(key, None)
+
+            self._report_cache[key] = file_path
+            self._evict_old_reports()
             logging.info(f"Report successfully generated: {file_path}")
             return f"Report successfully generated: {file_path}"
 
@@ -80,3 +143,36 @@ class ReportHandler:
         except Exception as e:
             logging.error(f"Unexpected error while generating report: {e}")
             return f"Error: An unexpected error occurred."
+
+    def _evict_old_reports(self):
+        """
+        Delete report files older than max_report_age and keep at most max_reports files,
+        then forget cached paths whose files are gone.
+        Reports still being written are never removed, and files that disappear while
+        this runs (removed by another worker) are skipped.
+        """
+        in_progress = tuple(self._in_progress.values())
+        files = []
+        for path in glob.glob(os.path.join(self.reports_dir, "report_*")):
+            if in_progress and os.path.basename(path).startswith(in_progress):
+                continue
+            try:
+                files.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+        files.sort(reverse=True)
+
+        cutoff = time.time() - self.max_report_age
+        for index, (mtime, path) in enumerate(files):
+            if index >= self.max_reports or mtime < cutoff:
+                try:
+                    os.remove(path)
+                    logging.info(f"Evicted old report: {path}")
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logging.warning(f"Could not remove old report {path}: {e}")
+
+        for key, path in list(self._report_cache.items()):
+            if not os.path.exists(path):
+                del self._report_cache[key]
@@ -0,0 +1,270 @@
+import asyncio
+import bisect
+import cProfile
+import heapq
+import io
+import os
+import pstats
+import random
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import logging
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile as the upper bound of the bucket that contains it.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+class MetricsRegistry:
+    def __init__(self):
+        """
+        Thread-safe in-process counters and histograms, keyed by metric name and label values.
+        Recording is a dict lookup and an add under a lock, cheap enough for the crawl hot path.
+        """
+        self._lock = threading.Lock()
+        self._counters = {}  # (name, labels) -> float
+        self._histograms = {}  # (name, labels) -> Histogram
+
+    @staticmethod
+    def _key(name: str, labels: dict):
+        return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """
+        Record the duration of the block in seconds in the histogram `name`.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def counter_value(self, name: str, **labels) -> float:
+        with self._lock:
+            return self._counters.get(self._key(name, labels), 0)
+
+    def render_prometheus(self) -> str:
+        """
+        :return: All metrics in the Prometheus text exposition format.
+        """
+        def fmt_labels(labels, extra=()):
+            pairs = [f'{k}="{v}"' for k, v in labels + tuple(extra)]
+            return "{" + ",".join(pairs) + "}" if pairs else ""
+
+        lines = []
+        with self._lock:
+            for name in sorted({name for name, _ in self._counters}):
+                lines.append(f"# TYPE {name} counter")
+                for (metric, labels), value in sorted(self._counters.items()):
+                    if metric == name:
+                        lines.append(f"{name}{fmt_labels(labels)} {value}")
+            for name in sorted({name for name, _ in self._histograms}):
+                lines.append(f"# TYPE {name} histogram")
+                for (metric, labels), histogram in sorted(self._histograms.items(), key=lambda item: item[0]):
+                    if metric != name:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets + ("+Inf",), histogram.counts):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{fmt_labels(labels, [('le', bound)])} {cumulative}")
+                    lines.append(f"{name}_sum{fmt_labels(labels)} {histogram.sum}")
+                    lines.append(f"{name}_count{fmt_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> str:
+        """
+        :return: A short human-readable summary (count, average, p50/p95/p99) for the /stats command.
+        """
+        lines = []
+        with self._lock:
+            for (name, labels), histogram in sorted(self._histograms.items(), key=lambda item: item[0]):
+                label_text = ",".join(f"{k}={v}" for k, v in labels)
+                lines.append(
+                    f"{name}[{label_text}] n={histogram.count} avg={histogram.sum / histogram.count:.3f}s "
+                    f"p50≤{histogram.quantile(0.5)} p95≤{histogram.quantile(0.95)} p99≤{histogram.quantile(0.99)}"
+                )
+            for (name, labels), value in sorted(self._counters.items()):
+                label_text = ",".join(f"{k}={v}" for k, v in labels)
+                lines.append(f"{name}[{label_text}] {value:g}")
+        return "\n".join(lines)
+
+
+class _TaskClock:
+    def __init__(self, task: asyncio.Task):
+        """
+        cProfile timer that only advances while the given task runs, so coroutines that the event
+        loop runs while the profiled request awaits (and the loop's own waiting) add no time to it.
+        """
+        self.task = task
+        self.elapsed = 0.0
+        self._last = time.perf_counter()
+
+    def __call__(self) -> float:
+        now = time.perf_counter()
+        if asyncio.current_task() is self.task:
+            self.elapsed += now - self._last
+        self._last = now
+        return self.elapsed
+
+
+def _running_task():
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return None
+
+
+class SlowRequestProfiler:
+    def __init__(self, sample_rate: float = 0.0, keep: int = 5):
+        """
+        Opt-in sampling profiler: profiles a random sample of requests with cProfile and keeps
+        the profiles of the slowest ones. Requests are ranked by wall time, but inside an asyncio
+        task the profile times only that task's own execution; other coroutines that run while it
+        awaits may still appear in the listing, with no time attributed to them.
+        :param sample_rate: Fraction of requests to profile (0 disables profiling).
+        :param keep: Number of slowest profiles to keep.
+        """
+        self.sample_rate = sample_rate
+        self.keep = keep
+        self._lock = threading.Lock()
+        self._active = False  # cProfile은 동시에 하나만 활성화
+        self._slowest = []  # min-heap of (duration, sequence, name, stats text)
+        self._sequence = 0
+
+    @contextmanager
+    def profile(self, name: str):
+        sampled = self.sample_rate > 0 and random.random() < self.sample_rate
+        if sampled:
+            with self._lock:
+                sampled = not self._active
+                self._active = self._active or sampled
+        if not sampled:
+            yield
+            return
+
+        # 이벤트 루프 안에서는 await 동안 실행되는 다른 코루틴의 시간이 섞이지 않도록 이 태스크의 시간만 잼
+        task = _running_task()
+        profiler = cProfile.Profile(_TaskClock(task)) if task is not None else cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            duration = time.perf_counter() - start
+            with self._lock:
+                self._active = False
+            self._record(name, duration, profiler)
+
+    def _record(self, name: str, duration: float, profiler: cProfile.Profile):
+        with self._lock:
+            if len(self._slowest) >= self.keep and duration <= self._slowest[0][0]:
+                return
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(25)
+        with self._lock:
+            self._sequence += 1
+            entry = (duration, self._sequence, name, output.getvalue())
+            if len(self._slowest) < self.keep:
+                heapq.heappush(self._slowest, entry)
+            else:
+                heapq.heappushpop(self._slowest, entry)
+
+    def slowest(self) -> list[tuple[str, float]]:
+        with self._lock:
+            return [(name, duration) for duration, _, name, _ in sorted(self._slowest, reverse=True)]
+
+    def dump(self, path: str) -> str:
+        """
+        Write the kept profiles, slowest first, to a text file.
+        :return: The file path.
+        """
+        with self._lock:
+            entries = sorted(self._slowest, reverse=True)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            for duration, _, name, text in entries:
+                file.write(f"=== {name}: {duration:.3f}s ===\n{text}\n")
+        return path
+
+
+class MetricsServer:
+    def __init__(self, registry: MetricsRegistry, port: int, host: str = "127.0.0.1"):
+        """
+        Minimal local HTTP endpoint serving GET /metrics in the Prometheus text format.
+        """
+        registry_ref = registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry_ref.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, name="metrics", daemon=True).start()
+        logging.info(f"Metrics endpoint listening on http://{self.server.server_address[0]}:{self.server.server_address[1]}/metrics")
+
+    def stop(self):
+        self.server.shutdown()
+
+
+# 봇, 핸들러, BoardSource가 공유하는 기본 레지스트리와 프로파일러
+metrics = MetricsRegistry()
+profiler = SlowRequestProfiler(float(os.getenv("PROFILE_SAMPLE_RATE", "0")))
@@ -0,0 +1,164 @@
+import re
+import heapq
+import threading
+from collections import Counter
+
+from src.boards.announcement import Announcement
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _grams(text: str) -> Counter:
+    """
+    Split text into character bigrams per word (single-character words are kept as unigrams).
+    Bigrams work for Korean without a morphological analyzer: "수강신청" -> 수강, 강신, 신청.
+    """
+    grams = Counter()
+    for word in _WHITESPACE.split(text.lower()):
+        if len(word) == 1:
+            grams[word] += 1
+        for i in range(len(word) - 1):
+            grams[word[i:i + 2]] += 1
+    return grams
+
+
+class TitleIndex:
+    def __init__(self):
+        """
+        In-memory inverted index over announcement titles for all departments.
+        Documents are keyed by (department, article number); pinned notices without a number by (department, title).
+        """
+        self._postings = {}  # gram -> {doc_key: term frequency}
+        self._docs = {}  # doc_key -> (department, Announcement)
+        self._department_keys = {}  # department -> set of doc_key
+        self._bigrams_by_char = {}  # 한 글자 검색용: 글자 -> 그 글자를 포함하는 bigram 집합
+        self._char_postings = {}  # 글자 -> 합친 postings (색인이 바뀌면 비움)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _doc_key(department: str, announcement: Announcement):
+        if announcement.number is not None:
+            return department, announcement.number
+        return department, announcement.title
+
+    def _add(self, key, department: str, announcement: Announcement):
+        self._char_postings.clear()
+        self._docs[key] = (department, announcement)
+        self._department_keys.setdefault(department, set()).add(key)
+        for gram, count in _grams(announcement.title).items():
+            postings = self._postings.get(gram)
+            if postings is None:
+                postings = self._postings[gram] = {}
+                if len(gram) == 2:
+                    for char in set(gram):
+                        self._bigrams_by_char.setdefault(char, set()).add(gram)
+            postings[key] = count
+
+    def _remove(self, key):
+        self._char_postings.clear()
+        department, announcement = self._docs.pop(key)
+        self._department_keys[department].discard(key)
+        for gram in _grams(announcement.title):
+            postings = self._postings.get(gram)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self._postings[gram]
+                    if len(gram) == 2:
+                        for char in set(gram):
+                            bigrams = self._bigrams_by_char[char]
+                            bigrams.discard(gram)
+                            if not bigrams:
+                                del self._bigrams_by_char[char]
+
+    def _postings_for(self, gram: str) -> dict:
+        """
+        :return: The postings of a query gram. A single character also matches every title word
+                 containing it, so its postings merge those of all bigrams with that character.
+        """
+        if len(gram) != 1:
+            return self._postings.get(gram, {})
+        merged = self._char_postings.get(gram)
+        if merged is None:
+            merged = dict(self._postings.get(gram, {}))
+            for bigram in self._bigrams_by_char.get(gram, ()):
+                for key, count in self._postings[bigram].items():
+                    merged[key] = merged.get(key, 0) + count
+            self._char_postings[gram] = merged
+        return merged
+
+    def update(self, department: str, announcements: list[Announcement]):
+        """
+        Bring the index in line with the latest announcements of a department.
+        Only added, removed or retitled announcements touch the postings.
+        :param department: The department name.
+        :param announcements: The current announcements of the department.
+        """
+        current = {self._doc_key(department, a): a for a in announcements}
+        with self._lock:
+            stale = [key for key in self._department_keys.get(department, ()) if key not in current]
+            for key in stale:
+                self._remove(key)
+            for key, announcement in current.items():
+                existing = self._docs.get(key)
+                if existing is None:
+                    self._add(key, department, announcement)
+                elif existing[1].title != announcement.title:
+                    self._remove(key)
+                    self._add(key, department, announcement)
+                else:
+                    # 제목이 같으면 색인은 그대로 두고 레코드(조회수 등)만 교체
+                    self._docs[key] = (department, announcement)
+
+    def remove(self, department: str):
+        """
+        Drop every indexed announcement of a department (e.g. when it is evicted from the cache).
+        :param department: The department name.
+        """
+        with self._lock:
+            for key in list(self._department_keys.get(department, ())):
+                self._remove(key)
+            self._department_keys.pop(department, None)
+
+    def search(self, query: str, department: str = None, page: int = 1, page_size: int = 10):
+        """
+        Find announcements whose titles contain every bigram of the query
+        (a one-character query word matches titles containing that character).
+        Results are ranked by how often the query bigrams occur (exact phrase matches first), then newest first.
+        :param query: The search keyword(s).
+        :param department: Optional department to restrict the search to.
+        :param page: 1-based result page.
+        :param page_size: Number of results per page.
+        :return: Tuple of (list of (department, Announcement), total number of matches).
+        """
+        grams = _grams(query)
+        if not grams:
+            return [], 0
+        needle = _WHITESPACE.sub(" ", query.strip().lower())
+
+        with self._lock:
+            postings = [self._postings_for(gram) for gram in grams]
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates.intersection_update(posting)
+                if not candidates:
+                    break
+            if department is not None:
+                candidates = {key for key in candidates if key[0] == department}
+
+            scored = []
+            for key in candidates:
+                dept, announcement = self._docs[key]
+                score = sum(posting[key] for posting in postings)
+                if needle in announcement.title.lower():
+                    score += len(grams)
+                scored.append((score, announcement.date_text, announcement.number or 0, dept, announcement))
+
+        # 요청한 페이지까지만 부분 정렬
+        start = (max(page, 1) - 1) * page_size
+        top = heapq.nlargest(start + page_size, scored, key=lambda item: item[:3])
+        return [(dept, a) for _, _, _, dept, a in top[start:]], len(scored)
+
+    def __len__(self):
+        return len(self._docs)
@@ -0,0 +1,157 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from src.boards.announcement import Announcement
+import logging
+
+
+@dataclass(frozen=True, slots=True)
+class CacheSnapshot:
+    """
+    Read view of one department's cached announcements.
+    The rows are the crawled Announcement records themselves, shared read-only by every consumer.
+    """
+    department: str
+    announcements: tuple[Announcement, ...]
+    version: int  # 데이터가 바뀔 때만 올라감 (보고서/페이지 캐시 키)
+    updated_at: float  # 마지막으로 완전한 크롤링 결과가 저장된 시각 (epoch 초)
+    complete: bool
+
+    def age(self, now: float = None) -> float:
+        return (now if now is not None else time.time()) - self.updated_at
+
+
+class AnnouncementCache:
+    def __init__(self, ttl: float = 1800, max_items: int = 200_000):
+        """
+        The single in-memory cache of announcements per department, shared by the board handler,
+        the report handler and the bot. Thread-safe, since crawls store results from worker threads.
+        :param ttl: Seconds after which a snapshot is stale (still served, but due for a refresh).
+        :param max_items: Maximum number of announcements kept in total; least recently used
+                          departments are evicted beyond it.
+        """
+        self.ttl = ttl
+        self.max_items = max_items
+        self._lock = threading.Lock()
+        self._snapshots = OrderedDict()  # department -> CacheSnapshot, LRU 순서
+        self._versions = {}  # 제거된 학과도 다시 채워질 때 버전이 되돌아가지 않도록 따로 보관
+        self._size = 0
+        self._evict_listeners = []
+
+    def on_evict(self, listener):
+        """
+        Register a callback called with the department name whenever a department is evicted,
+        so holders of derived data (crawl state, search index, rendered pages) can drop their
+        references to its rows too; otherwise eviction would not free any memory.
+        Listeners are called outside the cache lock, from the thread that stored the new data.
+        :param listener: Callable taking the department name.
+        """
+        self._evict_listeners.append(listener)
+
+    def put(self, department: str, announcements: list[Announcement], updated_at: float = None) -> bool:
+        """
+        Store a crawl result for a department.
+        An incomplete result (CrawlResult.complete is False) never replaces existing data.
+        The version is bumped only if the rows differ from the cached ones.
+        :param department: The department name.
+        :param announcements: The announcements, newest first.
+        :param updated_at: Crawl time in epoch seconds; defaults to now.
+        :return: True if the result was stored.
+        """
+        if not isinstance(announcements, (list, tuple)):
+            raise ValueError(f"Invalid data format for department '{department}': {announcements}")
+        complete = getattr(announcements, "complete", True)
+        rows = tuple(announcements)
+        evicted = []
+        with self._lock:
+            previous = self._snapshots.pop(department, None)
+            if previous is not None:
+                self._size -= len(previous.announcements)
+                if not complete and previous.announcements:
+                    logging.warning(f"Keeping cached data for department '{department}': new crawl result is incomplete.")
+                    self._snapshots[department] = previous
+                    self._size += len(previous.announcements)
+                    return False
+
+            version = self._versions.get(department, 0)
+            if previous is None or previous.announcements != rows:
+                version += 1
+                self._versions[department] = version
+            self._snapshots[department] = CacheSnapshot(
+                department, rows, version, updated_at if updated_at is not None else time.time(), complete,
+            )
+            self._size += len(rows)
+            evicted = self._evict()
+        logging.info(f"Cache updated for department '{department}', total items: {len(rows)}")
+        for name in evicted:
+            for listener in self._evict_listeners:
+                try:
+                    listener(name)
+                except Exception as e:
+                    logging.error(f"Error in eviction listener for department '{name}': {e}")
+        return True
+
+    def _evict(self) -> list[str]:
+        evicted = []
+        # 가장 최근에 저장한 학과는 남겨 둠
+        while self._size > self.max_items and len(self._snapshots) > 1:
+            department, snapshot = self._snapshots.popitem(last=False)
+            self._size -= len(snapshot.announcements)
+            evicted.append(department)
+            logging.info(f"Evicted cached announcements of department '{department}' ({len(snapshot.announcements)} items).")
+        return evicted
+
+    def snapshot(self, department: str) -> CacheSnapshot | None:
+        """
+        :return: The cached snapshot of the department (marking it recently used), or None.
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(department)
+            if snapshot is not None:
+                self._snapshots.move_to_end(department)
+            return snapshot
+
+    def get(self, department: str) -> tuple[Announcement, ...] | None:
+        """
+        :return: The cached announcements of the department, or None if nothing is cached.
+        """
+        snapshot = self.snapshot(department)
+        return snapshot.announcements if snapshot is not None else None
+
+    def is_fresh(self, department: str) -> bool:
+        with self._lock:
+            snapshot = self._snapshots.get(department)
+        return snapshot is not None and snapshot.age() < self.ttl
+
+    def version(self, department: str) -> int:
+        with self._lock:
+            return self._versions.get(department, 0)
+
+    def departments(self) -> list[str]:
+        with self._lock:
+            return list(self._snapshots)
+
+    def invalidate(self, department: str = None):
+        """
+        Drop the cached snapshot of a department, or of all departments.
+        Versions are kept, so a re-cached department gets a new version and derived caches
+        (rendered pages, reports) are never reused for it.
+        :param department: The department name, or None for all departments.
+        """
+        with self._lock:
+            departments = [department] if department is not None else list(self._snapshots)
+            for name in departments:
+                snapshot = self._snapshots.pop(name, None)
+                if snapshot is not None:
+                    self._size -= len(snapshot.announcements)
+                    self._versions[name] = self._versions.get(name, 0) + 1
+        logging.info(f"Cache invalidated for {department or 'all departments'}.")
+
+    def __contains__(self, department: str) -> bool:
+        with self._lock:
+            return department in self._snapshots
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._size
@@ -0,0 +1,147 @@
+import os
+import sqlite3
+import threading
+import time
+import logging
+from datetime import date
+from src.boards.announcement import Announcement
+
+
+class AnnouncementStore:
+    def __init__(self, db_path: str = None):
+        """
+        Initialize the SQLite-backed announcement store.
+        :param db_path: Path of the SQLite database file. Defaults to $ANNOUNCEMENT_DB_PATH or data/announcements.db.
+        """
+        self.db_path = db_path or os.getenv("ANNOUNCEMENT_DB_PATH", "data/announcements.db")
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # 크롤링은 작업 스레드에서 실행되므로 하나의 연결을 잠금으로 보호하여 공유
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        with self._lock, self._conn:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS announcements (
+                    board TEXT NOT NULL,
+                    number INTEGER NOT NULL,
+                    title TEXT NOT NULL,
+                    author TEXT NOT NULL,
+                    views INTEGER NOT NULL,
+                    reg_date TEXT NOT NULL,
+                    url TEXT,
+                    PRIMARY KEY (board, number)
+                );
+                CREATE INDEX IF NOT EXISTS idx_announcements_reg_date ON announcements (reg_date);
+                CREATE INDEX IF NOT EXISTS idx_announcements_board_reg_date ON announcements (board, reg_date);
+                CREATE TABLE IF NOT EXISTS crawl_state (
+                    board TEXT PRIMARY KEY,
+                    last_crawled REAL NOT NULL
+                );
+                """
+            )
+            # 게시글 링크 열이 없던 기존 DB에 열 추가
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(announcements)")}
+            if "url" not in columns:
+                self._conn.execute("ALTER TABLE announcements ADD COLUMN url TEXT")
+
+    def save(self, board: str, announcements: list[Announcement]):
+        """
+        Upsert the announcements of a board and record the crawl time.
+        Pinned notices without an article number are not stored; they are re-read from the first page on every crawl.
+        :param board: The board (department) name.
+        :param announcements: The announcements of the crawl.
+        """
+        rows = [
+            (board, a.number, a.title, a.author, a.views, a.date_text, a.url)
+            for a in announcements
+            if a.number is not None
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO announcements (board, number, title, author, views, reg_date, url)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (board, number) DO UPDATE SET
+                    title = excluded.title,
+                    author = excluded.author,
+                    views = excluded.views,
+                    reg_date = excluded.reg_date,
+                    url = COALESCE(excluded.url, announcements.url)
+                """,
+                rows,
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO crawl_state (board, last_crawled) VALUES (?, ?)",
+                (board, time.time()),
+            )
+        logging.info(f"Stored {len(rows)} announcements for board '{board}'.")
+
+    def iter_announcements(self, board: str, since: str = None):
+        """
+        Iterate over the stored announcements of a board, newest first, without loading them all into memory.
+        :param board: The board (department) name.
+        :param since: Optional "YYYY-MM-DD" lower bound for the registration date.
+        :return: Generator of Announcement records.
+        """
+        query = "SELECT number, title, author, views, reg_date, url FROM announcements WHERE board = ?"
+        params = [board]
+        if since:
+            query += " AND reg_date >= ?"
+            params.append(since)
+        query += " ORDER BY number DESC"
+
+        # 별도 연결을 사용해서 순회 중에도 다른 스레드의 쓰기를 막지 않음
+        conn = sqlite3.connect(self.db_path)
+        try:
+            for number, title, author, views, reg_date, url in conn.execute(query, params):
+                yield Announcement(
+                    number=number,
+                    title=title,
+                    author=author,
+                    views=int(views),
+                    date=date.fromisoformat(reg_date) if reg_date else None,
+                    url=url,
+                )
+        finally:
+            conn.close()
+
+    def load(self, board: str, since: str = None) -> list[Announcement]:
+        """
+        Load the stored announcements of a board, newest first.
+        :param board: The board (department) name.
+        :param since: Optional "YYYY-MM-DD" lower bound for the registration date.
+        :return: List of Announcement records.
+        """
+        return list(self.iter_announcements(board, since))
+
+    def max_number(self, board: str) -> int | None:
+        """
+        Get the newest stored article number of a board, the starting point of incremental crawls.
+        :param board: The board (department) name.
+        :return: The largest article number, or None if nothing is stored.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(number) FROM announcements WHERE board = ?", (board,)).fetchone()
+        return row[0] if row else None
+
+    def last_crawled(self, board: str) -> float | None:
+        """
+        Get the time of the last stored crawl of a board.
+        :param board: The board (department) name.
+        :return: UNIX timestamp, or None if the board was never crawled.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT last_crawled FROM crawl_state WHERE board = ?", (board,)).fetchone()
+        return row[0] if row else None
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
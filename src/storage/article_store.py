@@ -0,0 +1,97 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import logging
+from src.boards.announcement import ArticleDetail, Attachment
+
+
+class ArticleStore:
+    def __init__(self, db_path: str = None):
+        """
+        Initialize the SQLite-backed, content-addressed store of article details.
+        Contents are stored once per SHA-1 of the body and attachments; article URLs point to them,
+        so an article that was fetched once is never fetched again.
+        :param db_path: Path of the SQLite database file. Defaults to $ANNOUNCEMENT_DB_PATH or data/announcements.db.
+        """
+        self.db_path = db_path or os.getenv("ANNOUNCEMENT_DB_PATH", "data/announcements.db")
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # 미리 가져오기는 작업 스레드에서 실행되므로 하나의 연결을 잠금으로 보호하여 공유
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._lock, self._conn:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS article_contents (
+                    digest TEXT PRIMARY KEY,
+                    body TEXT NOT NULL,
+                    attachments TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS articles (
+                    url TEXT PRIMARY KEY,
+                    digest TEXT NOT NULL REFERENCES article_contents (digest),
+                    fetched_at REAL NOT NULL
+                );
+                """
+            )
+
+    def save(self, detail: ArticleDetail):
+        """
+        Store an article detail under the digest of its content.
+        """
+        attachments = json.dumps([[a.name, a.url] for a in detail.attachments], ensure_ascii=False)
+        digest = hashlib.sha1(f"{detail.body}\0{attachments}".encode("utf-8")).hexdigest()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO article_contents (digest, body, attachments) VALUES (?, ?, ?)",
+                (digest, detail.body, attachments),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO articles (url, digest, fetched_at) VALUES (?, ?, ?)",
+                (detail.url, digest, time.time()),
+            )
+        logging.debug(f"Stored article {detail.url} ({digest}).")
+
+    def get(self, url: str) -> ArticleDetail | None:
+        """
+        :return: The stored detail of the article, or None if it was never fetched.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT c.body, c.attachments FROM articles a
+                JOIN article_contents c ON c.digest = a.digest
+                WHERE a.url = ?
+                """,
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        body, attachments = row
+        return ArticleDetail(url, body, tuple(Attachment(name, link) for name, link in json.loads(attachments)))
+
+    def missing(self, urls: list[str]) -> list[str]:
+        """
+        :return: The given URLs that have not been fetched yet, in the given order.
+        """
+        if not urls:
+            return []
+        with self._lock:
+            stored = set()
+            # SQLite의 바인딩 변수 개수 제한을 넘지 않도록 나누어 조회
+            for start in range(0, len(urls), 500):
+                chunk = urls[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(f"SELECT url FROM articles WHERE url IN ({placeholders})", chunk).fetchall()
+                stored.update(row[0] for row in rows)
+        return [url for url in urls if url not in stored]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
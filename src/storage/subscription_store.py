@@ -0,0 +1,76 @@
+import os
+import sqlite3
+import threading
+import logging
+
+
+class SubscriptionStore:
+    def __init__(self, db_path: str = None):
+        """
+        Initialize the SQLite-backed store of department subscriptions per chat.
+        :param db_path: Path of the SQLite database file. Defaults to $ANNOUNCEMENT_DB_PATH or data/announcements.db.
+        """
+        self.db_path = db_path or os.getenv("ANNOUNCEMENT_DB_PATH", "data/announcements.db")
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._lock, self._conn:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS subscriptions (
+                    chat_id INTEGER NOT NULL,
+                    department TEXT NOT NULL,
+                    PRIMARY KEY (department, chat_id)
+                );
+                CREATE INDEX IF NOT EXISTS idx_subscriptions_chat_id ON subscriptions (chat_id);
+                """
+            )
+
+    def add(self, chat_id: int, department: str) -> bool:
+        """
+        Subscribe a chat to a department.
+        :return: True if the subscription is new.
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO subscriptions (chat_id, department) VALUES (?, ?)", (chat_id, department)
+            )
+        logging.info(f"Chat {chat_id} subscribed to department '{department}'.")
+        return cursor.rowcount > 0
+
+    def remove(self, chat_id: int, department: str = None) -> int:
+        """
+        Unsubscribe a chat from one department, or from all departments if none is given.
+        :return: Number of removed subscriptions.
+        """
+        with self._lock, self._conn:
+            if department is None:
+                cursor = self._conn.execute("DELETE FROM subscriptions WHERE chat_id = ?", (chat_id,))
+            else:
+                cursor = self._conn.execute(
+                    "DELETE FROM subscriptions WHERE chat_id = ? AND department = ?", (chat_id, department)
+                )
+        logging.info(f"Chat {chat_id} unsubscribed from {department or 'all departments'}.")
+        return cursor.rowcount
+
+    def subscribers(self, department: str) -> list[int]:
+        """
+        :return: The chat ids subscribed to a department.
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT chat_id FROM subscriptions WHERE department = ?", (department,)).fetchall()
+        return [row[0] for row in rows]
+
+    def departments(self, chat_id: int) -> list[str]:
+        """
+        :return: The departments a chat is subscribed to.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT department FROM subscriptions WHERE chat_id = ? ORDER BY department", (chat_id,)
+            ).fetchall()
+        return [row[0] for row in rows]
@@ -0,0 +1,81 @@
+import asyncio
+import json
+import pytest
+from benchmarks.replay import REGISTRY_PATH, ReplayServer
+from src.boards import board_factory, board_source
+from src.boards.circuit_breaker import CircuitBreaker
+from src.boards.host_limiter import HostLimiter
+
+
+@pytest.fixture(autouse=True)
+def breaker(monkeypatch):
+    """
+    Give every test its own circuit breakers and host limiter instead of the process-wide ones.
+    """
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0.5)
+    limiter = HostLimiter()
+    monkeypatch.setattr(board_source, "circuit_breaker", breaker)
+    monkeypatch.setattr(board_source, "article_circuit_breaker", CircuitBreaker(failure_threshold=3, reset_timeout=0.5))
+    monkeypatch.setattr(board_source, "host_limiter", limiter)
+    monkeypatch.setattr(board_factory, "host_limiter", limiter)
+    return breaker
+
+
+@pytest.fixture
+def server():
+    server = ReplayServer(pages=5)
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def board_url(server):
+    return server.base_url.format(board_id="TEST")
+
+
+@pytest.fixture
+def registry(server, tmp_path, monkeypatch):
+    """
+    The department registry pointed at the local stub server, used by BoardFactory.
+    """
+    with open(REGISTRY_PATH, encoding="utf-8") as file:
+        data = json.load(file)
+    data["base_url"] = server.base_url
+    data["crawl"]["min_request_interval"] = 0.0
+    path = tmp_path / "departments.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    monkeypatch.setenv("BOARD_REGISTRY_PATH", str(path))
+    return data
+
+
+@pytest.fixture
+def bot(server, tmp_path, monkeypatch):
+    """
+    A TelegramBot wired to the stub server and an in-memory Bot API transport.
+    Use it inside asyncio.run(): await bot.start() first and bot.stop() at the end.
+    """
+    from benchmarks.replay import BotUnderTest
+
+    # BotUnderTest가 설정하는 환경 변수를 테스트가 끝나면 되돌림
+    for name in ("BOARD_REGISTRY_PATH", "ANNOUNCEMENT_DB_PATH"):
+        monkeypatch.setenv(name, "")
+    monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "123456:test")
+    return BotUnderTest(server, str(tmp_path))
+
+
+@pytest.fixture
+def run_bot(bot):
+    """
+    Run an async scenario against the started bot and stop it afterwards.
+    """
+    def run(scenario):
+        async def main():
+            await bot.start()
+            try:
+                return await scenario()
+            finally:
+                await bot.stop()
+
+        return asyncio.run(main())
+
+    return run
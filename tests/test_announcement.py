@@ -0,0 +1,33 @@
+from datetime import date
+import pytest
+from src.boards.announcement import Announcement
+
+
+@pytest.fixture
+def announcement():
+    return Announcement.from_row(["1024", "장학금 신청 안내", "학과사무실", "1,234", "2024-03-02"], "http://board/view.do?nttId=1024")
+
+
+def test_columns_are_parsed_once(announcement):
+    assert announcement.number == 1024
+    assert announcement.views == 1234
+    assert announcement.date == date(2024, 3, 2)
+    assert announcement.url == "http://board/view.do?nttId=1024"
+    assert (announcement.number_text, announcement.date_text) == ("1024", "2024-03-02")
+
+
+def test_records_are_not_mappings(announcement):
+    # 예전 dict 행처럼 쓰면 조용히 동작하지 않고 바로 오류가 나야 함
+    with pytest.raises(TypeError):
+        announcement["제목"]
+    with pytest.raises(TypeError):
+        dict(announcement)
+
+
+def test_pinned_notice_and_unreadable_date_parse_to_none():
+    pinned = Announcement.from_row(["공지", "학사 일정", "관리자", "-", "2024/03/02"])
+
+    assert pinned.number is None and pinned.date is None and pinned.views == 0
+    assert pinned.number_text == "공지"
+    assert pinned.date_text == ""
+    assert Announcement(1, "t", "a", 0, date(2024, 3, 2)).date_text == "2024-03-02"
@@ -0,0 +1,113 @@
+import asyncio
+import random
+import threading
+from datetime import date
+from src.boards.announcement import Announcement
+from src.boards.board_source import CrawlResult
+from src.storage.announcement_cache import AnnouncementCache
+
+
+def _rows(count, start=1):
+    return [Announcement(n, f"{n}번 공지", "학과사무실", n, date(2024, 3, 1)) for n in range(start + count - 1, start - 1, -1)]
+
+
+def test_least_recently_used_department_is_evicted_and_reported():
+    cache = AnnouncementCache(max_items=25)
+    evicted = []
+    cache.on_evict(evicted.append)
+
+    cache.put("computer", _rows(10))
+    cache.put("electrical", _rows(10))
+    cache.snapshot("computer")  # computer를 최근 사용으로 표시
+    cache.put("mechanical", _rows(10))
+
+    assert evicted == ["electrical"]
+    assert cache.departments() == ["computer", "mechanical"]
+    assert len(cache) == 20
+
+
+def test_incomplete_result_keeps_the_previous_snapshot():
+    cache = AnnouncementCache()
+    cache.put("computer", _rows(10))
+    version = cache.version("computer")
+
+    assert not cache.put("computer", CrawlResult(_rows(3), complete=False))
+    assert cache.get("computer") == tuple(_rows(10))
+    assert cache.version("computer") == version
+
+
+def test_concurrent_writers_and_readers_keep_the_cache_consistent():
+    cache = AnnouncementCache(max_items=300)
+    departments = [f"dept{i}" for i in range(8)]
+    errors = []
+    stop = threading.Event()
+
+    def writer(seed):
+        rng = random.Random(seed)
+        for _ in range(300):
+            department = rng.choice(departments)
+            if rng.random() < 0.1:
+                cache.invalidate(department)
+            else:
+                cache.put(department, _rows(rng.randint(1, 120)))
+
+    def reader():
+        seen = {}
+        while not stop.is_set():
+            for department in departments:
+                snapshot = cache.snapshot(department)
+                if snapshot is None:
+                    continue
+                # 버전은 절대 되돌아가지 않음
+                if snapshot.version < seen.get(department, 0):
+                    errors.append((department, snapshot.version, seen[department]))
+                seen[department] = snapshot.version
+                if len(snapshot.announcements) != snapshot.announcements[0].number:
+                    errors.append((department, "torn snapshot"))
+
+    readers = [threading.Thread(target=reader) for _ in range(2)]
+    writers = [threading.Thread(target=writer, args=(seed,)) for seed in range(4)]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    stop.set()
+    for thread in readers:
+        thread.join()
+
+    assert not errors
+    assert len(cache) == sum(len(cache.get(d)) for d in cache.departments())
+    assert len(cache) <= cache.max_items or len(cache.departments()) == 1
+
+
+def test_eviction_releases_board_rows_and_keeps_notifications(server, bot, run_bot):
+    notified = []
+
+    async def scenario():
+        bot.bot.notifier.notify = lambda chats, department, announcements: notified.append(
+            (department, [a.number for a in announcements]))
+        await bot.bot._refresh("computer")
+        board = bot.bot.board_handler.factory.get_board("computer")
+        assert bot.bot.search_index.search("50번", "computer")[1] == 1
+
+        # 다른 학과가 캐시를 채우는 동안(작업 스레드) /board와 /search 요청이 이어짐
+        bot.bot.cache.max_items = 40
+        await asyncio.gather(
+            asyncio.to_thread(bot.bot.cache.put, "electrical", _rows(40)),
+            *(bot.send(user_id, "/search 공지 computer") for user_id in range(1, 4)),
+        )
+        assert "computer" not in bot.bot.cache
+        assert board.known_announcements == [] and not board._page_cache
+        assert bot.bot.search_index.search("50번", "computer")[1] == 0
+
+        # 밀려난 동안 새 글 10개가 올라옴: 저장소에서 이어받아 새 글만 알림
+        bot.bot.cache.max_items = 200_000
+        server.pages = 6
+        await bot.bot._refresh("computer")
+        return board
+
+    board = run_bot(scenario)
+
+    assert notified == [("computer", list(range(60, 50, -1)))]
+    assert [a.number for a in bot.bot.cache.get("computer") if a.number is not None] == list(range(60, 0, -1))
+    assert board.last_seen_number == 60
@@ -0,0 +1,44 @@
+import pytest
+from src.handlers.board_handler import BoardHandler
+from src.storage.article_store import ArticleStore
+
+
+@pytest.fixture
+def handler(registry, tmp_path):
+    articles = ArticleStore(str(tmp_path / "articles.db"))
+    handler = BoardHandler(articles=articles, article_batch_size=5)
+    yield handler
+    articles.close()
+
+
+def test_articles_past_the_batch_size_are_deferred(server, handler):
+    announcements = handler.handle_request("computer")
+    linked = [a for a in announcements if a.url]
+
+    stats = handler.prefetch_articles("computer", announcements)
+    assert stats["fetched"] == 5
+    assert stats["deferred"] == linked[5:]
+
+    # 미뤄진 글을 다시 넘기면 다음 배치를 가져옴
+    stats = handler.prefetch_articles("computer", stats["deferred"])
+    assert stats["fetched"] == 5
+    assert stats["deferred"] == linked[10:]
+    assert handler.articles.missing([a.url for a in linked[:10]]) == []
+
+
+def test_article_failures_do_not_open_the_list_circuit(server, handler, breaker):
+    announcements = handler.handle_request("computer")
+    board = handler.factory.get_board("computer")
+    board.max_retries = 0
+    handler.article_workers = 1
+    server.fault = lambda path: 503 if "view.do" in path else None
+
+    stats = handler.prefetch_articles("computer", announcements)
+
+    # 본문 차단기가 열린 뒤의 글은 실패로 버리지 않고 미룸
+    assert stats["fetched"] == 0
+    assert stats["failed"] == board.article_circuit_breaker.failure_threshold
+    assert len(stats["deferred"]) == len([a for a in announcements if a.url]) - stats["failed"]
+    assert board.article_circuit_breaker.is_open(board.base_url)
+    assert not breaker.is_open(board.base_url)
+    assert board.fetch_announcements(incremental=True).complete
@@ -0,0 +1,40 @@
+from datetime import date, timedelta
+import pytest
+from src.boards.announcement import Announcement
+from src.handlers.board_handler import BoardHandler
+from src.storage.announcement_store import AnnouncementStore
+
+
+def _stored(numbers, days_ago):
+    reg_date = date.today() - timedelta(days=days_ago)
+    return [Announcement(n, f"{n}번 공지", "학과사무실", n, reg_date, None) for n in numbers]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = AnnouncementStore(str(tmp_path / "announcements.db"))
+    yield store
+    store.close()
+
+
+def test_startup_loads_a_recent_window_and_resumes_from_the_newest_number(registry, store):
+    store.save("computer", _stored(range(1, 41), days_ago=400) + _stored(range(41, 46), days_ago=3))
+
+    handler = BoardHandler(store=store, snapshot_days=180)
+
+    assert [a.number for a in handler.cache.get("computer")] == [45, 44, 43, 42, 41]
+    assert handler.factory.get_board("computer").last_seen_number == 45
+
+
+def test_incremental_crawl_saves_only_the_walked_pages(server, registry, store, monkeypatch):
+    store.save("computer", _stored(range(1, 46), days_ago=400))
+    handler = BoardHandler(store=store, snapshot_days=180)
+    saved = []
+    monkeypatch.setattr(store, "save", lambda board, rows: saved.append(list(rows)))
+
+    announcements = handler.handle_request("computer", refresh=True)
+
+    # 첫 페이지(50~41번)에서 이미 저장된 45번을 만나 멈추고 그 페이지의 행만 저장
+    assert server.requests == 1
+    assert [a.number for a in saved[0] if a.number is not None] == list(range(50, 40, -1))
+    assert [a.number for a in announcements if a.number is not None] == list(range(50, 40, -1))
@@ -0,0 +1,94 @@
+import threading
+import time
+from src.boards.board_source import BoardSource
+from src.handlers.board_handler import BoardHandler
+
+
+def _board(url, **kwargs):
+    kwargs.setdefault("backoff_base", 0.01)
+    return BoardSource(url, **kwargs)
+
+
+def _numbered(announcements):
+    return [a.number for a in announcements if a.number is not None]
+
+
+def test_flaky_page_is_retried_until_it_recovers(server, board_url, breaker):
+    failures = {"left": 2}
+    lock = threading.Lock()
+
+    def fault(path):
+        with lock:
+            if "pageIndex=2" in path and failures["left"]:
+                failures["left"] -= 1
+                return 503
+        return None
+
+    server.fault = fault
+    result = _board(board_url).fetch_announcements()
+
+    assert result.complete
+    assert _numbered(result) == list(range(50, 0, -1))
+    assert failures["left"] == 0
+    assert not breaker.is_open(board_url)
+
+
+def test_client_errors_are_not_retried_and_do_not_open_the_circuit(server, board_url, breaker):
+    server.fault = lambda path: 404
+    board = _board(board_url)
+
+    for _ in range(breaker.failure_threshold + 2):
+        result = board.fetch_announcements()
+        assert not result.complete
+
+    # 404마다 요청은 한 번뿐이고 차단기는 닫힌 채로 남음
+    assert server.requests == breaker.failure_threshold + 2
+    assert not breaker.is_open(board_url)
+
+
+def test_timeouts_are_bounded_by_the_retry_limit(server, board_url, breaker):
+    server.fault = lambda path: 1.0
+    board = _board(board_url, timeout=0.2, max_retries=2)
+
+    start = time.monotonic()
+    result = board.fetch_announcements()
+
+    assert not result.complete
+    assert server.requests == 3
+    assert time.monotonic() - start < 2.0
+    assert breaker.is_open(board_url)
+
+
+def test_open_circuit_serves_the_last_snapshot(server, registry, breaker):
+    handler = BoardHandler()
+    snapshot = handler.handle_request("computer")
+    assert len(_numbered(snapshot)) == 50
+
+    server.fault = lambda path: 503
+    handler.factory.get_board("computer").max_retries = 0
+    for _ in range(breaker.failure_threshold):
+        assert list(handler.handle_request("computer", refresh=True)) == snapshot
+
+    # 차단기가 열린 동안에는 서버에 요청하지 않고 마지막 스냅숏을 돌려줌
+    requests_before = server.requests
+    assert list(handler.handle_request("computer", refresh=True)) == snapshot
+    assert server.requests == requests_before
+
+
+def test_half_open_trial_closes_the_circuit(server, board_url, breaker):
+    server.fault = lambda path: 503
+    board = _board(board_url, max_retries=0)
+    for _ in range(breaker.failure_threshold):
+        assert not board.fetch_announcements().complete
+    assert breaker.is_open(board_url)
+
+    server.fault = None
+    requests_before = server.requests
+    assert not board.fetch_announcements().complete
+    assert server.requests == requests_before
+
+    time.sleep(breaker.reset_timeout + 0.1)
+    result = board.fetch_announcements()
+    assert result.complete
+    assert _numbered(result) == list(range(50, 0, -1))
+    assert not breaker.is_open(board_url)
@@ -0,0 +1,78 @@
+import asyncio
+import threading
+
+
+
+def _count_list_requests(server):
+    counts = {"list": 0}
+    lock = threading.Lock()
+
+    def fault(path):
+        if "list.do" in path:
+            with lock:
+                counts["list"] += 1
+        return None
+
+    server.fault = fault
+    return counts
+
+
+def test_concurrent_cold_board_requests_share_one_crawl(server, bot, run_bot):
+    counts = _count_list_requests(server)
+
+    async def scenario():
+        await asyncio.gather(*(bot.send(user_id, "/board computer") for user_id in range(1, 6)))
+        await bot.bot._refresh_tasks["computer"]
+
+    run_bot(scenario)
+
+    # 최근 30일 크롤링 한 번(5페이지)과 전체 갱신 한 번(5페이지)만 요청
+    assert counts["list"] == 2 * server.pages
+    assert len(bot.request.texts) == 5
+    assert all(text.startswith("[computer]") for text in bot.request.texts)
+
+
+def test_unknown_department_is_rejected_before_crawling(server, bot, run_bot):
+    counts = _count_list_requests(server)
+
+    async def scenario():
+        for text in ("/board nowhere", "/report csv nowhere", "/view 3 nowhere"):
+            await bot.send(1, text)
+
+    run_bot(scenario)
+
+    assert counts["list"] == 0
+    assert bot.request.texts == ["알 수 없는 학과입니다: nowhere"] * 3
+    assert not bot.bot._refresh_tasks
+    assert not bot.bot._recent_tasks
+    assert not bot.bot._board_pages
+
+
+def test_first_load_prefetches_one_batch_of_newest_articles(server, bot, run_bot):
+    articles = {"count": 0}
+    server.fault = lambda path: articles.__setitem__("count", articles["count"] + 1) if "view.do" in path else None
+    bot.bot.board_handler.article_batch_size = 5
+
+    async def scenario():
+        await bot.bot._refresh("computer")
+        await asyncio.gather(*bot.bot._prefetch_tasks.values())
+        newest = sorted((a for a in bot.bot.cache.get("computer") if a.url), key=lambda a: a.number, reverse=True)
+        return bot.bot.articles.missing([a.url for a in newest[:5]])
+
+    assert run_bot(scenario) == []
+    assert articles["count"] == 5
+
+
+def test_warm_cache_applies_boards_that_miss_the_budget(server, bot, run_bot):
+    server.fault = lambda path: 0.05 if "list.do" in path else None
+    bot.bot.board_handler.factory.crawl_settings["refresh_budget_seconds"] = 0.01
+
+    async def scenario():
+        results = await bot.bot._warm_cache(None)
+        return results, dict(bot.bot._high_water)
+
+    results, high_water = run_bot(scenario)
+
+    # 예산 안에 끝난 학과는 없어도 끝난 뒤에는 모두 반영됨
+    assert results == {}
+    assert set(high_water) == set(bot.departments)
@@ -0,0 +1,78 @@
+import threading
+import time
+
+from src.boards.host_limiter import HostLimiter
+
+URL = "http://board.example/prog/bbsArticle/TEST/list.do"
+
+
+class _Requests:
+    def __init__(self, limiter, hold):
+        self.limiter = limiter
+        self.hold = hold
+        self.started = threading.Semaphore(0)
+        self.threads = []
+        self._lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+
+    def _request(self):
+        with self.limiter.acquire(URL):
+            with self._lock:
+                self.current += 1
+                self.peak = max(self.peak, self.current)
+            self.started.release()
+            time.sleep(self.hold)
+            with self._lock:
+                self.current -= 1
+
+    def start(self, count):
+        for _ in range(count):
+            thread = threading.Thread(target=self._request)
+            thread.start()
+            self.threads.append(thread)
+
+    def join(self):
+        for thread in self.threads:
+            thread.join()
+
+
+def test_configure_keeps_in_flight_requests_counted():
+    limiter = HostLimiter(max_per_host=2)
+    requests = _Requests(limiter, 0.2)
+    requests.start(2)
+    requests.started.acquire()
+    requests.started.acquire()
+    # 요청이 진행 중일 때 다시 설정한 뒤 들어온 요청도 같은 한도 안에서만 실행되어야 함
+    limiter.configure(max_per_host=2, min_interval=0.0)
+    requests.start(2)
+    requests.join()
+    assert requests.peak == 2
+
+
+def test_raising_the_cap_wakes_waiting_requests():
+    limiter = HostLimiter(max_per_host=1)
+    requests = _Requests(limiter, 0.2)
+    requests.start(4)
+    requests.started.acquire()
+    limiter.configure(max_per_host=4, min_interval=0.0)
+    requests.join()
+    assert requests.peak == 4
+
+
+def test_min_interval_spaces_request_starts():
+    limiter = HostLimiter(max_per_host=4, min_interval=0.05)
+    starts = []
+
+    def request():
+        with limiter.acquire(URL):
+            starts.append(time.monotonic())
+
+    threads = [threading.Thread(target=request) for _ in range(4)]
+    begin = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # n번째 요청은 첫 요청보다 적어도 n * min_interval 뒤에 시작
+    assert all(start - begin >= i * 0.05 for i, start in enumerate(sorted(starts)))
@@ -0,0 +1,55 @@
+import threading
+from src.boards.board_source import BoardSource, new_crawl_stats
+
+
+def test_full_crawl_keeps_one_copy_of_pinned_notices(server, board_url):
+    announcements = BoardSource(board_url).fetch_announcements()
+
+    # 고정 공지는 모든 페이지 맨 위에 반복되지만 한 번만 포함
+    assert server.requests == server.pages
+    assert sum(1 for a in announcements if a.number is None) == 1
+    assert len(announcements) == server.pages * 10 + 1
+
+
+def test_incremental_crawl_matches_a_full_crawl(server, board_url):
+    board = BoardSource(board_url)
+    board.fetch_announcements(incremental=True)
+
+    # 게시글이 그대로면 첫 페이지만 요청
+    requests_before = server.requests
+    unchanged = board.fetch_announcements(incremental=True)
+    assert server.requests - requests_before == 1
+
+    # 새 글 10개: 첫 페이지가 모두 새 글이고 둘째 페이지에서 이미 본 번호를 만남
+    server.pages += 1
+    requests_before = server.requests
+    merged = board.fetch_announcements(incremental=True)
+    assert server.requests - requests_before == 2
+
+    full = BoardSource(board_url).fetch_announcements()
+    assert merged.complete
+    assert list(merged) == list(full)
+    assert list(merged[11:]) == list(unchanged[1:])
+
+
+def test_concurrent_crawls_of_one_board_keep_their_own_stats(server, board_url):
+    board = BoardSource(board_url)
+    recent_stats = {}
+    barrier = threading.Barrier(2)
+
+    def recent():
+        barrier.wait()
+        recent_stats.update(new_crawl_stats())
+        list(board.iter_announcements(stats=recent_stats))
+
+    thread = threading.Thread(target=recent)
+    thread.start()
+    barrier.wait()
+    result = board.fetch_announcements()
+    thread.join()
+
+    # 동시에 돈 최근 크롤링의 요청은 갱신 통계에 섞이지 않음
+    assert result.stats["requests"] == server.pages
+    assert recent_stats["requests"] == server.pages
+    assert result.stats["pages_parsed"] + result.stats["pages_skipped"] == server.pages
+    assert board.last_refresh_stats is result.stats
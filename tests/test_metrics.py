@@ -0,0 +1,43 @@
+import asyncio
+import time
+
+from src.monitoring.metrics import SlowRequestProfiler
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def _own_work(seconds):
+    _busy(seconds)
+
+
+def _other_work(seconds):
+    _busy(seconds)
+
+
+def test_profile_excludes_coroutines_run_during_await():
+    profiler = SlowRequestProfiler(sample_rate=1.0)
+
+    async def request():
+        with profiler.profile("request"):
+            _own_work(0.05)
+            await asyncio.sleep(0.3)
+
+    async def other():
+        await asyncio.sleep(0.05)
+        _other_work(0.2)
+
+    async def scenario():
+        await asyncio.gather(request(), other())
+
+    asyncio.run(scenario())
+    [(name, duration, text)] = [(name, duration, text) for duration, _, name, text in profiler._slowest]
+    assert name == "request" and duration >= 0.3
+    own = [line for line in text.splitlines() if "(_own_work)" in line]
+    other = [line for line in text.splitlines() if "(_other_work)" in line]
+    assert own and float(own[0].split()[3]) >= 0.04
+    # 다른 코루틴의 함수가 목록에 나오더라도 시간은 거의 붙지 않음
+    assert not other or float(other[0].split()[3]) < 0.01
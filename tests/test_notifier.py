@@ -0,0 +1,99 @@
+import asyncio
+import time
+from datetime import date, timedelta
+from telegram.error import Forbidden, RetryAfter
+from src.boards.announcement import Announcement
+from src.bot.notifier import MAX_MESSAGE_LENGTH, Notifier
+
+
+def _announcements(count, title="장학금 신청 안내"):
+    return [Announcement(n, f"{n}번 {title}", "학과사무실", 0, date(2024, 3, 1)) for n in range(count, 0, -1)]
+
+
+class FakeSender:
+    """
+    Records every send as (monotonic time, chat_id, text); outcomes can be scripted per chat.
+    """
+
+    def __init__(self, failures=None):
+        self.sent = []
+        self.attempts = []
+        self.failures = failures or {}  # chat_id -> list of exceptions raised by successive attempts
+
+    async def __call__(self, chat_id, text):
+        self.attempts.append((time.monotonic(), chat_id))
+        script = self.failures.get(chat_id)
+        if script:
+            raise script.pop(0)
+        self.sent.append((time.monotonic(), chat_id, text))
+
+
+def _run(notifier, notify):
+    async def main():
+        notifier.start()
+        notify()
+        await asyncio.wait_for(notifier.join(), 10)
+        await notifier.stop()
+
+    asyncio.run(main())
+
+
+def test_new_announcements_are_batched_into_one_message_per_chat():
+    sender = FakeSender()
+    notifier = Notifier(sender, global_rate=1000, per_chat_interval=0)
+
+    _run(notifier, lambda: notifier.notify([1, 2], "computer", _announcements(30)))
+
+    assert sorted(chat for _, chat, _ in sender.sent) == [1, 2]
+    assert sender.sent[0][2].startswith("[computer] 새 공지사항 30건")
+
+
+def test_long_batches_are_split_under_the_message_limit():
+    messages = Notifier._batch_messages("computer", _announcements(200, "가" * 100))
+
+    assert len(messages) > 1
+    assert all(len(text) <= MAX_MESSAGE_LENGTH for text in messages)
+    assert sum(text.count("\n- ") for text in messages) == 200
+
+
+def test_messages_respect_per_chat_and_global_spacing():
+    sender = FakeSender()
+    notifier = Notifier(sender, global_rate=50, per_chat_interval=0.1, workers=4)
+
+    def notify():
+        for _ in range(3):
+            notifier.notify([1], "computer", _announcements(1))
+        notifier.notify(list(range(2, 12)), "computer", _announcements(1))
+
+    _run(notifier, notify)
+
+    starts = sorted(at for at, _, _ in sender.sent)
+    chat_starts = [at for at, chat, _ in sender.sent if chat == 1]
+    assert len(starts) == 13
+    assert all(b - a >= 0.1 - 0.01 for a, b in zip(chat_starts, chat_starts[1:]))
+    assert all(b - a >= 1 / 50 - 0.005 for a, b in zip(starts, starts[1:]))
+
+
+def test_rate_limited_message_is_requeued_after_the_requested_delay():
+    sender = FakeSender({1: [RetryAfter(timedelta(milliseconds=200))]})
+    notifier = Notifier(sender, global_rate=1000, per_chat_interval=0)
+
+    _run(notifier, lambda: notifier.notify([1, 2], "computer", _announcements(1)))
+
+    first_attempt = sender.attempts[0][0]
+    delivered = {chat: at for at, chat, _ in sender.sent}
+    assert set(delivered) == {1, 2}
+    assert delivered[1] - first_attempt >= 0.2 - 0.01
+    assert notifier.stats == {**notifier.stats, "delivered": 2, "retried": 1, "failed": 0}
+
+
+def test_chat_that_blocked_the_bot_is_removed_without_retries():
+    blocked = []
+    sender = FakeSender({1: [Forbidden("bot was blocked by the user")]})
+    notifier = Notifier(sender, global_rate=1000, per_chat_interval=0, on_blocked=blocked.append)
+
+    _run(notifier, lambda: notifier.notify([1, 2], "computer", _announcements(1)))
+
+    assert blocked == [1]
+    assert [chat for _, chat in sender.attempts].count(1) == 1
+    assert notifier.stats["failed"] == 1 and notifier.stats["delivered"] == 1
@@ -0,0 +1,66 @@
+import glob
+import os
+import pytest
+from benchmarks.replay import FIXTURES_DIR, synthetic_page
+from src.boards.page_parsers import PageParserFactory
+
+TABLE_CLASS = "board_list table table-default"
+PAGINATION_CLASS = "pagination"
+
+
+def _backends():
+    backends = ["html.parser", "stream"]
+    try:
+        import lxml  # noqa: F401
+        backends.append("lxml")
+    except ImportError:
+        pass
+    return backends
+
+
+def _parse_all(html, page=1):
+    factory = PageParserFactory()
+    return {name: factory.create_parser(name).parse(html, TABLE_CLASS, PAGINATION_CLASS, page) for name in _backends()}
+
+
+def _assert_agree(results):
+    (reference_name, reference), *others = results.items()
+    for name, result in others:
+        assert result == reference, f"{name} disagrees with {reference_name}"
+
+
+EDGE_CASES = {
+    "nested markup and entities": synthetic_page(1, 3).replace(
+        '<td class="subject"><a href="view.do?nttId=30">30번 공지',
+        '<td class="subject"><span class="new">N</span> <a href="#">x</a><a href="view.do?nttId=30"><b>긴급</b> &lt;30&gt;번 공지',
+    ),
+    "javascript links only": synthetic_page(2, 3).replace('href="view.do?nttId=20"', 'href="javascript:void(0)"'),
+    "malformed row": synthetic_page(1, 2).replace("<td>학과사무실</td><td>60</td>", "", 1),
+    "no pagination": synthetic_page(1, 1).split('<div class="pagination">')[0] + "</div></body></html>",
+    "no table": "<html><body><p>점검 중입니다.</p></body></html>",
+}
+
+
+@pytest.mark.parametrize("page", [1, 2, 10, 11, 25, 26])
+def test_backends_agree_on_synthetic_pages(page):
+    results = _parse_all(synthetic_page(page, 25), page)
+    _assert_agree(results)
+    rows, has_next, last_page = results["html.parser"]
+    if page <= 25:
+        assert len(rows) == 11
+        assert has_next == (page < 25)
+    else:
+        assert rows is None
+
+
+@pytest.mark.parametrize("case", sorted(EDGE_CASES))
+def test_backends_agree_on_edge_cases(case):
+    _assert_agree(_parse_all(EDGE_CASES[case]))
+
+
+@pytest.mark.parametrize("path", sorted(glob.glob(os.path.join(FIXTURES_DIR, "*", "page_*.html"))))
+def test_backends_agree_on_recorded_pages(path):
+    with open(path, encoding="utf-8") as file:
+        results = _parse_all(file.read())
+    _assert_agree(results)
+    assert results["html.parser"][0]
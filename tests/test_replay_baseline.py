@@ -0,0 +1,30 @@
+from benchmarks.replay import compare
+
+BASELINE = {
+    "calibration_ms": 100.0,
+    "scenarios": {"warm": {"p95_ms": 10.0, "throughput_rps": 1000.0}},
+}
+
+
+def test_slower_machine_is_not_a_regression():
+    # 두 배 느린 기계에서는 지연 두 배, 처리량 절반까지 정상
+    results = {"warm": {"p95_ms": 20.0, "throughput_rps": 500.0}}
+    assert compare(results, BASELINE, 0.1, calibration_ms=200.0) == []
+
+
+def test_regression_is_reported_after_scaling():
+    results = {"warm": {"p95_ms": 20.0, "throughput_rps": 500.0}}
+    regressions = compare(results, BASELINE, 0.1, calibration_ms=100.0)
+    assert len(regressions) == 2
+
+
+def test_baseline_without_calibration_compares_absolute_values():
+    baseline = {"scenarios": BASELINE["scenarios"]}
+    results = {"warm": {"p95_ms": 10.5, "throughput_rps": 950.0}}
+    assert compare(results, baseline, 0.1, calibration_ms=500.0) == []
+
+
+def test_small_absolute_jitter_is_ignored():
+    baseline = dict(BASELINE, min_delta_ms=10.0)
+    results = {"warm": {"p95_ms": 19.0, "throughput_rps": 1000.0}}
+    assert compare(results, baseline, 0.1, calibration_ms=100.0) == []
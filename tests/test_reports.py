@@ -0,0 +1,138 @@
+import asyncio
+import csv
+import glob
+import os
+import threading
+import zipfile
+from datetime import date
+import pytest
+from src.boards.announcement import Announcement
+from src.exports.stream_reports import CSVReport, StreamingPDFReport
+from src.handlers import report_handler
+from src.handlers.report_handler import ReportHandler
+from src.storage.announcement_cache import AnnouncementCache
+from src.storage.announcement_store import AnnouncementStore
+
+
+def _announcements(count):
+    return [
+        Announcement(number, f"{number}번 공지", "학과사무실", number * 3, date(2024, 3, 1), f"http://board/view.do?nttId={number}")
+        for number in range(count, 0, -1)
+    ]
+
+
+def _rows(count):
+    return (("computer", announcement) for announcement in _announcements(count))
+
+
+def test_pdf_report_is_split_into_parts(tmp_path):
+    path = StreamingPDFReport(rows_per_file=40).generate(_rows(100), str(tmp_path / "report.pdf"))
+
+    assert path == str(tmp_path / "report.zip")
+    with zipfile.ZipFile(path) as archive:
+        assert archive.namelist() == ["report_part1.pdf", "report_part2.pdf", "report_part3.pdf"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["report.zip"]
+
+
+def test_pdf_parts_are_not_exposed_to_report_eviction(tmp_path):
+    def rows():
+        for index, row in enumerate(_rows(30)):
+            if index == 15:
+                # 내보내기 도중 다른 보고서가 끝나 report_* 파일이 정리되는 경우
+                for path in glob.glob(str(tmp_path / "report_*")):
+                    os.remove(path)
+            yield row
+
+    path = StreamingPDFReport(rows_per_file=10).generate(rows(), str(tmp_path / "report_all.pdf"))
+
+    with zipfile.ZipFile(path) as archive:
+        assert len(archive.namelist()) == 3
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["report_all.zip"]
+
+
+def test_small_pdf_report_is_a_single_file(tmp_path):
+    path = StreamingPDFReport(rows_per_file=40).generate(_rows(40), str(tmp_path / "report.pdf"))
+
+    assert path == str(tmp_path / "report.pdf")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["report.pdf"]
+
+
+def test_csv_report_writes_every_row(tmp_path):
+    path = CSVReport().generate(_rows(25), str(tmp_path / "report.csv"))
+
+    with open(path, encoding="utf-8-sig", newline="") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == ["학과", "번호", "제목", "작성자", "조회수", "등록일"]
+    assert [row[1] for row in rows[1:]] == [str(n) for n in range(25, 0, -1)]
+
+
+@pytest.fixture
+def handler(tmp_path):
+    store = AnnouncementStore(str(tmp_path / "announcements.db"))
+    cache = AnnouncementCache()
+    handler = ReportHandler(cache=cache, reports_dir=str(tmp_path / "reports"), store=store)
+    yield handler
+    for executor in handler._executors.values():
+        executor.shutdown()
+    store.close()
+
+
+@pytest.mark.parametrize("format", ["excel", "pdf", "csv", "jsonl"])
+def test_department_report_streams_the_full_history_from_the_store(handler, format):
+    history = _announcements(60)
+    handler.store.save("computer", history)
+    # 캐시에는 최근 일부만 있어도 보고서는 저장소의 전체 이력으로 작성
+    handler.update_cache("computer", history[:10])
+
+    first = asyncio.run(handler.generate_report_async(format, "computer"))
+    second = asyncio.run(handler.generate_report_async(format, "computer"))
+
+    assert first.startswith("Report successfully generated: ")
+    assert first == second
+    if format == "csv":
+        with open(first.split(": ", 1)[1], encoding="utf-8-sig") as file:
+            assert len(file.readlines()) == 61
+
+
+def test_slow_report_does_not_block_other_reports(handler, monkeypatch):
+    release = threading.Event()
+    render = report_handler._render_export
+
+    def slow_render(format, departments, db_path, data, file_path):
+        if departments == ["slow"]:
+            release.wait(5)
+        return render(format, departments, db_path, data, file_path)
+
+    monkeypatch.setattr(report_handler, "_render_export", slow_render)
+    for department in ("slow", "fast"):
+        handler.store.save(department, _announcements(5))
+        handler.update_cache(department, _announcements(5))
+
+    async def scenario():
+        slow = asyncio.create_task(handler.generate_report_async("csv", "slow"))
+        await asyncio.sleep(0.05)
+        fast = await asyncio.wait_for(handler.generate_report_async("csv", "fast"), 2)
+        assert not slow.done()
+        release.set()
+        return fast, await slow
+
+    fast, slow = asyncio.run(scenario())
+    assert fast.startswith("Report successfully generated: ")
+    assert slow.startswith("Report successfully generated: ")
+
+
+def test_eviction_skips_reports_in_progress_and_vanished_files(handler, monkeypatch):
+    os.makedirs(handler.reports_dir)
+    for name in ("report_old_1.csv", "report_old_2.csv", "report_writing_ab12.csv"):
+        with open(os.path.join(handler.reports_dir, name), "w") as file:
+            file.write("x")
+    handler.max_reports = 0
+    handler._in_progress[("csv", "writing", "1")] = "report_writing_ab12"
+    listed = glob.glob
+    # 목록을 만든 뒤 다른 작업자가 지운 파일
+    monkeypatch.setattr(report_handler.glob, "glob",
+                        lambda pattern: listed(pattern) + [os.path.join(handler.reports_dir, "report_gone.csv")])
+
+    handler._evict_old_reports()
+
+    assert os.listdir(handler.reports_dir) == ["report_writing_ab12.csv"]
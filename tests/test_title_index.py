@@ -0,0 +1,58 @@
+from datetime import date
+from src.boards.announcement import Announcement
+from src.search.title_index import TitleIndex
+
+
+def _announcement(number, title):
+    return Announcement(number, title, "학과사무실", 0, date(2024, 3, 1))
+
+
+def _index():
+    index = TitleIndex()
+    index.update("computer", [
+        _announcement(3, "2024학년도 수강신청 안내"),
+        _announcement(2, "장학금 신청 기간"),
+        _announcement(1, "졸업 논문 제출"),
+    ])
+    index.update("electrical", [_announcement(7, "전기 장학 설명회")])
+    return index
+
+
+def _numbers(results):
+    return [announcement.number for _, announcement in results[0]]
+
+
+def test_bigram_queries_match_inside_words():
+    index = _index()
+
+    assert _numbers(index.search("신청")) == [3, 2]
+    assert _numbers(index.search("수강 신청")) == [3]
+    assert _numbers(index.search("장학", "electrical")) == [7]
+
+
+def test_single_syllable_query_matches_any_title_containing_it():
+    index = _index()
+
+    assert sorted(_numbers(index.search("학"))) == [2, 3, 7]
+    assert _numbers(index.search("학", "computer")) == [3, 2]
+    assert _numbers(index.search("논")) == [1]
+    assert index.search("없")[1] == 0
+
+
+def test_update_replaces_changed_titles_and_drops_removed_rows():
+    index = _index()
+    index.update("computer", [_announcement(3, "2024학년도 수강정정 안내"), _announcement(4, "학생회 선거")])
+
+    assert _numbers(index.search("신청", "computer")) == []
+    assert _numbers(index.search("정정")) == [3]
+    assert sorted(_numbers(index.search("학", "computer"))) == [3, 4]
+    assert len(index) == 3
+
+
+def test_remove_drops_a_department_and_its_single_character_postings():
+    index = _index()
+    index.remove("computer")
+
+    assert _numbers(index.search("학")) == [7]
+    assert index.search("논")[1] == 0
+    assert len(index) == 1